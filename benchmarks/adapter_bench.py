@@ -0,0 +1,48 @@
+"""
+Creating and reading through `aliasing.adapt` views compared to a
+hand-written proxy class.
+
+    python benchmarks/adapter_bench.py
+"""
+
+import timeit
+
+from aliasing import adapt, adapter_for
+
+
+class Record:
+    def __init__(self) -> None:
+        self.old_name = "value"
+
+
+class HandWrittenProxy:
+    __slots__ = ("_wrapped",)
+
+    def __init__(self, wrapped: Record) -> None:
+        self._wrapped = wrapped
+
+    @property
+    def new_name(self) -> str:
+        return self._wrapped.old_name
+
+
+def main(number: int = 1_000_000) -> None:
+    record = Record()
+    aliases = {"new_name": "old_name"}
+    adapter = adapter_for(Record, aliases)
+    proxy = HandWrittenProxy(record)
+    view = adapt(record, aliases)
+    cases = {
+        "proxy create": lambda: HandWrittenProxy(record),
+        "adapt create": lambda: adapt(record, aliases),
+        "adapter_for create": lambda: adapter(record),
+        "proxy read": lambda: proxy.new_name,
+        "adapt read": lambda: view.new_name,
+    }
+    for label, case in cases.items():
+        seconds = timeit.timeit(case, number=number)
+        print(f"{label:>20}: {seconds / number * 1e9:6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
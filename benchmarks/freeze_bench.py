@@ -0,0 +1,61 @@
+"""
+Cost of calling a method through its name and its aliases, before and after
+`freeze`, next to a plain method of a class without aliases.
+
+    python benchmarks/freeze_bench.py
+"""
+
+import timeit
+
+from aliasing import alias, aliased, freeze, valiases
+
+
+def _make_class() -> type:
+    class Example:
+        def __init__(self) -> None:
+            self.prop = 1
+
+        def plain(self) -> int:
+            return 1
+
+        @aliased
+        def method(self) -> int:
+            return 1
+
+        other = method.alias("other")
+
+        @valiases("virtual")
+        def target(self) -> int:
+            return 1
+
+        attr = alias("prop")
+
+    return Example
+
+
+def main(number: int = 500_000) -> None:
+    for frozen in (False, True):
+        cls = _make_class()
+        if frozen:
+            freeze(cls)
+        instance = cls()
+        label = "frozen" if frozen else "live"
+        for statement in (
+            "o.plain()",
+            "o.method()",
+            "o.other()",
+            "o.virtual()",
+            "o.prop",
+            "o.attr",
+        ):
+            seconds = timeit.timeit(
+                statement, globals={"o": instance}, number=number
+            )
+            print(
+                f"{label:>6} {statement:<12}"
+                f" {seconds / number * 1e9:6.0f} ns"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Reading an alias from every object of a large list, with a comprehension
+compared to `alias.gather` and `aliasing.gather`.
+
+    python benchmarks/gather_bench.py [sizes ...]
+"""
+
+import sys
+import time
+from array import array
+from typing import Any, Callable, List
+
+from aliasing import alias, gather
+
+
+class Row:
+    __slots__ = ("value", "label")
+
+    my_alias = alias("value")
+    my_label = alias("label")
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+        self.label = "row"
+
+
+def _time(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(sizes: List[int]) -> None:
+    my_alias = vars(Row)["my_alias"]
+    for size in sizes:
+        rows = [Row(i) for i in range(size)]
+        out = array("q", bytes(8 * size))
+        cases = {
+            "comprehension": lambda: [r.my_alias for r in rows],
+            "alias.gather": lambda: my_alias.gather(rows),
+            "alias.gather(array)": lambda: my_alias.gather(rows, out=out),
+            "comprehension x2": lambda: [
+                (r.my_alias, r.my_label) for r in rows
+            ],
+            "gather x2": lambda: gather(rows, "my_alias", "my_label"),
+        }
+        print(f"{size:,} objects")
+        for label, case in cases.items():
+            print(f"  {label:>20}: {_time(case) * 1e3:9.1f} ms")
+        del rows
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000_000, 10_000_000])
@@ -0,0 +1,42 @@
+"""
+Cost of reading a tuple item through a NamedTuple field, an index alias,
+a frozen index alias and a regular alias of the field.
+
+    python benchmarks/item_bench.py
+"""
+
+import timeit
+from typing import NamedTuple
+
+from aliasing import alias, freeze
+
+
+def _make_class(frozen: bool) -> type:
+    class Point(NamedTuple):
+        x: int
+        y: int
+
+        horizontal = alias(index=0)
+        field_alias = alias("x")
+
+    return freeze(Point) if frozen else Point
+
+
+def main(number: int = 1_000_000) -> None:
+    for frozen in (False, True):
+        point = _make_class(frozen)(1, 2)
+        label = "frozen" if frozen else "live"
+        for statement in ("p.x", "p.horizontal", "p.field_alias"):
+            seconds = min(
+                timeit.repeat(
+                    statement, globals={"p": point}, number=number, repeat=5
+                )
+            )
+            print(
+                f"{label:>6} {statement:<14}"
+                f" {seconds / number * 1e9:6.1f} ns"
+            )
+
+
+if __name__ == "__main__":
+    main()
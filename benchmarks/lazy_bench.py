@@ -0,0 +1,48 @@
+"""
+Class creation time and class dict size for classes with many virtual
+aliases, stored eagerly as descriptors or lazily in the lookup table.
+
+    python benchmarks/lazy_bench.py
+"""
+
+import timeit
+from typing import Any, Dict
+
+from aliasing import valiases
+
+
+def _make_class(methods: int, lazy: bool) -> type:
+    namespace: Dict[str, Any] = {}
+    for i in range(methods):
+        name = f"my_func_{i}"
+
+        def method(self: Any) -> str:
+            return "foo"
+
+        method.__name__ = name
+        namespace[name] = valiases(
+            f"MyFunc{i}", f"myFunc{i}", f"MY_FUNC_{i}", lazy=lazy
+        )(method)
+    return type("Generated", (), namespace)
+
+
+def main(methods: int = 300, number: int = 20) -> None:
+    for lazy in (False, True):
+        label = "lazy" if lazy else "eager"
+        seconds = timeit.timeit(
+            lambda: _make_class(methods, lazy), number=number
+        )
+        cls = _make_class(methods, lazy)
+        instance = cls()
+        first = timeit.timeit(lambda: instance.myFunc0, number=1)
+        warm = timeit.timeit(lambda: instance.myFunc0, number=100_000)
+        print(
+            f"{label:>6}: {seconds / number * 1e3:7.2f} ms to create,"
+            f" {len(vars(cls)):>5} class dict entries,"
+            f" first hit {first * 1e6:6.1f} us,"
+            f" then {warm / 100_000 * 1e9:6.0f} ns per access"
+        )
+
+
+if __name__ == "__main__":
+    main()
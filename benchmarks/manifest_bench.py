@@ -0,0 +1,72 @@
+"""
+Time to apply an alias manifest with thousands of entries, validating it
+on every start versus reading the cached validated table, next to the
+equivalent `alias.attach` calls.
+
+    python benchmarks/manifest_bench.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import timeit
+
+from aliasing import alias, apply_manifest
+
+MODULE = "manifest_bench_module"
+
+
+def _write_files(directory: str, methods: int) -> str:
+    lines = ["class Target:"]
+    lines += [f"    def method_{i}(self): return {i}" for i in range(methods)]
+    with open(os.path.join(directory, f"{MODULE}.py"), "w") as file:
+        file.write("\n".join(lines) + "\n")
+    aliases = {}
+    for i in range(methods):
+        aliases[f"methodAlias{i}"] = f"method_{i}"
+        aliases[f"old_method_{i}"] = {"for": f"method_{i}", "until": "9"}
+    path = os.path.join(directory, "aliases.json")
+    with open(path, "w") as file:
+        json.dump({"classes": {f"{MODULE}:Target": aliases}}, file)
+    return path
+
+
+def _fresh_class() -> type:
+    # aliases were applied to the previous import
+    sys.modules.pop(MODULE, None)
+    return __import__(MODULE).Target  # type: ignore[no-any-return]
+
+
+def _attach(methods: int) -> None:
+    cls = _fresh_class()
+    for i in range(methods):
+        alias(f"method_{i}").attach(cls, f"methodAlias{i}")
+        alias(f"method_{i}", until="9").attach(cls, f"old_method_{i}")
+
+
+def main(methods: int = 2000, number: int = 10) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        path = _write_files(directory, methods)
+        runs = {
+            "import only": _fresh_class,
+            "attach calls": lambda: _attach(methods),
+            "validate": lambda: (
+                _fresh_class(),
+                apply_manifest(path, cache_path=None),
+            ),
+            "cached": lambda: (_fresh_class(), apply_manifest(path)),
+        }
+        apply_manifest(path)
+        for label, run in runs.items():
+            seconds = min(timeit.repeat(run, number=1, repeat=number))
+            print(
+                f"{label:>12}: {seconds * 1e3:7.2f} ms for"
+                f" {methods * 2} aliases"
+            )
+        sys.path.remove(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Cost of a cache hit for a memoized method, through its name and an alias,
+with `aliased(cache=...)` and with `functools.lru_cache` under `@aliased`.
+
+    python benchmarks/memo_bench.py
+"""
+
+import timeit
+from functools import lru_cache
+
+from aliasing import aliased
+
+
+class Stacked:
+    @aliased
+    @lru_cache(maxsize=128)
+    def method(self, x: int) -> int:
+        return x * x
+
+    other = method.alias("other")
+
+
+class Memoized:
+    @aliased(cache=128)
+    def method(self, x: int) -> int:
+        return x * x
+
+    other = method.alias("other")
+
+
+def main(number: int = 500_000) -> None:
+    for cls in (Stacked, Memoized):
+        instance = cls()
+        instance.method(3)
+        for name in ("method", "other"):
+            seconds = timeit.timeit(
+                f"instance.{name}(3)",
+                globals={"instance": instance},
+                number=number,
+            )
+            print(
+                f"{cls.__name__:>9}.{name:<6}"
+                f" {seconds / number * 1e9:6.0f} ns per hit"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Round-trip size and time of pickling an instance with attached aliases
+compared to a plain instance of the same class.
+
+    python benchmarks/pickle_bench.py
+"""
+
+import pickle
+import timeit
+
+from aliasing import alias
+
+
+class Record:
+    def __init__(self) -> None:
+        self.prop = "value"
+        self.other = list(range(10))
+
+
+def _round_trip(instance: Record) -> Record:
+    return pickle.loads(pickle.dumps(instance))
+
+
+def main(number: int = 100_000) -> None:
+    plain = Record()
+    attached = Record()
+    for i in range(5):
+        alias("prop", f"alias{i}").attach(attached)
+
+    for label, instance in (("plain", plain), ("attached", attached)):
+        size = len(pickle.dumps(instance))
+        seconds = timeit.timeit(lambda: _round_trip(instance), number=number)
+        print(
+            f"{label:>10}: {size:>5} bytes,"
+            f" {seconds / number * 1e6:.2f} us per round trip"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Serializing objects to dicts under their alias names with a precompiled
+plan, next to reflecting on each object through `vars()` or `dir()`.
+
+    python benchmarks/serialize_bench.py
+"""
+
+import timeit
+from typing import Any, Dict, List
+
+from aliasing import alias, serialization_plan
+from aliasing.core import _alias_base
+
+
+class Record:
+    record_id = alias("id")
+    display_name = alias("name")
+    mail = alias("email")
+
+    def __init__(self, i: int) -> None:
+        self.id = i
+        self.name = f"name {i}"
+        self.email = f"{i}@example.com"
+        self.active = True
+
+
+def with_vars(obj: Any) -> Dict[str, Any]:
+    # alias names looked up per object, by scanning the class dict
+    renames = {
+        member._for: name
+        for name, member in vars(type(obj)).items()
+        if isinstance(member, _alias_base)
+    }
+    return {renames.get(key, key): value for key, value in vars(obj).items()}
+
+
+def with_dir(obj: Any) -> Dict[str, Any]:
+    cls = type(obj)
+    result = {}
+    aliased = set()
+    for name in dir(obj):
+        member = getattr(cls, name, None)
+        if isinstance(member, _alias_base):
+            result[name] = getattr(obj, name)
+            aliased.add(member._for)
+    for name in dir(obj):
+        if name.startswith("_") or name in result or name in aliased:
+            continue
+        value = getattr(obj, name)
+        if not callable(value):
+            result[name] = value
+    return result
+
+
+def main(count: int = 1000, number: int = 20) -> None:
+    records = [Record(i) for i in range(count)]
+    plan = serialization_plan(
+        Record, "alias", fields=["id", "name", "email", "active"]
+    )
+    assert plan.to_dicts(records)[0] == with_vars(records[0])
+    assert plan.to_dicts(records)[0] == with_dir(records[0])
+
+    runs: Dict[str, Any] = {
+        "dir()": lambda: [with_dir(r) for r in records],
+        "vars()": lambda: [with_vars(r) for r in records],
+        "plan.to_dict": lambda: [plan.to_dict(r) for r in records],
+        "plan.to_dicts": lambda: plan.to_dicts(records),
+    }
+    for label, run in runs.items():
+        seconds = min(timeit.repeat(run, number=number, repeat=3)) / number
+        result: List[Dict[str, Any]] = run()
+        assert len(result) == count
+        print(f"{label:>14}: {seconds / count * 1e9:8.0f} ns per object")
+
+
+if __name__ == "__main__":
+    main()
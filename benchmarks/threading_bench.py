@@ -0,0 +1,74 @@
+"""
+Alias read throughput with an increasing number of threads.
+
+On a free-threaded build (python3.13t with PYTHON_GIL=0) the reads never
+take a lock, so throughput should scale with the number of cores. With the
+GIL it stays flat.
+
+    python benchmarks/threading_bench.py
+"""
+
+import os
+import sys
+import threading
+import time
+
+from aliasing import alias, aliased
+
+
+class Record:
+    my_alias = alias("prop")
+
+    def __init__(self) -> None:
+        self.prop = "value"
+
+    @aliased
+    def method(self) -> str:
+        return self.prop
+
+    method_alias = method.alias()
+
+
+def _reads(instance: Record, count: int) -> None:
+    for _ in range(count):
+        instance.my_alias
+        instance.method_alias
+
+
+def _throughput(threads: int, count: int) -> float:
+    # one instance per thread, but the descriptors are shared by all of them
+    instances = [Record() for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def run(instance: Record) -> None:
+        barrier.wait()
+        _reads(instance, count)
+
+    workers = [
+        threading.Thread(target=run, args=(instance,))
+        for instance in instances
+    ]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * count * 2 / (time.perf_counter() - start)
+
+
+def main(count: int = 200_000) -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil}")
+    baseline = 0.0
+    for threads in range(1, (os.cpu_count() or 1) + 1):
+        reads = _throughput(threads, count)
+        baseline = baseline or reads
+        print(
+            f"{threads:>3} threads: {reads / 1e6:8.2f}M reads/s"
+            f" ({reads / baseline:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
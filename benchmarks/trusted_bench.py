@@ -0,0 +1,86 @@
+"""
+Time to import a module defining thousands of aliases, with the usual
+definition-time checks versus in trusted mode, and the cost of reading an
+alias and an alias of an alias in either mode.
+
+    python benchmarks/trusted_bench.py
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+from aliasing import set_trusted
+
+MODULE = "trusted_bench_module"
+
+
+def _source(classes: int, per_class: int) -> str:
+    lines = ["from aliasing import alias, aliased, valiases", ""]
+    for c in range(classes):
+        lines += [
+            f"class Class{c}:",
+            "    def __init__(self):",
+            "        self.value = 1",
+            "",
+            "    @aliased",
+            "    def method(self):",
+            '        """does things"""',
+        ]
+        lines += [
+            f"    method_{i} = method.alias('method_{i}')"
+            for i in range(per_class)
+        ]
+        lines += [f"    value_{i} = alias('value')" for i in range(per_class)]
+        lines += ["    chained = alias('value_0')"]
+        names = ", ".join(f"'virtual_{i}'" for i in range(per_class))
+        lines += [
+            f"    @valiases({names})",
+            "    def virtual(self):",
+            "        pass",
+            "",
+            f"for i in range({per_class}):",
+            f"    alias('value').attach(Class{c}, f'attached_{{i}}')",
+            "",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _import() -> None:
+    sys.modules.pop(MODULE, None)
+    __import__(MODULE)
+
+
+def main(classes: int = 50, per_class: int = 100, number: int = 5) -> None:
+    aliases = classes * per_class * 4
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, f"{MODULE}.py"), "w") as file:
+            file.write(_source(classes, per_class))
+        sys.path.insert(0, directory)
+        # compile it once, so each run only executes the module
+        _import()
+        for trusted in (False, True):
+            set_trusted(trusted)
+            seconds = min(timeit.repeat(_import, number=number, repeat=3))
+            print(
+                f"trusted={trusted!s:>5}: {seconds / number * 1e3:6.1f} ms"
+                f" to import {aliases} aliases"
+            )
+
+        obj = sys.modules[MODULE].Class0()
+        for trusted in (False, True):
+            set_trusted(trusted)
+            for stmt in ("obj.value", "obj.value_0", "obj.chained"):
+                seconds = min(
+                    timeit.repeat(stmt, globals=locals(), number=100000)
+                )
+                print(
+                    f"trusted={trusted!s:>5}: {stmt:>13}"
+                    f" {seconds / 100000 * 1e9:6.0f} ns"
+                )
+        set_trusted(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Class creation time, class dict size and dir() size for a class keeping
+old names of its methods through version-gated aliases, with every alias
+installed and with only those of the current api version.
+
+    python benchmarks/versions_bench.py
+"""
+
+import timeit
+from typing import Any, Dict
+
+from aliasing import set_api_version, valiases
+
+
+def _make_class(methods: int) -> type:
+    namespace: Dict[str, Any] = {}
+    for i in range(methods):
+        name = f"my_func_{i}"
+
+        def method(self: Any) -> str:
+            return "foo"
+
+        method.__name__ = name
+        namespace[name] = valiases(f"myFunc{i}", f"MyFunc{i}", until="2.0")(
+            method
+        )
+    return type("Generated", (), namespace)
+
+
+def main(methods: int = 300, number: int = 20) -> None:
+    for version in (None, "2.0"):
+        set_api_version(version)
+        seconds = timeit.timeit(lambda: _make_class(methods), number=number)
+        cls = _make_class(methods)
+        print(
+            f"api version {str(version):>4}:"
+            f" {seconds / number * 1e3:6.2f} ms to create,"
+            f" {len(vars(cls)):>5} class dict entries,"
+            f" {len(dir(cls())):>5} names in dir()"
+        )
+    set_api_version(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,20 @@
-from .core import alias, aliased
+from .core import alias, aliased, cached_alias, item_alias
 from .virtual_alias import valiased, valiases
+from .conventions import conventions
+from .prefix import abbreviations, resolve_prefix
+from .import_alias import import_alias, import_aliases
+from .gather import gather
+from .override import override_aliases
+from .adapter import adapt, adapter_for
+from .freeze import alias_index, freeze
+from .versions import api_version, set_api_version
+from .trust import is_trusted, set_trusted
+from .manifest import apply_manifest
+from .serialize import serialization_plan, serialize, serialize_many
+from .profiler import format_profile, profile
 from .error import (
     AliasError,
+    AmbiguousAliasError,
     CircularAliasError,
     TrampleAliasError,
     TrampleAliasWarning,
@@ -10,9 +23,33 @@ from .error import (
 __all__ = [
     "alias",
     "aliased",
+    "cached_alias",
+    "item_alias",
     "valiased",
     "valiases",
+    "conventions",
+    "abbreviations",
+    "resolve_prefix",
+    "import_alias",
+    "import_aliases",
+    "gather",
+    "override_aliases",
+    "adapt",
+    "adapter_for",
+    "alias_index",
+    "freeze",
+    "api_version",
+    "set_api_version",
+    "is_trusted",
+    "set_trusted",
+    "apply_manifest",
+    "serialization_plan",
+    "serialize",
+    "serialize_many",
+    "profile",
+    "format_profile",
     "AliasError",
+    "AmbiguousAliasError",
     "CircularAliasError",
     "TrampleAliasError",
     "TrampleAliasWarning",
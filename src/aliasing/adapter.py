@@ -0,0 +1,82 @@
+from operator import attrgetter
+from typing import Any, Dict, List, Mapping, Tuple, Type
+from weakref import WeakKeyDictionary
+
+from .core import _attach_lock
+
+# type -> alias mapping -> adapter class, kept as long as the type lives
+_adapters: "WeakKeyDictionary[Type[Any], Dict[Tuple[Any, ...], Type[Any]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _init(self: Any, wrapped: Any) -> None:
+    self.__wrapped__ = wrapped
+
+
+def _forward(self: Any, name: str) -> Any:
+    # only called for names that aren't aliases of the adapter
+    if name == "__wrapped__":
+        raise AttributeError(name)
+    return getattr(self.__wrapped__, name)
+
+
+def _dir(self: Any) -> List[str]:
+    return sorted(set(dir(self.__wrapped__)) | set(vars(type(self))))
+
+
+def _repr(self: Any) -> str:
+    return f"<{type(self).__name__} of {self.__wrapped__!r}>"
+
+
+def _build_adapter(
+    cls: Type[Any], aliases: Tuple[Tuple[str, str], ...]
+) -> Type[Any]:
+    namespace: Dict[str, Any] = {
+        "__slots__": ("__wrapped__",),
+        "__init__": _init,
+        "__getattr__": _forward,
+        "__dir__": _dir,
+        "__repr__": _repr,
+        "__doc__": f"adapter of {cls.__name__} with aliases {dict(aliases)}",
+    }
+    for name, target in aliases:
+        if name == "__wrapped__":
+            raise ValueError("cannot alias __wrapped__ in an adapter")
+        # a property of an attrgetter reads the value without running any
+        # python code, through whatever `target` is on the wrapped object
+        namespace[name] = property(
+            attrgetter(f"__wrapped__.{target}"), doc=f"Alias for {target}"
+        )
+    return type(f"{cls.__name__}Adapter", (), namespace)
+
+
+def adapter_for(cls: Type[Any], aliases: Mapping[str, str]) -> Type[Any]:
+    """
+    the adapter class `adapt` uses for instances of `cls`, built once per
+    `cls` and `aliases`. Calling it with an instance creates the view
+    """
+    key = tuple(aliases.items())
+    per_type = _adapters.get(cls)
+    adapter = per_type.get(key) if per_type is not None else None
+    if adapter is None:
+        with _attach_lock:
+            per_type = _adapters.setdefault(cls, {})
+            adapter = per_type.get(key)
+            if adapter is None:
+                adapter = per_type[key] = _build_adapter(cls, key)
+    return adapter
+
+
+def adapt(obj: Any, aliases: Mapping[str, str]) -> Any:
+    """
+    Usage:
+        view = adapt(obj, {"new_name": "old_name"})
+        assert view.new_name is obj.old_name
+
+    a read-only view of `obj` under different names, without copying or
+    modifying it or its class, so it also works for objects of C
+    extension types. Any name that isn't one of the aliases is looked up on
+    `obj` as is
+    """
+    return adapter_for(type(obj), aliases)(obj)
@@ -0,0 +1,92 @@
+import re
+from typing import Any, Callable, Dict, List, Type, TypeVar
+
+from .core import _alias_base
+from .error import TrampleAliasError
+from .freeze import alias_index
+from .lazy_alias import add_lazy, lazy_names
+
+T = TypeVar("T", bound=Type[Any])
+
+_WORD = re.compile(r"[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])")
+
+CONVENTIONS: Dict[str, Callable[[List[str]], str]] = {
+    "snake": lambda words: "_".join(w.lower() for w in words),
+    "camel": lambda words: "".join(
+        [words[0].lower()] + [w.capitalize() for w in words[1:]]
+    ),
+    "pascal": lambda words: "".join(w.capitalize() for w in words),
+    "screaming_snake": lambda words: "_".join(w.upper() for w in words),
+    # not reachable with a `.` but CLI frameworks use getattr
+    "kebab": lambda words: "-".join(w.lower() for w in words),
+}
+
+
+def split_words(name: str) -> List[str]:
+    return _WORD.findall(name)
+
+
+def _is_alias_for(cls: Type[Any], variant: str, name: str) -> bool:
+    return alias_index(cls).get(variant) == name
+
+
+class conventions:
+    """
+    Usage:
+        @conventions("camel", "pascal")
+        class Example:
+            def my_func(self): ...
+        ...
+        assert Example().myFunc() == Example().MyFunc()
+
+    class decorator that makes every public member of the class reachable
+    under its name in each of the given naming conventions.
+
+    the names are computed once, when the class is decorated, into the
+    class's lazy alias table, see `valiases(..., lazy=True)`. No descriptor
+    is created for them: a lookup that misses goes through the one
+    `__getattr__` hook of lazy aliases, which finds the name in the table
+    with a dict lookup and only then binds an alias for it
+    """
+
+    def __init__(self, *styles: str):
+        unknown = [style for style in styles if style not in CONVENTIONS]
+        if unknown:
+            raise ValueError(
+                f"unknown naming conventions {unknown}, expected any of"
+                f" {list(CONVENTIONS)}"
+            )
+        self._styles = [CONVENTIONS[style] for style in styles]
+
+    def index(self, cls: Type[Any]) -> Dict[str, str]:
+        """the convention name -> member name index for `cls`"""
+        index: Dict[str, str] = {}
+        for name, member in vars(cls).items():
+            if name.startswith("_") or isinstance(member, _alias_base):
+                continue
+            words = split_words(name)
+            if not words:
+                continue
+            for style in self._styles:
+                variant = style(words)
+                if variant == name or _is_alias_for(cls, variant, name):
+                    continue
+                if variant in index and index[variant] != name:
+                    raise TrampleAliasError(
+                        f"Owner class {cls.__name__} members"
+                        f" {index[variant]} and {name} both have the"
+                        f" conventional name {variant}."
+                    )
+                if variant in lazy_names(cls) or hasattr(cls, variant):
+                    raise TrampleAliasError(
+                        f"Owner class {cls.__name__} already has member with"
+                        f" name {variant}. Cannot use it as the conventional"
+                        f" name for {name}."
+                    )
+                index[variant] = name
+        return index
+
+    def __call__(self, cls: T) -> T:
+        index = self.index(cls)
+        add_lazy(cls, index)
+        return cls
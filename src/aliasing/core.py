@@ -1,17 +1,43 @@
-from functools import wraps
-from typing import Optional, List, Any, cast, Type
+from abc import ABCMeta
+from array import array
+from contextvars import ContextVar
+from functools import lru_cache, partial, wraps
+from itertools import islice
+from operator import attrgetter, itemgetter
+from threading import RLock
+from typing import (
+    Optional,
+    List,
+    Any,
+    cast,
+    Type,
+    Tuple,
+    Dict,
+    Callable,
+    Iterable,
+    Union,
+)
 from warnings import warn
+from weakref import WeakKeyDictionary, WeakValueDictionary, ref
 
 from .error import CircularAliasError, TrampleAliasError, TrampleAliasWarning
+from .versions import Version, is_active, parse_version
 
 
-class alias:
+class _alias_base:
+    # everything `alias` and `cached_alias` share, which is all of `alias`
+    # except `__set__`: defining it makes a data descriptor, and those take
+    # precedence over the instance dict that `cached_alias` snapshots into
+
     def __init__(
         self,
         alias_for: str,
         alias_name: Optional[str] = None,
         *,
         trample_ok: bool = False,
+        cache: bool = False,
+        since: Optional[Version] = None,
+        until: Optional[Version] = None,
         _aliased: Optional["aliased"] = None,
     ):
         self._for = alias_for
@@ -21,48 +47,168 @@ class alias:
         self.__doc__ = f"Alias for {self._for}"
         self._aliased = _aliased
         self._trample_ok = trample_ok
+        # the api versions that added and removed this alias, see versions.py
+        self._since = None if since is None else parse_version(since)
+        self._until = None if until is None else parse_version(until)
 
     def __set_name__(self, owner: Any, name: str) -> None:
+        if not is_active(self._since, self._until, owner):
+            # declared in the class body for another api version
+            if vars(owner).get(name) is self:
+                delattr(owner, name)
+            if self._aliased is not None and self in self._aliased._aliases:
+                self._aliased._aliases.remove(self)
+                self._aliased._refresh_docs()
+            return
         self._name = name
+        if self._aliased is not None and not _trusted:
+            # keep the "(aliases ...)" docstring current here instead of
+            # rebuilding it on every read of the aliased member
+            self._aliased._refresh_docs()
+
+    def _name_in(self, owner_type: Any) -> Optional[str]:
+        # one alias object can be attached to several classes under different
+        # names, so look the name up instead of trusting the last
+        # __set_name__, which another thread may have overwritten meanwhile
+        name = self._name
+        if (
+            name is not None
+            and isinstance(owner_type, type)
+            and _static_member(owner_type, name) is self
+        ):
+            return name
+        for base in getattr(owner_type, "__mro__", ()):
+            for name, member in vars(base).items():
+                if member is self:
+                    return cast(str, name)
+        return self._name
+
+    def _signature(self) -> Tuple[Any, ...]:
+        # picklable description of this alias, used to rebuild an
+        # equivalent alias on the receiving side of pickle/deepcopy
+        return (type(self), (self._for,), self._version_kwargs())
+
+    def _version_kwargs(self) -> Tuple[Tuple[str, Any], ...]:
+        return tuple(
+            (key, value)
+            for key, value in (("since", self._since), ("until", self._until))
+            if value is not None
+        )
+
+    @staticmethod
+    def _from_signature(signature: Tuple[Any, ...]) -> "_alias_base":
+        alias_type, args, kwargs = signature
+        return cast(_alias_base, alias_type(*args, **dict(kwargs)))
 
     @staticmethod
     def _get_alias_obj(
         owner: Any, owner_type: Any, name: str
-    ) -> Optional["alias"]:
+    ) -> Optional["_alias_base"]:
         if (
             owner
             and hasattr(owner, "__dict__")
-            and isinstance(owner.__dict__.get(name, None), alias)
+            and isinstance(owner.__dict__.get(name, None), _alias_base)
         ):
-            return cast(alias, owner.__dict__[name])
+            return cast(_alias_base, owner.__dict__[name])
         elif (
             owner_type
             and hasattr(owner_type, "__dict__")
-            and isinstance(owner_type.__dict__.get(name, None), alias)
+            and isinstance(owner_type.__dict__.get(name, None), _alias_base)
         ):
-            return cast(alias, owner_type.__dict__[name])
+            return cast(_alias_base, owner_type.__dict__[name])
         return None
 
-    def _validate_nested(self, owner: Any, owner_type: Any) -> Any:
+    def _for_in(
+        self, overrides: Optional[Dict[str, str]], owner_type: Any
+    ) -> str:
+        # the target, unless `override_aliases` remapped this alias's name
+        # on `owner_type`
+        if overrides is None:
+            return self._for
+        return overrides.get(cast(str, self._name_in(owner_type)), self._for)
+
+    def _target(self, owner_type: Any) -> Union[str, Callable[[Any], Any]]:
+        # name of the attribute at the end of this alias's chain on
+        # `owner_type`, or a getter when an alias in it isn't a plain
+        # attribute lookup, so bulk reads can skip the descriptors between
+        overrides = _overrides.get()
+        seen = {id(self)}
+        name = self._for_in(overrides, owner_type)
+        member = _static_member(owner_type, name)
+        while isinstance(member, _alias_base):
+            if id(member) in seen:
+                raise CircularAliasError(
+                    f"Nested alias {self._name_in(owner_type)}"
+                    " references a circular alias"
+                )
+            seen.add(id(member))
+            if type(member)._target is not _alias_base._target:
+                return member._target(owner_type)
+            name = member._for_in(overrides, owner_type)
+            member = _static_member(owner_type, name)
+        return name
+
+    def gather(self, objects: Iterable[Any], out: Optional[Any] = None) -> Any:
+        """
+        the value of this alias for each of `objects`, like
+        `[o.<alias> for o in objects]` but resolving the alias once per
+        type and reading the values in a C level loop.
+
+        fills `out` instead of a new list when given, which may be a list
+        or an `array.array`. Its items are overwritten in place a chunk at a
+        time, so no copy of all the values is made, and it is only grown or
+        truncated when it doesn't have one item per object
+        """
+        if not isinstance(objects, (list, tuple)):
+            objects = list(objects)
+        values = _map_per_type(lambda cls: _getter(self._target(cls)), objects)
+        if out is None:
+            return list(values)
+        size = len(objects)
+        if len(out) > size:
+            del out[size:]
+        chunk = (
+            partial(array, out.typecode) if isinstance(out, array) else list
+        )
+        filled = len(out)
+        for start in range(0, filled, _GATHER_CHUNK):
+            stop = min(start + _GATHER_CHUNK, filled)
+            out[start:stop] = chunk(islice(values, stop - start))
+        out.extend(values)
+        return out
+
+    def _validate_nested(
+        self,
+        owner: Any,
+        owner_type: Any,
+        overrides: Optional[Dict[str, str]] = None,
+    ) -> Any:
         # basic 2 ptrs
-        p1: Any = self._get_alias_obj(owner, owner_type, self._for)
+        p1: Any = self._get_alias_obj(
+            owner, owner_type, self._for_in(overrides, owner_type)
+        )
         p2 = self
 
         move_p2 = True
-        while isinstance(p1, alias):
+        while isinstance(p1, _alias_base):
             if p1 is p2:
                 raise CircularAliasError(
-                    f"Nested alias {self._name} references a circular alias"
+                    f"Nested alias {self._name_in(owner_type)}"
+                    " references a circular alias"
                 )
-            p1 = self._get_alias_obj(owner, owner_type, p1._for)
+            p1 = self._get_alias_obj(
+                owner, owner_type, p1._for_in(overrides, owner_type)
+            )
             # p2 moves slower so p1 always resolves to first, if either do
             # meaning p2 always has type alias here
             p2 = cast(
-                alias,
+                _alias_base,
                 (
                     p2
                     if not move_p2
-                    else self._get_alias_obj(owner, owner_type, p2._for)
+                    else self._get_alias_obj(
+                        owner, owner_type, p2._for_in(overrides, owner_type)
+                    )
                 ),
             )
             move_p2 = not move_p2
@@ -70,13 +216,31 @@ class alias:
 
     def __get__(self, owner: Any, owner_type: Optional[Any] = None) -> Any:
         value = None
+        target = self._for
+        # the only cost of overrides while none are active
+        overrides = _overrides.get()
+        if overrides is not None:
+            target = self._for_in(
+                overrides, type(owner) if owner_type is None else owner_type
+            )
+        if _trusted:
+            # no cycle to look for up front, a cycle only shows as the reads
+            # recursing, and checking then raises what the check up front
+            # would have, the outermost alias raising last
+            try:
+                if owner is None:
+                    return getattr(owner_type, target, self)
+                return getattr(owner, target)
+            except (RecursionError, CircularAliasError):
+                self._validate_nested(owner_type, owner_type, overrides)
+                raise
         if isinstance(
-            self._get_alias_obj(owner, owner_type, self._for), alias
+            self._get_alias_obj(owner, owner_type, target), _alias_base
         ):
             # this only works for objects defining __dict__,
             # if they have __slots__ we need getattr,
             # hence checking value for truthiness after this
-            value = self._validate_nested(owner_type, owner_type)
+            value = self._validate_nested(owner_type, owner_type, overrides)
 
         if value:
             # so we don't have to repeat ourselves in the elif/else's
@@ -84,47 +248,63 @@ class alias:
         elif owner is None:
             # this happens when called from class level
             try:
-                value = getattr(owner_type, self._for)
+                value = getattr(owner_type, target)
             except AttributeError:
                 value = self
         else:
             # just return the aliased attribute
-            value = getattr(owner, self._for)
+            value = getattr(owner, target)
 
         return value
 
-    def __set__(self, owner: Any, value: Any) -> None:
-        raise NotImplementedError(
-            f"cannot set the value of read-only alias {self._name}"
+    def _trample_message(
+        self, cls: Type[Any], name: str, *, trample_ok: Optional[bool] = None
+    ) -> Optional[str]:
+        if (
+            _static_member(cls, name) is None
+            and not _is_lazy(cls, name)
+            and not hasattr(cls, name)
+        ):
+            return None
+        message = (
+            f"Owner class {cls.__name__}"
+            f" already has member with name {name}."
         )
+        if trample_ok:
+            message += (
+                f" Overriding with alias for {self._for}. Pass"
+                " `trample_ok=False` to disallow this behavior."
+            )
+        else:
+            message += (
+                f" Cannot override it with alias for {self._for} by"
+                " default, pass `trample_ok=True` to override the member"
+                " anyway."
+            )
+        return message
 
     def __attach_class(
         self, cls: Type[Any], name: str, *, trample_ok: Optional[bool] = None
     ):
-        if hasattr(cls, name):
-            message = (
-                f"Owner class {cls.__name__}"
-                f" already has member with name {name}."
-            )
-            if trample_ok:
-                message += (
-                    f" Overriding with alias for {self._for}. Pass"
-                    " `trample_ok=False` to disallow this behavior."
-                )
+        if not _trusted:
+            message = self._trample_message(cls, name, trample_ok=trample_ok)
+            if message and trample_ok:
                 warn(message, TrampleAliasWarning)
-            else:
-                message += (
-                    f" Cannot override it with alias for {self._for} by"
-                    " default, pass `trample_ok=True` to override the member"
-                    " anyway."
-                )
+            elif message:
                 raise TrampleAliasError(message)
+        self._bind(cls, name)
+        _aliases_changed(cls)
+
+    def _bind(self, cls: Type[Any], name: str) -> None:
         setattr(cls, name, self)
         # needs to happen after setattr as that's when it happens in the
         # typical descriptor workflow. In this class's current implementation,
         # the statement has no effect, but in the future it might have one
         # or consumer child classes might add functionality to __set_name__
         self.__set_name__(cls, name)
+        # a lazy alias trampled on is gone
+        vars(cls).get(_LAZY_TABLE_KEY, {}).pop(name, None)
+        _bind_lazy_below(cls, name)
 
     def __attach_instance(
         self, instance: Any, name: str, *, trample_ok: Optional[bool] = None
@@ -134,8 +314,8 @@ class alias:
         # hash and compare so we minimize the number of classes created here
         instance_hash = hash(instance)
         class_hash = hash(cls)
-        instance_hash_key = "_aliasing_instance_hash"
-        class_hash_key = "_aliasing_class_hash"
+        instance_hash_key = _INSTANCE_HASH_KEY
+        class_hash_key = _CLASS_HASH_KEY
         if hasattr(cls, class_hash_key):
             class_hash = hash(cls.__base__)
 
@@ -152,6 +332,9 @@ class alias:
                 {
                     instance_hash_key: instance_hash,
                     class_hash_key: class_hash,
+                    # the dynamic class is not importable, so instances
+                    # pickle as (original class, alias signature, state)
+                    "__reduce_ex__": _reduce_attached,
                 },
             )
             tmp_class.__doc__ = (
@@ -186,23 +369,424 @@ class alias:
             raise RuntimeError("must provide name to attach alias")
 
         trample_ok = trample_ok if trample_ok is not None else self._trample_ok
-        if type(owner) is not type:
-            # we have to attach the descriptor to the class, not the instance
-            # this way we support both
-            self.__attach_instance(owner, name, trample_ok=trample_ok)
-        else:
-            self.__attach_class(owner, name, trample_ok=trample_ok)
+        if not is_active(self._since, self._until, owner):
+            return
+        # the trample check, the class swap for instances and setattr must
+        # happen as one step or concurrent attaches can lose each other's
+        # aliases, especially without the GIL
+        with _attach_lock:
+            if type(owner) is not type:
+                # we have to attach the descriptor to the class, not the
+                # instance this way we support both
+                self.__attach_instance(owner, name, trample_ok=trample_ok)
+            else:
+                self.__attach_class(owner, name, trample_ok=trample_ok)
+
+
+_NO_ITEM: Any = object()
+
+# items `gather` writes into `out` at once
+_GATHER_CHUNK = 1024
+
+
+class alias(_alias_base, metaclass=ABCMeta):
+    # the variants `alias(...)` returns can't subclass it, they must not
+    # inherit __set__, so they are registered as virtual subclasses instead
+
+    def __new__(
+        cls,
+        *args: Any,
+        cache: bool = False,
+        index: Any = _NO_ITEM,
+        key: Any = _NO_ITEM,
+        **kwargs: Any,
+    ) -> Any:
+        if index is not _NO_ITEM or key is not _NO_ITEM:
+            return item_alias(*args, index=index, key=key, **kwargs)
+        if cache and cls is alias:
+            # snapshotting needs a non-data descriptor, see `_alias_base`
+            instance = _alias_base.__new__(cached_alias)
+            cached_alias.__init__(instance, *args, **kwargs)
+            return instance
+        return super().__new__(cls)
+
+    def __set__(self, owner: Any, value: Any) -> None:
+        raise NotImplementedError(
+            "cannot set the value of read-only alias"
+            f" {self._name_in(type(owner))}"
+        )
+
+
+class cached_alias(_alias_base):
+    """
+    alias that snapshots the resolved value into the instance dict on the
+    first read, so later reads are plain attribute lookups.
+
+    returned by `alias(..., cache=True)`. The snapshot is never refreshed,
+    `del instance.<name>` drops it so the next read resolves it again.
+    """
+
+    def __get__(self, owner: Any, owner_type: Optional[Any] = None) -> Any:
+        value = super().__get__(owner, owner_type)
+        if owner is None:
+            return value
+        cls = owner_type or type(owner)
+        name = self._name_in(cls)
+        overrides = _overrides.get()
+        # a value read through an override mustn't outlive its context
+        if not (overrides and name in overrides):
+            try:
+                vars(owner)[name] = value
+            except TypeError:
+                # no instance dict, e.g. __slots__ classes
+                pass
+        return value
+
+    def _target(self, owner_type: Any) -> Callable[[Any], Any]:
+        # the snapshot in the instance dict comes first, which only reading
+        # through this descriptor gets right
+        return attrgetter(cast(str, self._name_in(owner_type)))
+
+    def _signature(self) -> Tuple[Any, ...]:
+        return (
+            alias,
+            (self._for,),
+            (("cache", True),) + self._version_kwargs(),
+        )
+
+
+class item_alias(property, _alias_base):  # type: ignore[misc]
+    """
+    Usage:
+        class Point(tuple):
+            x = alias(index=0)
+
+        class Record(dict):
+            ident = alias(key="id")
+
+    alias for an item of the owner instead of an attribute, returned by
+    `alias(index=...)` and `alias(key=...)`. Reads go straight to a
+    `property` of an `operator.itemgetter`, and a missing item raises
+    AttributeError like a missing attribute would, so `hasattr` and
+    `getattr(..., default)` work. Bulk reads like `gather` skip the property
+    and raise the KeyError or IndexError
+    """
+
+    # property comes first for its C level __get__ and __set__, but the
+    # rest of the descriptor protocol is the alias's
+    __set_name__ = _alias_base.__set_name__
+
+    def __init__(
+        self,
+        alias_name: Optional[str] = None,
+        *,
+        index: Any = _NO_ITEM,
+        key: Any = _NO_ITEM,
+        trample_ok: bool = False,
+        since: Optional[Version] = None,
+        until: Optional[Version] = None,
+    ):
+        if (index is _NO_ITEM) == (key is _NO_ITEM):
+            raise TypeError("item alias takes exactly one of index or key")
+        self._item_kwargs = (
+            ("index", index) if key is _NO_ITEM else ("key", key),
+        )
+        item = index if key is _NO_ITEM else key
+        self._item = item
+        _alias_base.__init__(
+            self,
+            f"[{item!r}]",
+            alias_name,
+            trample_ok=trample_ok,
+            since=since,
+            until=until,
+        )
+        getter = self._getter = itemgetter(item)
+
+        def read(owner: Any) -> Any:
+            try:
+                return getter(owner)
+            except (KeyError, IndexError) as error:
+                raise AttributeError(
+                    f"{type(owner).__name__!r} object has no item {item!r}"
+                    f" for alias {self._name_in(type(owner))!r}"
+                ) from error
+
+        property.__init__(self, read, self._read_only, None, self.__doc__)
+
+    def _read_only(self, owner: Any, value: Any) -> None:
+        raise NotImplementedError(
+            "cannot set the value of read-only alias"
+            f" {self._name_in(type(owner))}"
+        )
+
+    def _target(self, owner_type: Any) -> Callable[[Any], Any]:
+        return self._getter
+
+    def _signature(self) -> Tuple[Any, ...]:
+        return (alias, (), self._item_kwargs + self._version_kwargs())
+
+
+alias.register(cached_alias)
+alias.register(item_alias)
+
+
+def _getter(target: Union[str, Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    return attrgetter(target) if isinstance(target, str) else target
+
+
+def _map_per_type(
+    make_getter: Callable[[Type[Any]], Callable[[Any], Any]],
+    objects: Iterable[Any],
+) -> Iterable[Any]:
+    # builds one getter per distinct type of `objects`, mapping it over
+    # them in C when they all have the same type, which is the usual case
+    if not isinstance(objects, (list, tuple)):
+        objects = list(objects)
+    types = set(map(type, objects))
+    if len(types) == 1:
+        return map(make_getter(types.pop()), objects)
+    getters = {cls: make_getter(cls) for cls in types}
+    return (getters[type(obj)](obj) for obj in objects)
+
+
+def _static_member(cls: Type[Any], name: str) -> Any:
+    # like getattr on the class but without invoking descriptors, which for
+    # an alias would return its target instead of the alias itself
+    for base in cls.__mro__:
+        if name in vars(base):
+            return vars(base)[name]
+    return None
+
+
+# the table of lazy aliases in a class dict, see lazy_alias.py
+_LAZY_TABLE_KEY = "_aliasing_lazy_table"
+
+
+def _is_lazy(cls: Type[Any], name: str) -> bool:
+    # whether `name` is a lazy alias of `cls` not materialized yet, which
+    # the class itself doesn't have as an attribute
+    return any(
+        name in vars(base).get(_LAZY_TABLE_KEY, ()) for base in cls.__mro__
+    )
+
+
+def _bind_lazy_below(cls: Type[Any], name: str) -> None:
+    # lazy aliases are only found when a lookup misses, which a member of a
+    # base now stops, so the subclasses' lazy `name` must be bound now
+    for sub in cls.__subclasses__():
+        table = vars(sub).get(_LAZY_TABLE_KEY, {})
+        if name in table:
+            alias(table.pop(name), name)._bind(sub, name)
+        elif name not in vars(sub):
+            _bind_lazy_below(sub, name)
+
+
+# alias name -> target name, set by `override_aliases` for the current
+# context only, so each thread and asyncio task sees its own overrides
+_overrides: "ContextVar[Optional[Dict[str, str]]]" = ContextVar(
+    "aliasing_overrides", default=None
+)
+
+# set by `set_trusted`, see trust.py. Aliases were validated before the
+# process started, so defining them skips the trample checks and docstrings,
+# and reading them the cycle checks
+_trusted = False
+
+# guards every mutation made by `alias.attach` and `aliased.alias`,
+# reads through the descriptors never take it
+_attach_lock = RLock()
+
+# the last revision handed out, and the one each class got last, kept out
+# of the class dicts
+_revision = 0
+_revisions: "WeakKeyDictionary[Type[Any], int]" = WeakKeyDictionary()
+
+
+def _aliases_changed(cls: Type[Any]) -> None:
+    # called whenever aliases are added to `cls` after its creation, so what
+    # was built from the aliases of it or its subclasses, like prefix tries,
+    # knows to rebuild. Other classes keep theirs
+    global _revision
+    with _attach_lock:
+        _revision += 1
+        _revisions[cls] = _revision
+
+
+def _revision_of(cls: Type[Any]) -> int:
+    # changes whenever aliases are added to `cls` or its bases, as revisions
+    # only grow
+    return max(_revisions.get(base, 0) for base in cls.__mro__)
+
+
+_INSTANCE_HASH_KEY = "_aliasing_instance_hash"
+_CLASS_HASH_KEY = "_aliasing_class_hash"
+
+# classes rebuilt when unpickling, shared by every instance that has the
+# same original class and the same set of attached aliases
+_attached_classes: "WeakValueDictionary[Tuple[Any, ...], Type[Any]]" = (
+    WeakValueDictionary()
+)
+
+
+def _attached_base(cls: Type[Any]) -> Type[Any]:
+    # first class in the mro that wasn't created by `alias.attach`
+    for base in cls.__mro__:
+        if _CLASS_HASH_KEY not in vars(base):
+            return base
+    return cls
+
+
+def _attached_signature(cls: Type[Any]) -> Tuple[Any, ...]:
+    aliases: Dict[str, Tuple[Any, ...]] = {}
+    # walk from the base up so aliases attached later win
+    for base in reversed(cls.__mro__):
+        if _CLASS_HASH_KEY not in vars(base):
+            continue
+        for name, member in vars(base).items():
+            if isinstance(member, _alias_base):
+                aliases[name] = member._signature()
+    return tuple(sorted(aliases.items()))
+
+
+def _attached_class(base: Type[Any], signature: Tuple[Any, ...]) -> Type[Any]:
+    key: Optional[Tuple[Any, ...]] = (base, signature)
+    try:
+        hash(key)
+    except TypeError:
+        # arguments bound by a partial alias can be lists and such, those
+        # classes can't be shared
+        key = None
+    with _attach_lock:
+        cls = None if key is None else _attached_classes.get(key)
+        if cls is not None:
+            return cls
+        namespace: Dict[str, Any] = {
+            # never matches an instance hash, so attaching another alias
+            # to a restored instance subclasses instead of mutating this
+            _INSTANCE_HASH_KEY: None,
+            _CLASS_HASH_KEY: hash(base),
+            "__reduce_ex__": _reduce_attached,
+        }
+        for name, alias_signature in signature:
+            namespace[name] = alias._from_signature(alias_signature)
+        cls = type(base.__name__, (base,), namespace)
+        cls.__doc__ = f" class for aliases {', '.join(dict(signature))}"
+        if key is not None:
+            _attached_classes[key] = cls
+        return cls
+
+
+def _restore_attached(
+    base: Type[Any],
+    signature: Tuple[Any, ...],
+    func: Callable[..., Any],
+    args: Tuple[Any, ...],
+) -> Any:
+    cls = _attached_class(base, signature)
+    func, *rest = [
+        cls if arg is _attached_class else arg for arg in (func, *args)
+    ]
+    return func(*rest)
+
+
+def _reduce_attached(self: Any, protocol: int) -> Any:
+    cls = type(self)
+    base = _attached_base(cls)
+    # the original class knows how to rebuild its instances, e.g. the
+    # arguments of tuple and datetime subclasses, only the class differs
+    reduced = cast(Any, base).__reduce_ex__(self, protocol)
+    if isinstance(reduced, str):
+        return reduced
+    # the dynamic class can't be pickled, so `_attached_class` stands in for
+    # it until `_restore_attached` rebuilds it
+    func, *args = [
+        _attached_class if arg is cls else arg
+        for arg in (reduced[0], *reduced[1])
+    ]
+    return (
+        _restore_attached,
+        (base, _attached_signature(cls), func, tuple(args)),
+        *reduced[2:],
+    )
+
+
+def _wrapped_name(func: Any) -> str:
+    if hasattr(func, "__name__"):
+        return cast(str, func.__name__)
+    # descriptors like functools.cached_property and property (<3.13)
+    # only name the function they wrap
+    for attr in ("func", "fget", "__func__"):
+        if hasattr(getattr(func, attr, None), "__name__"):
+            return cast(str, getattr(func, attr).__name__)
+    raise RuntimeError(f"could not resolve name of aliased member {func}")
+
+
+def _cache_size(cache: Union[bool, int]) -> Optional[int]:
+    # True is the functools.lru_cache default size
+    if cache is True:
+        return 128
+    if cache is False or cache is None:
+        return None
+    if cache < 0:
+        raise ValueError(f"cache size must not be negative, got {cache}")
+    return cache
+
+
+class _memo:
+    # the cache of a memoized `aliased` member in the instance dict, with the
+    # instance it belongs to. Copies and pickles of it belong to none, so
+    # the copied instance builds its own
+
+    __slots__ = ("owner", "cache")
+
+    def __init__(
+        self,
+        owner: Callable[[], Any] = lambda: None,
+        cache: Optional[Callable[..., Any]] = None,
+    ):
+        self.owner = owner
+        self.cache = cache
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (_memo, ())
 
 
 class aliased:
-    def __init__(self, func: Any):
+    """
+    Usage:
+        class Example:
+            @aliased
+            def method(self): ...
+
+            other = method.alias("other")
+
+    with `cache=<size>` (or `cache=True` for 128) calls are memoized per
+    instance, in an LRU cache of that size shared by the method's name and
+    all of its aliases. `instance.method.cache_info()` reports the hits and
+    misses. The cache is stored in the instance's __dict__ and only holds a
+    weak reference to the instance. Copies and unpickled instances start
+    with an empty cache of their own
+    """
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        if not args and "func" not in kwargs:
+            # @aliased(cache=...) form
+            return partial(cls, **kwargs)
+        return super().__new__(cls)
+
+    def __init__(self, func: Any, *, cache: Union[bool, int] = False):
         self._func = func
+        self._cache_size = _cache_size(cache)
         self._aliases: List[alias] = []
         self._original: aliased = self
+        # every aliased object sharing this one's aliases, so their
+        # docstrings can be refreshed together when an alias is added
+        self._views: List[aliased] = [self]
 
         name: str = ""
 
-        if isinstance(func, alias):
+        if isinstance(func, _alias_base):
             aliased_: Optional[aliased] = getattr(func, "_aliased", None)
             if isinstance(aliased_, aliased):
                 self._original = aliased_._original
@@ -215,11 +799,14 @@ class aliased:
             self._func = getattr(self._original, "_func")
             self._init_doc = getattr(self._original, "_init_doc")
             self._aliases = getattr(self._original, "_aliases")
+            self._views = getattr(self._original, "_views")
+            self._views.append(self)
+            self._cache_size = getattr(self._original, "_cache_size")
             # possible source or unexpected behavior if called directly
             # instead of as member in class
             name = self._original._name
         elif not name:
-            name = func.__name__
+            name = _wrapped_name(func)
 
         self._name: str = name
         self._init_doc = func.__doc__
@@ -231,13 +818,17 @@ class aliased:
         self._doc = self._init_doc
         self._refresh_doc()
 
-    def _refresh_doc(self) -> None:
-        alias_list = ",".join(
+    def _alias_names(self) -> List[str]:
+        return list(
             filter(
                 None, map(lambda a: getattr(a, "_name", None), self._aliases)
             )
         )
-        aliases_prefix = f"(aliases {alias_list})" if self._aliases else ""
+
+    def _refresh_doc(self) -> None:
+        alias_names = self._alias_names()
+        alias_list = ",".join(alias_names)
+        aliases_prefix = f"(aliases {alias_list})" if alias_names else ""
         # renders a docstring like:
         #   """(aliases method1,method2)\n<your original doc string here"""
         self._doc = self._doc_sep.join(
@@ -245,24 +836,48 @@ class aliased:
         )
         self.__doc__ = self._doc
 
+    def _refresh_docs(self) -> None:
+        for view in self._views:
+            view._refresh_doc()
+
     def _refresh_name(self, name: Optional[str] = None) -> None:
         self._name = name or self._name
         self._private_name = f"_aliased_{self._name}"
+        self._memo_name = f"_aliased_memo_{self._name}"
 
     def __set_name__(self, owner: Any, name: str) -> None:
         self._refresh_name(name)
         func = self._func
         self._init_doc = func.__doc__
         setattr(owner, self._private_name, func)
+        if self._original is self:
+            # setattr doesn't run the hooks of the descriptor it sets, but
+            # functools.cached_property needs its name to cache anything.
+            # Nested aliased objects share the original's func, which may
+            # only be named once, and a wrapped alias keeps its own name
+            set_name = getattr(type(func), "__set_name__", None)
+            if set_name is not None and not isinstance(func, _alias_base):
+                set_name(func, owner, self._private_name)
+        if not _trusted:
+            self._refresh_doc()
 
     def __get__(self, owner: Any, owner_type: Optional[Any] = None) -> Any:
-        self._refresh_doc()
         if owner is None:
             try:
                 return getattr(owner_type, self._private_name)
             except AttributeError:
                 return self
 
+        if self._cache_size is not None:
+            # unless it is a copy, still holding the original's cache
+            try:
+                memo = owner.__dict__[self._original._memo_name]
+                if memo.owner() is owner:
+                    return memo.cache
+            except (AttributeError, KeyError):
+                pass
+            return self._memoize(owner)
+
         func = getattr(owner, self._private_name)
 
         if callable(func):
@@ -276,11 +891,51 @@ class aliased:
 
         return func
 
+    def _memoize(self, owner: Any) -> Any:
+        memo_name = self._original._memo_name
+        try:
+            namespace = vars(owner)
+        except TypeError:
+            raise TypeError(
+                f"cannot memoize {self._original._name} of"
+                f" {type(owner).__name__} instances, which have no __dict__"
+            ) from None
+        with _attach_lock:
+            # another thread may have got there first, both must share a
+            # cache. A cache of another instance came with a copy of it
+            memo = namespace.get(memo_name)
+            if memo is None or memo.owner() is not owner:
+                memo = namespace[memo_name] = self._new_memo(owner)
+        return memo.cache
+
+    def _new_memo(self, owner: Any) -> "_memo":
+        name = self._original._name
+        private_name = self._private_name
+        func = getattr(owner, private_name)
+        if not callable(func):
+            raise TypeError(f"cannot memoize non-callable member {name}")
+        # the instance keeps the cache, so the cache mustn't keep it
+        owner_ref = ref(owner)
+
+        # wrapping the bound method would keep a strong reference
+        @wraps(getattr(func, "__func__", func))
+        def call(*args: Any, **kwargs: Any) -> Any:
+            instance = owner_ref()
+            if instance is None:
+                raise ReferenceError(f"instance of {name} no longer exists")
+            return getattr(instance, private_name)(*args, **kwargs)
+
+        cache = lru_cache(maxsize=self._cache_size)(call)
+        cache.__doc__ = self._doc
+        return _memo(owner_ref, cache)
+
     def alias(
         self,
         member: Optional[Any] = None,
         *,
         trample_ok: Optional[bool] = None,
+        since: Optional[Version] = None,
+        until: Optional[Version] = None,
     ) -> alias:
         name: Optional[str]
         if member is None:
@@ -305,6 +960,11 @@ class aliased:
             alias_name=name,
             _aliased=self._original,
             trample_ok=bool(trample_ok),
+            since=since,
+            until=until,
         )
-        self._aliases.append(new_alias)
+        with _attach_lock:
+            self._aliases.append(new_alias)
+            if not _trusted:
+                self._refresh_docs()
         return new_alias
@@ -1,3 +1,6 @@
+from typing import List
+
+
 class AliasWarning(UserWarning):
     pass
 
@@ -25,3 +28,11 @@ class TrampleAliasWarning(AliasWarning):
     """
 
     pass
+
+
+class AmbiguousAliasError(AliasError):
+    """when an abbreviation matches more than one member"""
+
+    def __init__(self, message: str, candidates: List[str]):
+        super().__init__(message)
+        self.candidates = candidates
@@ -0,0 +1,206 @@
+from operator import attrgetter
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
+
+from .core import _alias_base, _attach_lock, aliased, alias, item_alias
+from .error import CircularAliasError
+from .lazy_alias import _TABLE_KEY, lazy_names
+
+try:
+    # the C descriptor of NamedTuple fields
+    from collections import _tuplegetter  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    _tuplegetter = None
+
+T = TypeVar("T", bound=Type[Any])
+
+_FROZEN_KEY = "_aliasing_frozen"
+
+_MISSING: Any = object()
+
+
+def frozen_aliases(cls: Type[Any]) -> Dict[str, str]:
+    """every alias `freeze` replaced on `cls` or its bases"""
+    names: Dict[str, str] = {}
+    for base in reversed(cls.__mro__):
+        frozen = vars(base).get(_FROZEN_KEY, {})
+        names.update(
+            (name, target)
+            for name, target in frozen.items()
+            # unless a subclass redefined the name since
+            if _defining_base(cls, name) is base
+        )
+    return names
+
+
+def _defining_base(cls: Type[Any], name: str) -> Optional[Type[Any]]:
+    for base in cls.__mro__:
+        if name in vars(base):
+            return base
+    return None
+
+
+def _member(cls: Type[Any], name: str) -> Any:
+    base = _defining_base(cls, name)
+    return _MISSING if base is None else vars(base)[name]
+
+
+def alias_index(cls: Type[Any]) -> Dict[str, str]:
+    """
+    alias name -> the name it is an alias for, of every alias of `cls`,
+    whether a descriptor, a lazy alias or frozen by `freeze`
+    """
+    index = lazy_names(cls)
+    index.update(frozen_aliases(cls))
+    for base in reversed(cls.__mro__):
+        for name, member in vars(base).items():
+            if isinstance(member, _alias_base) and (
+                _defining_base(cls, name) is base
+            ):
+                index[name] = member._for
+    return index
+
+
+def _resolve(cls: Type[Any], index: Dict[str, str], name: str) -> str:
+    seen = {name}
+    target = index[name]
+    while target in index and _freezable(_member(cls, target)):
+        if target in seen:
+            raise CircularAliasError(
+                f"Nested alias {name} references a circular alias"
+            )
+        seen.add(target)
+        target = index[target]
+    return target
+
+
+def _freezable(member: Any) -> bool:
+    # plain aliases only, others do more than redirect the lookup, and
+    # names that aren't in a class dict are lazy aliases
+    return (
+        member is _MISSING
+        or type(member) is alias
+        or (not isinstance(member, _alias_base))
+    )
+
+
+def _read_only(name: str) -> Callable[[Any, Any], None]:
+    def setter(owner: Any, value: Any) -> None:
+        raise NotImplementedError(
+            f"cannot set the value of read-only alias {name}"
+        )
+
+    return setter
+
+
+def _binding(cls: Type[Any], name: str, target: str) -> Any:
+    # what `name` can be bound to in the class dict instead of an alias for
+    # `target`, or _MISSING to keep the alias
+    member = _member(cls, target)
+    if isinstance(member, aliased):
+        if member._cache_size is not None:
+            # the per-instance cache lives in the instance dict
+            member = _MISSING
+        else:
+            member = member._func
+    elif isinstance(member, item_alias):
+        binding = _item_binding(cls, member)
+        if binding is _MISSING:
+            binding = property(
+                member.fget, _read_only(name), doc=member.__doc__
+            )
+        return binding
+    elif isinstance(member, _alias_base):
+        return _MISSING
+    if _tuplegetter is not None and type(member) is _tuplegetter:
+        # read-only already, the same field under another name
+        return member
+    if member is not _MISSING and not (
+        hasattr(type(member), "__set__") or hasattr(type(member), "__delete__")
+    ):
+        # functions, static/class methods, non-data descriptors and plain
+        # class attributes behave the same under any name
+        return member
+    # instance attributes and data descriptors, read in C by attrgetter
+    return property(
+        attrgetter(target), _read_only(name), doc=f"Alias for {target}"
+    )
+
+
+def _item_binding(cls: Type[Any], member: item_alias) -> Any:
+    # item aliases already read in C, but NamedTuple fields read faster
+    index = member._item
+    if (
+        _tuplegetter is not None
+        and issubclass(cls, tuple)
+        and type(index) is int
+        and index >= 0
+    ):
+        return _tuplegetter(index, member.__doc__)
+    return _MISSING
+
+
+def freeze(cls: T) -> T:
+    """
+    Usage:
+        @freeze
+        class Example:
+            @aliased
+            def method(self): ...
+
+            other = method.alias("other")
+        ...
+        assert vars(Example)["other"] is vars(Example)["method"]
+
+    replaces the aliases and `aliased`/`valiased` members of the finished
+    class `cls` by what they resolve to, so accessing them costs the same as
+    accessing any other member. Aliases of methods and class attributes are
+    bound to the very same object as the name they alias, aliases of
+    instance attributes and properties become read-only properties, and
+    index aliases of tuple subclasses the same descriptor as NamedTuple
+    fields, which raises AttributeError instead on assignment.
+
+    frozen aliases no longer follow `override_aliases`, nor members a
+    subclass overrides, until the subclass is frozen itself.
+    `alias_index` still reports what each frozen name is an alias for
+    """
+    with _attach_lock:
+        index = alias_index(cls)
+        bindings: Dict[str, Any] = {}
+        relinked = set()
+        for name in index:
+            member = _member(cls, name)
+            if isinstance(member, item_alias):
+                binding = _item_binding(cls, member)
+                if binding is not _MISSING:
+                    bindings[name] = binding
+                continue
+            if not _freezable(member):
+                continue
+            binding = _binding(cls, name, _resolve(cls, index, name))
+            if binding is _MISSING and _defining_base(cls, name) not in (
+                None,
+                cls,
+            ):
+                # a base froze it, but an alias of this class that can't be
+                # frozen changed where it leads, so it must follow that live
+                binding = alias(index[name], name)
+                relinked.add(name)
+            if binding is not _MISSING:
+                bindings[name] = binding
+        for name in dir(cls):
+            member = _member(cls, name)
+            if isinstance(member, aliased) and member._cache_size is None:
+                bindings[name] = member._func
+
+        frozen = dict(vars(cls).get(_FROZEN_KEY, {}))
+        lazy = vars(cls).get(_TABLE_KEY, {})
+        for name, binding in bindings.items():
+            # the functions were already named when the class was created
+            setattr(cls, name, binding)
+            if name in relinked:
+                frozen.pop(name, None)
+            elif name in index:
+                frozen[name] = index[name]
+                lazy.pop(name, None)
+        setattr(cls, _FROZEN_KEY, frozen)
+    return cls
@@ -0,0 +1,55 @@
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List, Type, Union
+
+from .core import _alias_base, _getter, _map_per_type, _static_member
+
+Target = Union[str, Callable[[Any], Any]]
+
+
+def _target(cls: Type[Any], name: str) -> Target:
+    member = _static_member(cls, name)
+    if isinstance(member, _alias_base):
+        return member._target(cls)
+    return name
+
+
+def _row_getter(cls: Type[Any], names: List[str]) -> Callable[[Any], Any]:
+    targets = [_target(cls, name) for name in names]
+    if all(isinstance(target, str) for target in targets):
+        # attrgetter builds the tuples itself
+        return attrgetter(*targets)  # type: ignore[arg-type]
+    getters = list(map(_getter, targets))
+    return lambda obj: tuple(getter(obj) for getter in getters)
+
+
+def gather(
+    objects: Iterable[Any], *names: str, columns: bool = False
+) -> List[Any]:
+    """
+    Usage:
+        gather(rows, "my_alias")  # [row.my_alias for row in rows]
+        gather(rows, "a", "b")  # [(row.a, row.b) for row in rows]
+        gather(rows, "a", "b", columns=True)  # [[row.a, ...], [row.b, ...]]
+
+    reads the named members or aliases of every one of `objects`, resolving
+    aliases to the member they end at once per type, then reading them in a
+    C level loop
+    """
+    if not names:
+        raise ValueError("must provide at least one name to gather")
+    if not isinstance(objects, (list, tuple)):
+        objects = list(objects)
+    if columns:
+        return [
+            list(
+                _map_per_type(lambda cls: _getter(_target(cls, name)), objects)
+            )
+            for name in names
+        ]
+    if len(names) == 1:
+        return list(
+            _map_per_type(lambda cls: _getter(_target(cls, names[0])), objects)
+        )
+    return list(
+        _map_per_type(lambda cls: _row_getter(cls, list(names)), objects)
+    )
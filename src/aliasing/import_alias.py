@@ -0,0 +1,124 @@
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .core import _alias_base, alias
+from .error import TrampleAliasError
+
+_TABLE_KEY = "_aliasing_import_table"
+
+_MISSING: Any = object()
+
+
+def resolve_import(import_path: str) -> Any:
+    """
+    the object at `"package.module:attr.subattr"`, or the module itself
+    when there is no `:attr` part
+    """
+    module_name, _, attrs = import_path.partition(":")
+    value: Any = importlib.import_module(module_name)
+    for attr in filter(None, attrs.split(".")):
+        value = getattr(value, attr)
+    return value
+
+
+class import_alias(_alias_base):
+    """
+    Usage:
+        class Example:
+            heavy_func = import_alias("pkg.heavy.module:func")
+        ...
+        Example.heavy_func  # "pkg.heavy.module" is only imported now
+
+    alias for an object in another module, that isn't imported until the
+    alias is first accessed. The imported object is kept by the alias and
+    returned as is, without binding it to the instance
+    """
+
+    def __init__(
+        self,
+        import_path: str,
+        alias_name: Optional[str] = None,
+        *,
+        trample_ok: bool = False,
+    ):
+        super().__init__(import_path, alias_name, trample_ok=trample_ok)
+        self.__doc__ = f"Lazily imported alias for {import_path}"
+        self._value = _MISSING
+
+    def __get__(self, owner: Any, owner_type: Optional[Any] = None) -> Any:
+        value = self._value
+        if value is _MISSING:
+            # importlib serializes concurrent imports of the same module,
+            # so at worst two threads store the same object here
+            value = self._value = resolve_import(self._for)
+        return value
+
+    def _target(self, owner_type: Any) -> Callable[[Any], Any]:
+        value = self.__get__(None, owner_type)
+        return lambda _: value
+
+    def __set__(self, owner: Any, value: Any) -> None:
+        raise NotImplementedError(
+            "cannot set the value of read-only alias"
+            f" {self._name_in(type(owner))}"
+        )
+
+
+alias.register(import_alias)
+
+
+def _is_hook(func: Any) -> bool:
+    return getattr(func, "_aliasing_import_hook", False)
+
+
+def import_aliases(module_name: str, **aliases: str) -> None:
+    """
+    Usage:
+        # in pkg/__init__.py
+        import_aliases(__name__, old_name="pkg.heavy.module:new_name")
+        ...
+        from pkg import old_name  # "pkg.heavy.module" is only imported now
+
+    adds module level aliases for objects in other modules, imported through
+    the module's `__getattr__` (PEP 562) the first time they are accessed.
+    The imported object then replaces the alias in the module's globals
+    """
+    module = sys.modules[module_name]
+    namespace = vars(module)
+    for name in aliases:
+        if name in namespace:
+            raise TrampleAliasError(
+                f"Module {module_name} already has member with name {name}."
+                f" Cannot override it with alias for {aliases[name]}."
+            )
+    table: Dict[str, str] = namespace.setdefault(_TABLE_KEY, {})
+    table.update(aliases)
+    if _is_hook(namespace.get("__getattr__")):
+        return
+
+    fallback: Optional[Callable[[str], Any]] = namespace.get("__getattr__")
+    fallback_dir: Optional[Callable[[], Iterable[str]]] = namespace.get(
+        "__dir__"
+    )
+
+    def __getattr__(name: str) -> Any:
+        import_path = table.get(name)
+        if import_path is None:
+            if fallback is not None:
+                return fallback(name)
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            )
+        value = resolve_import(import_path)
+        # from now on a plain lookup in the module dict finds it
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        names = fallback_dir() if fallback_dir else namespace
+        return sorted(set(names) | set(table))
+
+    setattr(__getattr__, "_aliasing_import_hook", True)
+    namespace["__getattr__"] = __getattr__
+    namespace["__dir__"] = __dir__
@@ -0,0 +1,141 @@
+from typing import Any, Callable, Dict, Iterable, Optional, Type
+
+from .core import (
+    _LAZY_TABLE_KEY as _TABLE_KEY,
+    alias,
+    _alias_base,
+    _aliases_changed,
+    _attach_lock,
+    _static_member,
+)
+
+
+def lazy_table(owner: Type[Any]) -> Dict[str, str]:
+    """
+    the compact alias name -> target name table declared on `owner` itself,
+    creating it if needed. Add to it with `add_lazy`
+    """
+    table: Optional[Dict[str, str]] = vars(owner).get(_TABLE_KEY)
+    if table is None:
+        with _attach_lock:
+            table = vars(owner).get(_TABLE_KEY)
+            if table is None:
+                table = {}
+                setattr(owner, _TABLE_KEY, table)
+    return table
+
+
+def add_lazy(owner: Type[Any], aliases: Dict[str, str]) -> None:
+    """
+    records the alias name -> target name pairs of `aliases` as lazy
+    aliases of `owner`, each turned into an `alias` on its first use from
+    an instance. Until then a name costs a table entry, and attribute
+    lookups that miss fall back to the table through one `__getattr__`
+    hook per class hierarchy. Names a base already has a member for are
+    bound right away, as the hook only sees names nothing else has
+    """
+    with _attach_lock:
+        table = lazy_table(owner)
+        for name, target in aliases.items():
+            if _static_member(owner, name) is None:
+                table[name] = target
+            else:
+                alias(target, name)._bind(owner, name)
+        _install_hooks(owner)
+        _aliases_changed(owner)
+
+
+def lazy_names(owner: Type[Any]) -> Dict[str, str]:
+    """every lazy alias not yet materialized on `owner` or its bases"""
+    names: Dict[str, str] = {}
+    for base in reversed(owner.__mro__):
+        names.update(vars(base).get(_TABLE_KEY, {}))
+    return names
+
+
+def _materialize(
+    base: Type[Any], table: Dict[str, str], name: str
+) -> Optional[_alias_base]:
+    with _attach_lock:
+        member = vars(base).get(name)
+        if isinstance(member, _alias_base):
+            # another thread got here first
+            return member
+        target = table.pop(name, None)
+        if target is None:
+            return None
+        member = alias(target, name)
+        member._bind(base, name)
+        return member
+
+
+def _lookup(cls: Type[Any], name: str) -> Optional[_alias_base]:
+    for base in cls.__mro__:
+        table = vars(base).get(_TABLE_KEY)
+        # the second check covers another thread materializing it between
+        # the failed attribute lookup and this one
+        if table is not None and (
+            name in table or isinstance(vars(base).get(name), _alias_base)
+        ):
+            member = _materialize(base, table, name)
+            if member is not None:
+                return member
+        if name in vars(base):
+            # a member the lazy aliases of the bases can't override
+            return None
+    return None
+
+
+def _is_hook(func: Any) -> bool:
+    return getattr(func, "_aliasing_lazy_hook", False)
+
+
+def _hook(
+    fallback: Optional[Callable[[Any, str], Any]],
+) -> Callable[[Any, str], Any]:
+    # the `__getattr__` resolving lazy aliases, then falling back to the
+    # `__getattr__` it replaces
+    def __getattr__(self: Any, name: str) -> Any:
+        cls = type(self)
+        member = _lookup(cls, name)
+        if member is not None:
+            # from now on `name` is a regular descriptor in the class dict
+            return member.__get__(self, cls)
+        if fallback is not None:
+            return fallback(self, name)
+        if _static_member(cls, name) is not None:
+            # the member exists and raised AttributeError itself, which
+            # this hook must not replace with its own
+            return object.__getattribute__(self, name)
+        raise AttributeError(
+            f"{cls.__name__!r} object has no attribute {name!r}"
+        )
+
+    setattr(__getattr__, "_aliasing_lazy_hook", True)
+    return __getattr__
+
+
+def _install_hooks(owner: Type[Any]) -> None:
+    # one hook per hierarchy is enough, it walks the mro for tables
+    if _is_hook(getattr(owner, "__getattr__", None)):
+        return
+
+    fallback_dir: Callable[[Any], Iterable[str]] = getattr(owner, "__dir__")
+    previous = vars(owner).get("__init_subclass__")
+
+    def __dir__(self: Any) -> Iterable[str]:
+        return sorted(set(fallback_dir(self)) | set(lazy_names(type(self))))
+
+    def __init_subclass__(cls: Type[Any], **kwargs: Any) -> None:
+        if previous is not None:
+            previous.__get__(None, cls)(**kwargs)
+        else:
+            super(owner, cls).__init_subclass__(**kwargs)
+        # a subclass's own `__getattr__` would hide the hook
+        own = vars(cls).get("__getattr__")
+        if own is not None and not _is_hook(own):
+            setattr(cls, "__getattr__", _hook(own))
+
+    setattr(owner, "__getattr__", _hook(getattr(owner, "__getattr__", None)))
+    setattr(owner, "__dir__", __dir__)
+    setattr(owner, "__init_subclass__", classmethod(__init_subclass__))
@@ -0,0 +1,313 @@
+"""
+Aliases declared in a JSON or TOML manifest instead of in code.
+
+    {
+        "classes": {
+            "pkg.module:Client": {
+                "fetchJson": "fetch_json",
+                "get": {"for": "fetch", "until": "2.0"}
+            }
+        },
+        "modules": {
+            "pkg": {"old_helper": "pkg.helpers:new_helper"}
+        }
+    }
+
+Class entries become aliases on the named class, module entries become
+lazily imported module attributes, see `import_aliases`. A module entry
+target without a `:` names another attribute of the same module.
+
+`apply_manifest` validates the manifest with the usual trample and cycle
+rules the first time, and caches the validated table in a marshal file
+keyed by the manifest's hash, so later starts only apply it.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from warnings import warn
+
+from .core import (
+    _alias_base,
+    _aliases_changed,
+    _attach_lock,
+    _static_member,
+    alias,
+)
+from .error import CircularAliasError, TrampleAliasError, TrampleAliasWarning
+from .freeze import alias_index
+from .import_alias import _TABLE_KEY, import_aliases, resolve_import
+from .versions import api_version, in_range, parse_version
+
+# bump whenever the compiled table changes shape or meaning
+MANIFEST_VERSION = 1
+
+# alias name, target, since, until, trample_ok
+ClassEntry = Tuple[str, str, Any, Any, bool]
+Compiled = Tuple[
+    List[Tuple[str, List[ClassEntry]]], List[Tuple[str, Dict[str, str]]]
+]
+
+_DEFAULT: Any = object()
+
+
+def read_manifest(path: str) -> Dict[str, Any]:
+    """the manifest at `path`, parsed as TOML for `.toml` files, else JSON"""
+    with open(path, "rb") as file:
+        return _parse(path, file.read())
+
+
+def _parse(path: str, data: bytes) -> Dict[str, Any]:
+    if not path.endswith(".toml"):
+        return _checked(json.loads(data))
+    try:
+        import tomllib  # type: ignore[import-not-found]
+    except ImportError:  # pragma: no cover, python < 3.11
+        try:
+            import tomli as tomllib  # type: ignore[import-not-found,no-redef]
+        except ImportError:
+            raise ImportError(
+                "reading TOML manifests needs python 3.11+ or the tomli"
+                " package"
+            ) from None
+    return _checked(tomllib.loads(data.decode("utf-8")))
+
+
+def _checked(manifest: Any) -> Dict[str, Any]:
+    if not isinstance(manifest, dict):
+        raise ValueError("alias manifest must be a table of sections")
+    unknown = set(manifest) - {"classes", "modules"}
+    if unknown:
+        raise ValueError(
+            f"unknown alias manifest sections {sorted(unknown)}, expected"
+            " classes and modules"
+        )
+    return manifest
+
+
+def _class_entry(name: str, spec: Any) -> ClassEntry:
+    if isinstance(spec, str):
+        return (name, spec, None, None, False)
+    if (
+        not isinstance(spec, dict)
+        or "for" not in spec
+        or (set(spec) - {"for", "since", "until", "trample_ok"})
+    ):
+        raise ValueError(
+            f"alias {name} must be a target name or a table with a `for`"
+            " target and optionally `since`, `until` and `trample_ok`"
+        )
+    since, until = spec.get("since"), spec.get("until")
+    return (
+        name,
+        spec["for"],
+        None if since is None else parse_version(since),
+        None if until is None else parse_version(until),
+        bool(spec.get("trample_ok", False)),
+    )
+
+
+def _validate_class(owner: str, entries: List[ClassEntry]) -> None:
+    cls = resolve_import(owner)
+    for name, target, _, _, trample_ok in entries:
+        existing = _static_member(cls, name)
+        if isinstance(existing, _alias_base) and existing._for == target:
+            # applied before, e.g. by an earlier call in this process
+            continue
+        message = alias(target)._trample_message(
+            cls, name, trample_ok=trample_ok
+        )
+        if message and trample_ok:
+            warn(message, TrampleAliasWarning)
+        elif message:
+            raise TrampleAliasError(message)
+
+    index = alias_index(cls)
+    index.update((name, target) for name, target, *_ in entries)
+    for alias_name, *_ in entries:
+        name = alias_name
+        seen = {name}
+        while name in index:
+            name = index[name]
+            if name in seen:
+                raise CircularAliasError(
+                    f"Nested alias {alias_name} of {owner} references a"
+                    " circular alias"
+                )
+            seen.add(name)
+
+
+def _validate_module(module_name: str, aliases: Dict[str, str]) -> None:
+    for name in aliases:
+        seen = {name}
+        target = name
+        while target in aliases:
+            module, _, target = aliases[target].partition(":")
+            if module != module_name or "." in target:
+                break
+            if target in seen:
+                raise CircularAliasError(
+                    f"Module alias {name} of {module_name} references a"
+                    " circular alias"
+                )
+            seen.add(target)
+
+
+def compile_manifest(manifest: Mapping[str, Any]) -> Compiled:
+    """
+    the validated, resolved form of `manifest` that `apply_manifest`
+    caches, importing the modules it names to validate it against them
+    """
+    classes = []
+    for owner, specs in manifest.get("classes", {}).items():
+        entries = [_class_entry(name, spec) for name, spec in specs.items()]
+        _validate_class(owner, entries)
+        classes.append((owner, entries))
+
+    modules = []
+    for module_name, specs in manifest.get("modules", {}).items():
+        aliases = {
+            name: target if ":" in target else f"{module_name}:{target}"
+            for name, target in specs.items()
+        }
+        _validate_module(module_name, aliases)
+        modules.append((module_name, aliases))
+    return classes, modules
+
+
+def _module_names(compiled: Compiled) -> List[str]:
+    classes, modules = compiled
+    names = {owner.partition(":")[0] for owner, _ in classes}
+    names.update(module_name for module_name, _ in modules)
+    return sorted(names)
+
+
+def _sources(compiled: Compiled) -> List[Tuple[str, int, int]]:
+    # the files the manifest was validated against, which must not have
+    # changed for the cached validation to still hold
+    sources = []
+    for name in _module_names(compiled):
+        path = getattr(resolve_import(name), "__file__", None)
+        if path:
+            stat = os.stat(path)
+            sources.append((path, stat.st_mtime_ns, stat.st_size))
+    return sources
+
+
+def _unchanged(sources: List[Tuple[str, int, int]]) -> bool:
+    for path, mtime, size in sources:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if (stat.st_mtime_ns, stat.st_size) != (mtime, size):
+            return False
+    return True
+
+
+def default_cache_path(path: str) -> str:
+    directory, file = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, "__pycache__", f"{file}.aliasing")
+
+
+def _cache_key(digest: str) -> Tuple[Any, ...]:
+    # marshal's format may change between interpreters
+    return (MANIFEST_VERSION, sys.implementation.cache_tag, digest)
+
+
+def _load_cache(cache_path: str, digest: str) -> Optional[Tuple[Any, ...]]:
+    try:
+        with open(cache_path, "rb") as file:
+            key, sources, compiled = marshal.load(file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if tuple(key) != _cache_key(digest):
+        return None
+    return sources, compiled
+
+
+def _save_cache(
+    cache_path: str, digest: str, sources: Any, compiled: Compiled
+) -> None:
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "wb") as file:
+            marshal.dump((_cache_key(digest), sources, compiled), file)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # e.g. a read-only install, the next start validates again
+        pass
+
+
+def _apply(compiled: Compiled) -> int:
+    classes, modules = compiled
+    applied = 0
+    with _attach_lock:
+        for owner, entries in classes:
+            cls = resolve_import(owner)
+            version = api_version(cls)
+            before = applied
+            for name, target, since, until, trample_ok in entries:
+                if not in_range(since, until, version):
+                    continue
+                existing = vars(cls).get(name)
+                if isinstance(existing, _alias_base) and (
+                    existing._for == target
+                ):
+                    continue
+                # validated and named already, so skip straight to setattr
+                setattr(cls, name, alias(target, name, trample_ok=trample_ok))
+                applied += 1
+            if applied > before:
+                _aliases_changed(cls)
+        for module_name, aliases in modules:
+            module = resolve_import(module_name)
+            table = vars(module).get(_TABLE_KEY, {})
+            fresh = {
+                name: target
+                for name, target in aliases.items()
+                if table.get(name) != target
+            }
+            if fresh:
+                import_aliases(module_name, **fresh)
+                applied += len(fresh)
+    return applied
+
+
+def apply_manifest(path: str, *, cache_path: Optional[str] = _DEFAULT) -> int:
+    """
+    Usage:
+        apply_manifest("aliases.toml")
+
+    adds the aliases of the manifest at `path` to the classes and modules it
+    names, returning how many were added.
+
+    the validated manifest is cached in `cache_path`, by default in the
+    `__pycache__` directory next to the manifest. While neither the
+    manifest nor the modules it names change, later calls read that instead
+    of parsing and validating the manifest. `cache_path=None` disables it
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    digest = hashlib.sha256(data).hexdigest()
+    if cache_path is _DEFAULT:
+        cache_path = default_cache_path(path)
+
+    cached = _load_cache(cache_path, digest) if cache_path else None
+    if cached is not None:
+        sources, compiled = cached
+        # the modules are imported to apply the aliases anyway, and
+        # importing them first lets their files be compared
+        for name in _module_names(compiled):
+            resolve_import(name)
+        if _unchanged(sources):
+            return _apply(compiled)
+
+    compiled = compile_manifest(_parse(path, data))
+    if cache_path:
+        _save_cache(cache_path, digest, _sources(compiled), compiled)
+    return _apply(compiled)
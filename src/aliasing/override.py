@@ -0,0 +1,29 @@
+from contextlib import contextmanager
+from typing import Iterator, Mapping, Optional
+
+from .core import _overrides
+
+
+@contextmanager
+def override_aliases(
+    targets: Optional[Mapping[str, str]] = None, **kwargs: str
+) -> Iterator[None]:
+    """
+    Usage:
+        with override_aliases(name="v2_name"):
+            assert obj.name == obj.v2_name
+
+    points the aliases with the given names at other targets, only in the
+    current `contextvars` context: asyncio tasks created inside the block
+    start with the same overrides, but overrides made in one thread or task
+    are never seen by another. Nested blocks add to the overrides of the
+    enclosing ones
+    """
+    merged = dict(_overrides.get() or {})
+    merged.update(targets or {})
+    merged.update(kwargs)
+    token = _overrides.set(merged)
+    try:
+        yield
+    finally:
+        _overrides.reset(token)
@@ -0,0 +1,180 @@
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, TypeVar
+
+from . import core
+
+from .error import AmbiguousAliasError, CircularAliasError
+from .freeze import alias_index
+
+T = TypeVar("T", bound=Type[Any])
+
+_TRIE_KEY = "_aliasing_prefix_trie"
+
+
+class _Node:
+    __slots__ = ("children", "member", "ambiguous", "exact")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _Node] = {}
+        # the member the names below this node resolve to,
+        # only meaningful while they all resolve to the same one
+        self.member: Optional[str] = None
+        self.ambiguous = False
+        # the member of the name ending exactly at this node
+        self.exact: Optional[str] = None
+
+
+class PrefixTrie:
+    """
+    resolves unique prefixes of names to the member the name refers to,
+    in time proportional to the length of the prefix
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _mark(node: _Node, member: str) -> None:
+        if node.member is None:
+            node.member = member
+        elif node.member != member:
+            node.ambiguous = True
+
+    def add(self, name: str, member: str) -> None:
+        node = self._root
+        self._mark(node, member)
+        for char in name:
+            node = node.children.setdefault(char, _Node())
+            self._mark(node, member)
+        if node.exact is None:
+            self._size += 1
+        node.exact = member
+
+    def candidates(self, prefix: str) -> List[str]:
+        """every member with a name starting with `prefix`"""
+        node: Optional[_Node] = self._root
+        for char in prefix:
+            node = node.children.get(char) if node else None
+        members: Set[str] = set()
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            if node.exact is not None:
+                members.add(node.exact)
+            stack.extend(node.children.values())
+        return sorted(members)
+
+    def resolve(self, prefix: str) -> str:
+        node = self._root
+        for char in prefix:
+            child = node.children.get(char)
+            if child is None:
+                raise KeyError(prefix)
+            node = child
+        # a complete name always wins over the longer names it prefixes
+        if node.exact is not None:
+            return node.exact
+        if node.member is None:
+            raise KeyError(prefix)
+        if node.ambiguous:
+            candidates = self.candidates(prefix)
+            raise AmbiguousAliasError(
+                f"Abbreviation {prefix} is ambiguous, it could refer to any"
+                f" of {', '.join(candidates)}",
+                candidates,
+            )
+        return node.member
+
+
+def _canonical(index: Dict[str, str], name: str) -> str:
+    # follow alias chains to the member they end at
+    seen = {name}
+    while name in index:
+        name = index[name]
+        if name in seen:
+            raise CircularAliasError(
+                f"Nested alias {name} references a circular alias"
+            )
+        seen.add(name)
+    return name
+
+
+def build_prefix_trie(cls: Type[Any]) -> PrefixTrie:
+    """
+    prefix trie over the public members of `cls`, its bases and every alias
+    declared for them, each name mapped to the member it ends at
+    """
+    names: Dict[str, str] = {}
+    for base in reversed(cls.__mro__[:-1]):
+        for name in vars(base):
+            if not name.startswith("_"):
+                names[name] = name
+    index = alias_index(cls)
+    names.update(index)
+
+    trie = PrefixTrie()
+    for name, target in names.items():
+        trie.add(name, _canonical(index, target))
+    return trie
+
+
+def prefix_trie(cls: Type[Any]) -> PrefixTrie:
+    """
+    the trie built for `cls` by `@abbreviations` or an earlier call, or a
+    new one when aliases were attached, applied from a manifest or declared
+    lazily since. Rebuild it with `abbreviations(cls)` after changing the
+    members some other way
+    """
+    built: Optional[Tuple[int, PrefixTrie]] = vars(cls).get(_TRIE_KEY)
+    if built is not None and built[0] == core._revision_of(cls):
+        return built[1]
+    return _build(cls)
+
+
+def _build(cls: Type[Any]) -> PrefixTrie:
+    revision = core._revision_of(cls)
+    trie = build_prefix_trie(cls)
+    setattr(cls, _TRIE_KEY, (revision, trie))
+    return trie
+
+
+def resolve_prefix(owner: Any, abbreviation: str) -> str:
+    """
+    the name of the member of `owner` that `abbreviation` is a unique
+    prefix of, or of one of its aliases
+
+    raises `AmbiguousAliasError` listing the candidates when the prefix is
+    shared by different members
+    """
+    cls = owner if isinstance(owner, type) else type(owner)
+    try:
+        return prefix_trie(cls).resolve(abbreviation)
+    except KeyError:
+        raise AttributeError(
+            f"{cls.__name__!r} has no member or alias starting with"
+            f" {abbreviation!r}"
+        ) from None
+
+
+def abbreviations(cls: T) -> T:
+    """
+    Usage:
+        @abbreviations
+        class Commands:
+            @valiases("cfg")
+            def config(self): ...
+
+            def clean(self): ...
+        ...
+        assert resolve_prefix(Commands, "co") == "config"
+        assert resolve_prefix(Commands, "cf") == "config"
+        resolve_prefix(Commands, "c")  # raises AmbiguousAliasError
+
+    class decorator that builds the prefix trie when the class is created,
+    instead of on the first call to `resolve_prefix`
+    """
+    _build(cls)
+    return cls
@@ -0,0 +1,410 @@
+"""
+Measures what each alias of a class costs next to accessing its target
+directly, and which of them to `freeze`, cache or remove.
+
+    report = profile(Example, Example(...))
+    print(format_profile(report))
+    json.dumps(report)
+
+Only reads that can't change anything are timed: lazy aliases aren't
+materialized, import aliases aren't imported, no constructor, property or
+other descriptor written in python is run, and nothing is stored on the
+sample instances, so it is safe to run in a live process.
+"""
+
+import keyword
+import timeit
+from types import (
+    BuiltinFunctionType,
+    FunctionType,
+    GetSetDescriptorType,
+    MemberDescriptorType,
+    MethodDescriptorType,
+    ModuleType,
+    WrapperDescriptorType,
+)
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from .core import (
+    _INSTANCE_HASH_KEY,
+    _alias_base,
+    aliased,
+    cached_alias,
+    item_alias,
+)
+from .freeze import (
+    _MISSING,
+    _defining_base,
+    _member,
+    _tuplegetter,
+    alias_index,
+)
+from .import_alias import import_alias
+from .lazy_alias import lazy_names
+
+# differences below this are timing noise rather than alias overhead
+NOISE_NS = 5.0
+
+# descriptors implemented in C that only read a slot, field or function
+_C_READS: Tuple[type, ...] = (
+    FunctionType,
+    BuiltinFunctionType,
+    staticmethod,
+    classmethod,
+    MemberDescriptorType,
+    GetSetDescriptorType,
+    MethodDescriptorType,
+    WrapperDescriptorType,
+)
+if _tuplegetter is not None:
+    _C_READS += (_tuplegetter,)
+
+_ITEM_READS = (tuple.__getitem__, list.__getitem__, dict.__getitem__)
+
+# the kinds of alias that are as cheap as they get, and why
+_KEPT = {
+    "frozen": "frozen already",
+    "memoized": "memoized per instance already",
+    "cached": "cached per instance after the first read",
+    "import": "only imports on first access",
+    "lazy": "not accessed yet",
+}
+
+
+def _kind(cls: Type[Any], name: str, member: Any) -> str:
+    if member is _MISSING:
+        return "lazy" if name in lazy_names(cls) else "missing"
+    if isinstance(member, aliased):
+        return "aliased" if member._cache_size is None else "memoized"
+    if not isinstance(member, _alias_base):
+        return "frozen"
+    for kind, type_ in (
+        ("cached", cached_alias),
+        ("item", item_alias),
+        ("import", import_alias),
+    ):
+        if isinstance(member, type_):
+            return kind
+    return "alias"
+
+
+def _runs_python(member: Any) -> bool:
+    # whether reading `member` through an instance may run arbitrary code
+    if isinstance(member, item_alias):
+        # only turns a missing item into an AttributeError
+        return False
+    if isinstance(member, property):
+        return not isinstance(member.fget, (attrgetter, itemgetter))
+    if isinstance(member, _C_READS):
+        return False
+    return hasattr(type(member), "__get__")
+
+
+def _chain(index: Dict[str, str], name: str) -> List[str]:
+    # the names from `name` to the end of its alias chain, items having no
+    # attribute of their own to end at
+    path = [name]
+    while name in index:
+        target = index[name]
+        if target.startswith("[") or target in path:
+            break
+        name = target
+        path.append(name)
+    return path
+
+
+def _side_effect(cls: Type[Any], subject: Any, path: List[str]) -> str:
+    # why reading through the aliases along `path` would change something
+    for name in path[1:-1]:
+        member = _member(cls, name)
+        if member is _MISSING:
+            return f"reading it materializes lazy alias {name}"
+        if isinstance(member, import_alias):
+            return f"reading it may import {member._for}"
+        if isinstance(member, cached_alias) and subject is not cls:
+            return f"reading it stores {name} on the instance"
+    return ""
+
+
+def _read(name: str) -> str:
+    if name.isidentifier() and not keyword.iskeyword(name):
+        return f"o.{name}"
+    return f"getattr(o, {name!r})"
+
+
+def _time(stmt: str, names: Dict[str, Any], number: int, repeat: int) -> float:
+    timer = timeit.Timer(stmt, globals=names)
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def _direct(
+    cls: Type[Any], subject: Any, target: str
+) -> Tuple[Optional[str], str]:
+    # the statement reading `target` directly, or None and why it can't be
+    # read without side effects
+    member = _member(cls, target)
+    if isinstance(member, item_alias):
+        if subject is cls:
+            return None, "items can only be timed on an instance"
+        if type(subject).__getitem__ not in _ITEM_READS:
+            return None, "items read through a custom __getitem__"
+        return "o[i]", ""
+    if isinstance(member, aliased):
+        if member._cache_size is not None:
+            return None, "memoized per instance already"
+        target = member._private_name
+        member = _member(cls, target)
+    if member is _MISSING:
+        if subject is cls:
+            return None, "instance attribute, pass an instance to time it"
+        return _read(target), ""
+    if isinstance(member, _alias_base):
+        return None, f"{target} is itself a {type(member).__name__}"
+    if _runs_python(member):
+        return None, f"reading {target} runs python code"
+    return _read(target), ""
+
+
+def _value_member(cls: Type[Any], member: Any) -> Any:
+    # what reading `member` ends up reading, looking through `aliased`
+    if isinstance(member, aliased) and member._cache_size is None:
+        return _member(cls, member._private_name)
+    return member
+
+
+def _is_missing(cls: Type[Any], subject: Any, target: str) -> bool:
+    # without running __getattr__, which may be user code
+    if _member(cls, target) is not _MISSING or subject is cls:
+        return False
+    if hasattr(cls, "__getattr__"):
+        return False
+    return target not in getattr(subject, "__dict__", {})
+
+
+def _advice(row: Dict[str, Any], value: Any) -> Tuple[str, str]:
+    kind = row["kind"]
+    if kind == "missing":
+        return "remove", f"{row['target']} doesn't exist"
+    if kind in _KEPT:
+        return "keep", _KEPT[kind]
+    if isinstance(value, aliased):
+        return "keep", "memoized per instance already"
+    if value is not _MISSING and _runs_python(value):
+        return "cache", (
+            f"each read runs {row['target']}, cache=True keeps the first"
+            " value per instance if it doesn't change"
+        )
+    overhead = row["overhead_ns"]
+    if overhead is None:
+        return "keep", row["reason"] or "not timed"
+    if overhead < NOISE_NS:
+        return "keep", "no measurable overhead"
+    return "freeze", f"{overhead:.0f} ns per read over {row['target']}"
+
+
+def _profile_alias(
+    cls: Type[Any],
+    subject: Any,
+    index: Dict[str, str],
+    name: str,
+    number: int,
+    repeat: int,
+) -> Dict[str, Any]:
+    member = _member(cls, name)
+    path = _chain(index, name)
+    target = path[-1]
+    target_member = _member(cls, target)
+    kind = _kind(cls, name, member)
+    if kind == "alias" and _is_missing(cls, subject, target):
+        kind = "missing"
+
+    flags = []
+    if len(path) > 2 and kind != "frozen":
+        flags.append("chain")
+    if isinstance(target_member, aliased) and (
+        target_member._cache_size is None
+    ):
+        flags.append("aliased wrapper")
+    base = _defining_base(cls, name)
+    if base is not None and _INSTANCE_HASH_KEY in vars(base):
+        flags.append("attached per instance")
+
+    row: Dict[str, Any] = {
+        "owner": f"{cls.__module__}.{cls.__qualname__}",
+        "alias": name,
+        # items end the chain at the alias reading them
+        "target": index[target] if target in index else target,
+        "kind": kind,
+        "chain": len(path) - 1 if name in index else 0,
+        "flags": flags,
+        "alias_ns": None,
+        "direct_ns": None,
+        "overhead_ns": None,
+        "reason": "",
+    }
+    reason = ""
+    direct = None
+    if kind == "cached" and subject is not cls:
+        reason = "stores its value on the instance when read"
+    elif kind not in ("missing", "lazy", "import"):
+        reason = _side_effect(cls, subject, path)
+        if not reason and kind == "item":
+            direct, reason = _direct(cls, subject, name)
+        elif not reason:
+            direct, reason = _direct(cls, subject, target)
+        if not reason and direct:
+            item = getattr(_member(cls, target), "_item", None)
+            _measure(row, subject, name, direct, item, number, repeat)
+    row["reason"] = reason or row["reason"]
+    row["action"], row["reason"] = _advice(
+        row, _value_member(cls, target_member)
+    )
+    return row
+
+
+def _measure(
+    row: Dict[str, Any],
+    subject: Any,
+    name: str,
+    direct: str,
+    item: Any,
+    number: int,
+    repeat: int,
+) -> None:
+    names = {"o": subject, "i": item}
+    try:
+        alias_ns = _time(_read(name), names, number, repeat)
+        direct_ns = _time(direct, names, number, repeat)
+    except AttributeError as error:
+        # the target isn't there, without any attribute written in python
+        row["kind"] = "missing"
+        row["reason"] = str(error)
+        return
+    except Exception as error:
+        # whatever the target raises, the rest of the profile still runs
+        row["reason"] = f"{type(error).__name__}: {error}"
+        return
+    row["alias_ns"] = round(alias_ns, 1)
+    row["direct_ns"] = round(direct_ns, 1)
+    row["overhead_ns"] = round(max(alias_ns - direct_ns, 0.0), 1)
+
+
+def _aliased_names(cls: Type[Any], index: Dict[str, str]) -> List[str]:
+    return [
+        name
+        for name in dir(cls)
+        if name not in index and isinstance(_member(cls, name), aliased)
+    ]
+
+
+def _classes(target: Any) -> List[Type[Any]]:
+    if isinstance(target, ModuleType):
+        return sorted(
+            (
+                value
+                for value in vars(target).values()
+                if isinstance(value, type)
+                and value.__module__ == target.__name__
+            ),
+            key=lambda cls: cls.__qualname__,
+        )
+    if isinstance(target, type):
+        return [target]
+    raise TypeError(f"expected a class or a module, got {target!r}")
+
+
+def _cost(row: Dict[str, Any]) -> Tuple[bool, float, str, str]:
+    overhead = row["overhead_ns"]
+    return (
+        overhead is None,
+        -(overhead or 0.0),
+        row["owner"],
+        row["alias"],
+    )
+
+
+def profile(
+    target: Any, *samples: Any, number: int = 2000, repeat: int = 3
+) -> Dict[str, Any]:
+    """
+    Usage:
+        report = profile(Example, Example(1))
+        print(format_profile(report))
+
+    times reading each alias of the class `target`, or of every class
+    defined in the module `target`, against reading the name it resolves
+    to, and reports them sorted by overhead, largest first.
+
+    each class is read through the first of `samples` that is an instance
+    of it, else at class level, where aliases of instance attributes can't
+    be timed. A sample of a class `alias.attach` created for one instance is
+    profiled with its attached aliases. Every row has the alias's `target`,
+    `kind`, the length of its `chain`, the `alias_ns`, `direct_ns` and
+    `overhead_ns` per read when timed, `flags` for chains, `aliased`
+    wrappers and aliases attached per instance, and the suggested `action`:
+
+    - "freeze": the alias costs measurably more than its target
+    - "cache": its target runs python code on every read
+    - "remove": its target doesn't exist
+    - "keep": anything else, `reason` says why
+
+    freezing is only right for classes that don't rely on
+    `override_aliases`. The report is plain data, ready for `json.dumps`
+    """
+    rows = []
+    for cls in _classes(target):
+        subject: Any = cls
+        for sample in samples:
+            if isinstance(sample, cls):
+                subject = sample
+                break
+        owner = cls if subject is cls else type(subject)
+        index = alias_index(owner)
+        names = list(index) + _aliased_names(owner, index)
+        for name in names:
+            rows.append(
+                _profile_alias(owner, subject, index, name, number, repeat)
+            )
+    rows.sort(key=_cost)
+    return {"number": number, "repeat": repeat, "aliases": rows}
+
+
+def _ns(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.0f}"
+
+
+def format_profile(report: Dict[str, Any]) -> str:
+    """the rows of a `profile` report as a text table"""
+    header = ("alias", "target", "kind", "alias", "direct", "over", "action")
+    table = [header]
+    for row in report["aliases"]:
+        table.append(
+            (
+                f"{row['owner'].rpartition('.')[2]}.{row['alias']}",
+                row["target"],
+                row["kind"],
+                _ns(row["alias_ns"]),
+                _ns(row["direct_ns"]),
+                _ns(row["overhead_ns"]),
+                row["action"],
+            )
+        )
+    widths = [max(len(line[i]) for line in table) for i in range(len(header))]
+    lines = []
+    for line, row in zip(table, [None] + report["aliases"]):
+        cells = [
+            cell.ljust(width) if i < 3 or i == 6 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(line, widths))
+        ]
+        text = "  ".join(cells).rstrip()
+        if row is not None:
+            notes = row["flags"] + ([row["reason"]] if row["reason"] else [])
+            if notes:
+                text += f"  ({'; '.join(notes)})"
+        lines.append(text)
+    lines.append(
+        f"{len(report['aliases'])} aliases, ns per read, best of"
+        f" {report['repeat']} x {report['number']}"
+    )
+    return "\n".join(lines)
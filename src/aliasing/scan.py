@@ -0,0 +1,405 @@
+"""
+Finds the aliases declared across a codebase and which of them are used.
+
+    python -m aliasing.scan [paths ...] [--jobs N] [--cache FILE] [--json]
+
+Declarations are `alias(...)` and `<aliased>.alias(...)` assignments in
+class bodies, `@<aliased>.alias` and `@valiases(...)` decorators, and
+`alias(...).attach(Owner)` calls. An alias counts as used when any file
+accesses an attribute with its name, or passes its name to `getattr` or
+`hasattr`. Files are parsed in a process pool and the results are cached
+by content hash, so unchanged files are not parsed again.
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    cast,
+)
+
+# bump whenever the per-file results change shape or meaning
+SCANNER_VERSION = 3
+
+DEFAULT_CACHE = ".aliasing-scan-cache.json"
+
+_DYNAMIC_ACCESS = {"getattr", "hasattr"}
+
+
+class Declaration(NamedTuple):
+    owner: str
+    name: str
+    target: str
+    path: str
+    line: int
+
+
+# declarations and the number of accesses to each attribute name
+FileScan = Tuple[List[Declaration], Dict[str, int]]
+
+
+def _func_name(node: ast.expr) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _str_arg(call: ast.Call, index: int, keyword: str) -> Optional[str]:
+    values = [kw.value for kw in call.keywords if kw.arg == keyword]
+    if len(call.args) > index:
+        values.append(call.args[index])
+    for value in values:
+        if isinstance(value, ast.Constant) and isinstance(value.value, str):
+            return value.value
+    return None
+
+
+def _item_arg(call: ast.Call) -> Optional[str]:
+    # alias(index=0) and alias(key="id") target items, as "[0]" and "['id']"
+    for kw in call.keywords:
+        if kw.arg in ("index", "key") and isinstance(kw.value, ast.Constant):
+            return f"[{kw.value.value!r}]"
+    return None
+
+
+def _is_alias_call(node: ast.expr) -> bool:
+    # alias(...) or aliasing.alias(...), but not <aliased>.alias(...)
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id == "alias"
+    return (
+        isinstance(func, ast.Attribute)
+        and func.attr == "alias"
+        and isinstance(func.value, ast.Name)
+        and func.value.id == "aliasing"
+    )
+
+
+def _is_aliased_alias(node: ast.expr) -> bool:
+    # <aliased>.alias, called or not
+    if isinstance(node, ast.Call):
+        node = node.func
+    return (
+        isinstance(node, ast.Attribute)
+        and node.attr == "alias"
+        and isinstance(node.value, ast.Name)
+        and node.value.id != "aliasing"
+    )
+
+
+class _Visitor(ast.NodeVisitor):
+    def __init__(self, path: str):
+        self.path = path
+        self.declarations: List[Declaration] = []
+        self.accesses: "Counter[str]" = Counter()
+        self._owners: List[str] = []
+        # module level `name = alias(...)`, waiting for `name.attach(...)`
+        self._detached: Dict[str, ast.Call] = {}
+
+    def _declare(self, owner: str, name: str, target: str, node: ast.AST):
+        line = getattr(node, "lineno", 0)
+        self.declarations.append(
+            Declaration(owner, name, target, self.path, line)
+        )
+
+    def _decorated(self, node: Any) -> None:
+        if not self._owners:
+            return
+        owner = self._owners[-1]
+        for decorator in node.decorator_list:
+            if _is_aliased_alias(decorator) and not isinstance(
+                decorator, ast.Call
+            ):
+                target = cast(ast.Name, decorator.value).id
+                self._declare(owner, node.name, target, node)
+            elif (
+                isinstance(decorator, ast.Call)
+                and _func_name(decorator.func) == "valiases"
+            ):
+                for arg in decorator.args:
+                    if isinstance(arg, ast.Constant) and isinstance(
+                        arg.value, str
+                    ):
+                        self._declare(owner, arg.value, node.name, node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self._decorated(node)
+        self._owners.append(node.name)
+        self.generic_visit(node)
+        self._owners.pop()
+
+    def visit_FunctionDef(self, node: Any) -> None:
+        self._decorated(node)
+        # aliases are class members, not locals of its methods
+        owners, self._owners = self._owners, []
+        self.generic_visit(node)
+        self._owners = owners
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        value = node.value
+        targets = [t.id for t in node.targets if isinstance(t, ast.Name)]
+        if self._owners and targets and isinstance(value, ast.Call):
+            owner = self._owners[-1]
+            if _is_alias_call(value):
+                target = _str_arg(value, 0, "alias_for") or _item_arg(value)
+                name = _str_arg(value, 1, "alias_name") or targets[0]
+                if target:
+                    self._declare(owner, name, target, node)
+            elif _is_aliased_alias(value):
+                aliased_ = cast(
+                    ast.Name, cast(ast.Attribute, value.func).value
+                )
+                name = _str_arg(value, 0, "member") or targets[0]
+                self._declare(owner, name, aliased_.id, node)
+        elif targets and _is_alias_call(value):
+            self._detached[targets[0]] = cast(ast.Call, value)
+        self.generic_visit(node)
+
+    def _attach(self, call: ast.Call) -> None:
+        func = call.func
+        if not (isinstance(func, ast.Attribute) and func.attr == "attach"):
+            return
+        alias_call: Optional[ast.expr] = func.value
+        if isinstance(alias_call, ast.Name):
+            alias_call = self._detached.get(alias_call.id)
+        if alias_call is None or not _is_alias_call(alias_call):
+            return
+        alias_call = cast(ast.Call, alias_call)
+        target = _str_arg(alias_call, 0, "alias_for")
+        name = _str_arg(call, 1, "name") or _str_arg(
+            alias_call, 1, "alias_name"
+        )
+        owner = _func_name(call.args[0]) if call.args else None
+        if target and name:
+            self._declare(owner or "?", name, target, call)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        self._attach(node)
+        if _func_name(node.func) in _DYNAMIC_ACCESS:
+            attr = _str_arg(node, 1, "name")
+            if attr:
+                self.accesses[attr] += 1
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        self.accesses[node.attr] += 1
+        self.generic_visit(node)
+
+
+def scan_source(source: str, path: str = "<string>") -> FileScan:
+    visitor = _Visitor(path)
+    visitor.visit(ast.parse(source, path))
+    return visitor.declarations, dict(visitor.accesses)
+
+
+def _scan_file(path: str) -> Tuple[str, Optional[FileScan]]:
+    try:
+        with open(path, "rb") as file:
+            source = file.read().decode("utf-8", errors="replace")
+        return path, scan_source(source, path)
+    except (OSError, SyntaxError, ValueError):
+        return path, None
+
+
+def iter_python_files(paths: Iterable[str]) -> Iterator[str]:
+    for path in paths:
+        if os.path.isfile(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            # skip hidden directories like .git and .venv
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            for file in sorted(files):
+                if file.endswith(".py"):
+                    yield os.path.join(root, file)
+
+
+def _digest(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as file:
+            return hashlib.sha1(file.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _load_cache(
+    cache_path: Optional[str],
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    # results by digest, and the digest last seen for each absolute path
+    if not cache_path:
+        return {}, {}
+    try:
+        with open(cache_path) as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        return {}, {}
+    if cache.get("version") != SCANNER_VERSION:
+        return {}, {}
+    return dict(cache.get("files", {})), dict(cache.get("paths", {}))
+
+
+def _save_cache(
+    cache_path: Optional[str], files: Dict[str, Any], paths: Dict[str, str]
+) -> None:
+    if not cache_path:
+        return
+    # runs over other paths share the cache, so only the results no
+    # existing file has anymore are dropped
+    paths = {
+        path: digest
+        for path, digest in paths.items()
+        if digest in files and os.path.exists(path)
+    }
+    live = set(paths.values())
+    files = {digest: files[digest] for digest in live}
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(
+            {"version": SCANNER_VERSION, "files": files, "paths": paths}, file
+        )
+    os.replace(tmp_path, cache_path)
+
+
+def scan(
+    paths: Iterable[str],
+    *,
+    jobs: Optional[int] = None,
+    cache_path: Optional[str] = DEFAULT_CACHE,
+) -> Dict[str, Any]:
+    """
+    report of the aliases declared under `paths`, per class, split into
+    used ones with their number of accesses and unused ones
+    """
+    cache, cached_paths = _load_cache(cache_path)
+    fresh: Dict[str, Any] = {}
+    digests: Dict[str, str] = {}
+    misses: List[str] = []
+    for path in iter_python_files(paths):
+        digest = _digest(path)
+        if digest is None:
+            continue
+        digests[path] = digest
+        if digest in cache:
+            fresh[digest] = cache[digest]
+        else:
+            misses.append(path)
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(misses) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunksize = max(1, len(misses) // (jobs * 4))
+            results = list(
+                executor.map(_scan_file, misses, chunksize=chunksize)
+            )
+    else:
+        results = list(map(_scan_file, misses))
+
+    errors = []
+    for path, result in results:
+        if result is None:
+            errors.append(path)
+            continue
+        declarations, accesses = result
+        # the same content may live under several paths
+        fresh[digests[path]] = [
+            [list(d[:3]) + [d.line] for d in declarations],
+            accesses,
+        ]
+    cached_paths.update(
+        (os.path.abspath(path), digest) for path, digest in digests.items()
+    )
+    _save_cache(cache_path, {**cache, **fresh}, cached_paths)
+
+    accesses_total: "Counter[str]" = Counter()
+    declared: List[Declaration] = []
+    for path, digest in digests.items():
+        if digest not in fresh:
+            continue
+        declarations, accesses = fresh[digest]
+        accesses_total.update(accesses)
+        declared.extend(
+            Declaration(owner, name, target, path, line)
+            for owner, name, target, line in declarations
+        )
+
+    classes: Dict[str, Dict[str, Any]] = {}
+    for declaration in declared:
+        key = f"{declaration.path}:{declaration.owner}"
+        report = classes.setdefault(key, {"used": {}, "unused": []})
+        count = accesses_total[declaration.name]
+        if count:
+            report["used"][declaration.name] = count
+        else:
+            report["unused"].append(declaration.name)
+
+    return {
+        "files": len(digests),
+        "parsed": len(misses),
+        "errors": errors,
+        "classes": classes,
+    }
+
+
+def format_report(report: Dict[str, Any], unused_only: bool = False) -> str:
+    lines = []
+    for owner, aliases in sorted(report["classes"].items()):
+        used = [] if unused_only else sorted(aliases["used"].items())
+        unused = sorted(aliases["unused"])
+        if not used and not unused:
+            continue
+        lines.append(owner)
+        lines.extend(f"  used    {name} ({count})" for name, count in used)
+        lines.extend(f"  unused  {name}" for name in unused)
+    lines.append(
+        f"{report['files']} files, {report['parsed']} parsed,"
+        f" {len(report['errors'])} errors"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m aliasing.scan",
+        description="report used and unused aliases per class",
+    )
+    parser.add_argument("paths", nargs="*", default=["."])
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--cache", default=DEFAULT_CACHE)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--unused-only", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = scan(
+        args.paths,
+        jobs=args.jobs,
+        cache_path=None if args.no_cache else args.cache,
+    )
+    if args.json:
+        print(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        print(format_report(report, unused_only=args.unused_only))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+from itertools import repeat
+from types import FunctionType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+from weakref import WeakKeyDictionary
+
+from . import core
+from .core import _attach_lock, _overrides, _static_member, aliased
+from .freeze import alias_index
+from .gather import _row_getter
+
+VIEWS = ("canonical", "alias", "all")
+
+# type -> (view, fields, overrides) -> (`core._revision_of`, plan), kept as
+# long as the type lives
+_plans: "WeakKeyDictionary[Type[Any], Dict[Tuple[Any, ...], _Built]]" = (
+    WeakKeyDictionary()
+)
+
+
+class SerializationPlan:
+    """
+    the ordered output keys of a class's serialized form, with one getter
+    reading all of their values at once, see `serialization_plan`
+    """
+
+    def __init__(
+        self, keys: Sequence[str], getter: Callable[[Any], Tuple[Any, ...]]
+    ):
+        self.keys: Tuple[str, ...] = tuple(keys)
+        self._getter = getter
+
+    def __repr__(self) -> str:
+        return f"<SerializationPlan {list(self.keys)}>"
+
+    def to_dict(self, obj: Any) -> Dict[str, Any]:
+        return dict(zip(self.keys, self._getter(obj)))
+
+    def to_dicts(self, objects: Iterable[Any]) -> List[Dict[str, Any]]:
+        # every step of this runs in C, no python code runs per object
+        return list(
+            map(dict, map(zip, repeat(self.keys), map(self._getter, objects)))
+        )
+
+
+_Built = Tuple[int, SerializationPlan]
+
+
+def _is_item(target: str) -> bool:
+    # the "[0]" and "['id']" targets of index and key aliases
+    return target.startswith("[")
+
+
+def _canonical(index: Dict[str, str], name: str) -> str:
+    # the end of the alias chain, or for items the alias reading the item,
+    # as they have no attribute of their own
+    seen = {name}
+    while name in index and not _is_item(index[name]):
+        name = index[name]
+        if name in seen:
+            break
+        seen.add(name)
+    return name
+
+
+def _is_data(member: Any) -> bool:
+    # methods aren't serialized, anything read as a value is
+    if isinstance(member, aliased):
+        member = member._func
+    return not isinstance(member, (FunctionType, staticmethod, classmethod))
+
+
+def _default_fields(cls: Type[Any], index: Dict[str, str]) -> List[str]:
+    fields: Dict[str, None] = {}
+    for base in reversed(cls.__mro__[:-1]):
+        fields.update(dict.fromkeys(getattr(base, "__annotations__", {})))
+        fields.update(
+            (name, None)
+            for name, member in vars(base).items()
+            if isinstance(member, aliased) and _is_data(member)
+        )
+    for name in index:
+        field = _canonical(index, name)
+        # import aliases target an import path, not a member
+        if field.isidentifier() and _is_data(_static_member(cls, field)):
+            fields[field] = None
+    return [
+        name
+        for name in fields
+        if not name.startswith("_")
+        and (name not in index or _is_item(index[name]))
+    ]
+
+
+def _keys(cls: Type[Any], fields: Sequence[str], view: str) -> List[str]:
+    index = alias_index(cls)
+    aliases: Dict[str, List[str]] = {}
+    for name in index:
+        field = _canonical(index, name)
+        if field != name:
+            aliases.setdefault(field, []).append(name)
+    keys = []
+    for field in fields:
+        names = aliases.get(field, [])
+        if view == "canonical" or not names:
+            keys.append(field)
+        elif view == "alias":
+            keys.append(names[0])
+        else:
+            keys.extend([field] + names)
+    return keys
+
+
+def _build_plan(
+    cls: Type[Any], view: str, fields: Optional[Sequence[str]]
+) -> SerializationPlan:
+    if view not in VIEWS:
+        raise ValueError(
+            f"unknown view {view!r}, expected any of {list(VIEWS)}"
+        )
+    if fields is None:
+        fields = _default_fields(cls, alias_index(cls))
+    keys = _keys(cls, fields, view)
+    if len(keys) == 1:
+        # a single name attrgetter returns the value rather than a tuple
+        single = _row_getter(cls, keys + keys)
+        return SerializationPlan(keys, lambda obj: single(obj)[:1])
+    return SerializationPlan(keys, _row_getter(cls, keys))
+
+
+def serialization_plan(
+    cls: Type[Any],
+    view: str = "canonical",
+    fields: Optional[Sequence[str]] = None,
+) -> SerializationPlan:
+    """
+    Usage:
+        plan = serialization_plan(Example, view="alias")
+        plan.to_dict(example)  # {"alias_name": example.name, ...}
+        plan.to_dicts(examples)
+
+    the serialization plan of `cls`, built once per `view`, `fields` and
+    the `override_aliases` in effect.
+    `fields` are the canonical names to serialize, by default the class's
+    annotations, its `aliased` members that aren't methods and the
+    members its aliases end at that aren't methods. `view` decides the
+    output keys:
+
+    - "canonical": each field under its own name
+    - "alias": each field with aliases under its first alias
+    - "all": each field under its own name and all of its aliases
+
+    values are read from the member each key's alias ends at, without
+    running the alias descriptors, in a single `operator.attrgetter` call
+    when every key is an attribute. Plans are built again when aliases were
+    attached, applied from a manifest or declared lazily since, but not
+    for members changed some other way
+    """
+    overrides = _overrides.get()
+    key = (
+        view,
+        None if fields is None else tuple(fields),
+        # the getters follow the overrides in effect, as reads would
+        None if overrides is None else tuple(sorted(overrides.items())),
+    )
+    per_type = _plans.get(cls)
+    built = per_type.get(key) if per_type is not None else None
+    if built is None or built[0] != core._revision_of(cls):
+        with _attach_lock:
+            per_type = _plans.setdefault(cls, {})
+            built = per_type.get(key)
+            revision = core._revision_of(cls)
+            if built is None or built[0] != revision:
+                built = per_type[key] = (
+                    revision,
+                    _build_plan(cls, view, fields),
+                )
+    return built[1]
+
+
+def serialize(
+    obj: Any,
+    view: str = "canonical",
+    fields: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """`obj` as a dict, see `serialization_plan`"""
+    return serialization_plan(type(obj), view, fields).to_dict(obj)
+
+
+def serialize_many(
+    objects: Iterable[Any],
+    view: str = "canonical",
+    fields: Optional[Sequence[str]] = None,
+) -> List[Dict[str, Any]]:
+    """each of `objects` as a dict, with one plan per type"""
+    if not isinstance(objects, (list, tuple)):
+        objects = list(objects)
+    types = set(map(type, objects))
+    if len(types) == 1:
+        return serialization_plan(types.pop(), view, fields).to_dicts(objects)
+    plans = {cls: serialization_plan(cls, view, fields) for cls in types}
+    return [plans[type(obj)].to_dict(obj) for obj in objects]
@@ -0,0 +1,40 @@
+import os
+from typing import Optional
+
+from . import core
+
+ENV_VAR = "ALIASING_TRUSTED"
+
+_TRUE = ("1", "true", "yes", "on")
+
+
+def _from_environ() -> bool:
+    return os.environ.get(ENV_VAR, "").strip().lower() in _TRUE
+
+
+def set_trusted(trusted: Optional[bool]) -> None:
+    """
+    Usage:
+        set_trusted(True)  # or ALIASING_TRUSTED=1 in the environment
+        import app  # its aliases are defined without validation
+
+    turns trusted mode on or off for the process, `None` goes back to the
+    `ALIASING_TRUSTED` environment variable, which is read when `aliasing`
+    is first imported.
+
+    in trusted mode, aliases defined or attached afterwards skip the checks
+    for trampling existing members, except for the members `valiases` keeps
+    on purpose, and `aliased` members don't list their aliases in their
+    docstrings. Reading an alias no longer looks for circular aliases up
+    front, only once reading it recursed. Meant for production, with the
+    aliases checked in CI by `python -m aliasing.validate` instead
+    """
+    core._trusted = _from_environ() if trusted is None else bool(trusted)
+
+
+def is_trusted() -> bool:
+    """whether trusted mode is on, see `set_trusted`"""
+    return core._trusted
+
+
+set_trusted(None)
@@ -0,0 +1,104 @@
+"""
+Checks the aliases of a codebase once, for processes that define them in
+trusted mode without checking them, see `set_trusted`.
+
+    python -m aliasing.validate package [package.module ...]
+
+Imports the given modules and every submodule of the given packages with
+trusted mode off, so defining their aliases raises for trampled members as
+usual, then checks every class they define for circular aliases. Exits
+non-zero when anything is wrong, which makes it a CI step.
+"""
+
+import argparse
+import importlib
+import pkgutil
+import sys
+from types import ModuleType
+from typing import Any, Iterator, List, Optional, Type
+
+from .freeze import alias_index
+from .trust import is_trusted, set_trusted
+
+
+def _modules(name: str, problems: List[str]) -> Iterator[ModuleType]:
+    try:
+        module = importlib.import_module(name)
+    except Exception as error:
+        problems.append(f"{name}: {type(error).__name__}: {error}")
+        return
+    yield module
+    path = getattr(module, "__path__", None)
+    if path is None:
+        return
+    for info in pkgutil.walk_packages(path, prefix=f"{name}."):
+        try:
+            yield importlib.import_module(info.name)
+        except Exception as error:
+            problems.append(f"{info.name}: {type(error).__name__}: {error}")
+
+
+def _classes(module: ModuleType) -> Iterator[Type[Any]]:
+    for value in list(vars(module).values()):
+        if isinstance(value, type) and value.__module__ == module.__name__:
+            yield value
+
+
+def _cycles(cls: Type[Any]) -> List[str]:
+    index = alias_index(cls)
+    problems = []
+    for alias_name in index:
+        name = alias_name
+        seen = {name}
+        while name in index:
+            name = index[name]
+            if name in seen:
+                problems.append(
+                    f"{cls.__module__}.{cls.__qualname__}: nested alias"
+                    f" {alias_name} references a circular alias"
+                )
+                break
+            seen.add(name)
+    return problems
+
+
+def validate(*module_names: str) -> List[str]:
+    """
+    Usage:
+        assert not validate("app")
+
+    the problems with the aliases of the modules named `module_names` and
+    the submodules of the packages among them, see `python -m
+    aliasing.validate`. Modules imported before it ran were defined without
+    it, so run it in a fresh process
+    """
+    trusted = is_trusted()
+    problems: List[str] = []
+    set_trusted(False)
+    try:
+        for module_name in module_names:
+            for module in _modules(module_name, problems):
+                for cls in _classes(module):
+                    problems.extend(_cycles(cls))
+    finally:
+        set_trusted(trusted)
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m aliasing.validate",
+        description="check the aliases of modules for production",
+    )
+    parser.add_argument("modules", nargs="+")
+    args = parser.parse_args(argv)
+
+    problems = validate(*args.modules)
+    for problem in problems:
+        print(problem)
+    print(f"{len(problems)} problems")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
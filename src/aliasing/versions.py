@@ -0,0 +1,82 @@
+import os
+from typing import Any, Optional, Tuple, Union
+
+Version = Union[str, int, Tuple[int, ...]]
+
+ENV_VAR = "ALIASING_API_VERSION"
+
+# the class attribute that pins the api version of a class and its subclasses
+CLASS_ATTR = "__alias_api_version__"
+
+_api_version: Optional[Tuple[int, ...]] = None
+
+
+def parse_version(version: Version) -> Tuple[int, ...]:
+    """`"1.2"`, `(1, 2)` and `1` style versions as comparable tuples"""
+    if isinstance(version, int):
+        parts: Tuple[int, ...] = (version,)
+    elif isinstance(version, str):
+        try:
+            parts = tuple(int(part) for part in version.strip().split("."))
+        except ValueError:
+            raise ValueError(
+                f"invalid api version {version!r}, expected something like"
+                " '1.2'"
+            ) from None
+    else:
+        parts = tuple(version)
+    # 1.2 and 1.2.0 are the same version
+    while len(parts) > 1 and parts[-1] == 0:
+        parts = parts[:-1]
+    return parts
+
+
+def set_api_version(version: Optional[Version]) -> None:
+    """
+    sets the api version of the process, overriding the
+    `ALIASING_API_VERSION` environment variable. `None` goes back to it.
+
+    only aliases declared or attached afterwards are affected
+    """
+    global _api_version
+    _api_version = None if version is None else parse_version(version)
+
+
+def api_version(owner: Any = None) -> Optional[Tuple[int, ...]]:
+    """
+    the api version aliases of `owner` are installed for: the class's
+    `__alias_api_version__`, else the one from `set_api_version`, else the
+    `ALIASING_API_VERSION` environment variable. `None` when there is none,
+    which installs every alias
+    """
+    version = getattr(owner, CLASS_ATTR, None)
+    if version is not None:
+        return parse_version(version)
+    if _api_version is not None:
+        return _api_version
+    environ_version = os.environ.get(ENV_VAR)
+    return parse_version(environ_version) if environ_version else None
+
+
+def is_active(
+    since: Optional[Tuple[int, ...]],
+    until: Optional[Tuple[int, ...]],
+    owner: Any = None,
+) -> bool:
+    """whether an alias added in `since` and removed in `until` is in use"""
+    if since is None and until is None:
+        return True
+    return in_range(since, until, api_version(owner))
+
+
+def in_range(
+    since: Optional[Tuple[int, ...]],
+    until: Optional[Tuple[int, ...]],
+    version: Optional[Tuple[int, ...]],
+) -> bool:
+    """`is_active` for an already resolved `api_version`"""
+    if version is None:
+        return True
+    return (since is None or since <= version) and (
+        until is None or version < until
+    )
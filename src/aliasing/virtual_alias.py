@@ -1,7 +1,10 @@
 import warnings
-from typing import List, Optional, Any
+from typing import List, Optional, Any, cast, Dict, Tuple, Union
 
-from .core import aliased
+from . import core
+from .core import alias, aliased, _attach_lock, _static_member
+from .lazy_alias import add_lazy
+from .versions import Version, is_active, parse_version
 from .error import TrampleAliasWarning, TrampleAliasError
 
 
@@ -11,48 +14,112 @@ class valiased(aliased):
 
     descriptor that adds the named aliases to the object
     during the __set_name__ phase
+
+    with `lazy=True` the aliases are only recorded in the owner's lookup
+    table, and each becomes an `alias` in the class dict on its first use
     """
 
     def __init__(
-        self, func: Any, *aliases: str, trample_ok: Optional[List[str]] = None
+        self,
+        func: Any,
+        *aliases: str,
+        trample_ok: Optional[List[str]] = None,
+        lazy: bool = False,
+        cache: Union[bool, int] = False,
+        since: Optional[Version] = None,
+        until: Optional[Version] = None,
     ):
-        super().__init__(func)
+        # names of the aliases kept in the owner's lazy table,
+        # mapped to whether they may trample
+        self._lazy_aliases: Dict[str, bool] = {}
+        super().__init__(func, cache=cache)
         trample_ok = trample_ok or []
+        self._since = None if since is None else parse_version(since)
+        self._until = None if until is None else parse_version(until)
+        if lazy:
+            self._lazy_aliases = {name: name in trample_ok for name in aliases}
+            if not core._trusted:
+                self._refresh_docs()
+            return
         self._aliases = list(
             map(
-                lambda name: self.alias(name, trample_ok=(name in trample_ok)),
+                lambda name: self.alias(
+                    name,
+                    trample_ok=(name in trample_ok),
+                    since=since,
+                    until=until,
+                ),
                 aliases,
             )
         )
 
+    def _alias_names(self) -> List[str]:
+        return super()._alias_names() + list(self._lazy_aliases)
+
     def __set_name__(self, owner: Any, name: str) -> None:
+        if not is_active(self._since, self._until, owner):
+            # none of the aliases exist in this api version
+            self._aliases.clear()
+            self._lazy_aliases.clear()
         super().__set_name__(owner, name)
-        is_warn = is_err = False
-        msg = ""
-        try:
-            warnings.filterwarnings("error", category=TrampleAliasWarning)
-            for alias in self._aliases:
-                try:
-                    alias.attach(owner)
-                except TrampleAliasWarning as w:
-                    msg = str(w.args[0]).replace(
-                        "Pass `trample_ok=False`",
-                        f"Remove '{alias._name}' from the "
-                        "`trample_ok` list parameter",
+        warn_msg = err_msg = ""
+        # check and bind under the attach lock rather than turning the
+        # trample warning into an error through the global warnings filters,
+        # which other threads share
+        candidates: List[Tuple[Optional[alias], str, bool]] = [
+            (alias_, cast(str, alias_._name), alias_._trample_ok)
+            for alias_ in self._aliases
+            # aliases in the class body
+            if vars(owner).get(cast(str, alias_._name)) is not alias_
+        ]
+        candidates += [
+            (None, alias_name, trample_ok)
+            for alias_name, trample_ok in self._lazy_aliases.items()
+        ]
+        trusted = core._trusted
+        # only used for the messages of lazy aliases
+        probe = None if trusted else alias(self._name)
+        lazy: Dict[str, str] = {}
+        with _attach_lock:
+            for alias_, alias_name, trample_ok in candidates:
+                if trusted:
+                    # validated already, but the members kept on purpose
+                    # below must still be kept. Like the trample check, look
+                    # in the class dicts before reading the member
+                    if trample_ok and (
+                        _static_member(owner, alias_name) is not None
+                        or hasattr(owner, alias_name)
+                    ):
+                        continue
+                else:
+                    msg = cast(alias, alias_ or probe)._trample_message(
+                        owner, alias_name, trample_ok=trample_ok
                     )
-                    is_warn = True
-                except TrampleAliasError as e:
-                    msg = str(e.args[0]).replace(
-                        "trample_ok=True",
-                        f"trample_ok=['{alias._name}']",
-                    )
-                    is_err = True
-        finally:
-            warnings.resetwarnings()
-        if is_warn:
-            warnings.warn(msg, category=TrampleAliasWarning)
-        if is_err:
-            raise TrampleAliasError(msg)
+                    if msg and trample_ok:
+                        warn_msg = msg.replace(
+                            "Pass `trample_ok=False`",
+                            f"Remove '{alias_name}' from the "
+                            "`trample_ok` list parameter",
+                        )
+                    elif msg:
+                        err_msg = msg.replace(
+                            "trample_ok=True",
+                            f"trample_ok=['{alias_name}']",
+                        )
+                    if msg:
+                        # trampled members are only reported, the existing
+                        # member is kept as it always has been for valiases
+                        continue
+                if alias_ is None:
+                    lazy[alias_name] = self._name
+                else:
+                    alias_._bind(owner, alias_name)
+            if lazy:
+                add_lazy(owner, lazy)
+        if warn_msg:
+            warnings.warn(warn_msg, category=TrampleAliasWarning)
+        if err_msg:
+            raise TrampleAliasError(err_msg)
 
 
 class valiases:
@@ -62,11 +129,37 @@ class valiases:
         def method(): ...
         ...
         assert method() == a()
+
+    `cache=<size>` memoizes the method per instance, see `aliased`
+
+    `since`/`until` are the api versions that added and removed the
+    aliases, which are only installed while the active api version is in
+    that range, see `set_api_version`
     """
 
-    def __init__(self, *aliases: str, trample_ok: Optional[List[str]] = None):
+    def __init__(
+        self,
+        *aliases: str,
+        trample_ok: Optional[List[str]] = None,
+        lazy: bool = False,
+        cache: Union[bool, int] = False,
+        since: Optional[Version] = None,
+        until: Optional[Version] = None,
+    ):
         self._aliases = aliases
         self._trample_ok = trample_ok
+        self._lazy = lazy
+        self._cache = cache
+        self._since = since
+        self._until = until
 
     def __call__(self, func: Any) -> valiased:
-        return valiased(func, *self._aliases, trample_ok=self._trample_ok)
+        return valiased(
+            func,
+            *self._aliases,
+            trample_ok=self._trample_ok,
+            lazy=self._lazy,
+            cache=self._cache,
+            since=self._since,
+            until=self._until,
+        )
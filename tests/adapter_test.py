@@ -0,0 +1,87 @@
+from collections import OrderedDict
+
+import pytest
+
+from aliasing import adapt, adapter_for, alias
+
+
+class Wrapped:
+    my_alias = alias("prop")
+
+    def __init__(self):
+        self.prop = "value"
+
+    def method(self):
+        return "method"
+
+
+def test_adapt_aliases():
+    wrapped = Wrapped()
+    view = adapt(wrapped, {"new_prop": "prop", "call": "method"})
+    assert view.new_prop == "value"
+    assert view.call() == "method"
+    assert view.__wrapped__ is wrapped
+
+
+def test_adapt_forwards_other_names():
+    view = adapt(Wrapped(), {"new_prop": "prop"})
+    assert view.prop == "value"
+    assert view.my_alias == "value"
+    with pytest.raises(AttributeError):
+        view.missing
+
+
+def test_adapt_no_copy():
+    wrapped = Wrapped()
+    view = adapt(wrapped, {"new_prop": "prop"})
+    wrapped.prop = "changed"
+    assert view.new_prop == "changed"
+
+
+def test_adapt_does_not_modify():
+    wrapped = Wrapped()
+    adapt(wrapped, {"new_prop": "prop"})
+    assert type(wrapped) is Wrapped
+    assert not hasattr(Wrapped, "new_prop")
+    assert not hasattr(wrapped, "new_prop")
+
+
+def test_adapt_read_only():
+    view = adapt(Wrapped(), {"new_prop": "prop"})
+    with pytest.raises(AttributeError):
+        view.new_prop = "value"
+
+
+def test_adapt_builtin():
+    view = adapt(OrderedDict(a=1), {"put": "__setitem__", "size": "__len__"})
+    view.put("b", 2)
+    assert view.size() == 2
+    assert view.__wrapped__ == {"a": 1, "b": 2}
+
+
+def test_adapt_different_views():
+    wrapped = Wrapped()
+    first = adapt(wrapped, {"first": "prop"})
+    second = adapt(wrapped, {"second": "prop"})
+    assert first.first == second.second
+    assert not hasattr(first, "second")
+
+
+def test_adapter_cached():
+    aliases = {"new_prop": "prop"}
+    adapter = adapter_for(Wrapped, aliases)
+    assert adapter is adapter_for(Wrapped, dict(aliases))
+    assert type(adapt(Wrapped(), aliases)) is adapter
+    assert adapter is not adapter_for(Wrapped, {"other": "prop"})
+    assert adapter is not adapter_for(dict, aliases)
+
+
+def test_adapter_dir_and_repr():
+    view = adapt(Wrapped(), {"new_prop": "prop"})
+    assert {"new_prop", "prop", "method"} <= set(dir(view))
+    assert repr(view).startswith("<WrappedAdapter of <")
+
+
+def test_adapter_wrapped_reserved():
+    with pytest.raises(ValueError):
+        adapt(Wrapped(), {"__wrapped__": "prop"})
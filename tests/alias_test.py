@@ -1,9 +1,15 @@
+import copy
+import datetime
+import pickle
+import threading
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 import pytest
 
 from aliasing import (
     alias,
+    cached_alias,
     CircularAliasError,
     TrampleAliasError,
     TrampleAliasWarning,
@@ -287,3 +293,245 @@ class TestCircAlias:
         with pytest.raises(CircularAliasError) as exc_info:
             p = instance.prop3
         assert exc_info.value.args[0] == self._err_message("prop3")
+
+
+class PickleTest:
+    def __init__(self, prop: str = "anything"):
+        self.prop = prop
+
+
+class PickleTuple(tuple):
+    pass
+
+
+class PickleDate(datetime.date):
+    pass
+
+
+def _attached_pickle_tester(prop: str = "anything") -> PickleTest:
+    instance = PickleTest(prop)
+    alias(PROP_NAME, "name1").attach(instance)
+    alias("name1", "name2").attach(instance)
+    return instance
+
+
+def _read_aliases(instance: PickleTest):
+    return instance.prop, instance.name1, instance.name2
+
+
+class TestAttachedPickle:
+    def test_pickle_round_trip(self):
+        instance = _attached_pickle_tester("pickled")
+        restored = pickle.loads(pickle.dumps(instance))
+        assert restored.prop == "pickled"
+        assert restored.name1 == "pickled"
+        assert restored.name2 == "pickled"
+        assert isinstance(restored, PickleTest)
+        assert type(restored).__base__ is PickleTest
+
+    def test_pickle_shares_rebuilt_class(self):
+        first = pickle.loads(pickle.dumps(_attached_pickle_tester()))
+        second = pickle.loads(pickle.dumps(_attached_pickle_tester()))
+        assert type(first) is type(second)
+        assert type(first) is not PickleTest
+
+    def test_pickle_attach_after_restore(self):
+        restored = pickle.loads(pickle.dumps(_attached_pickle_tester()))
+        other = pickle.loads(pickle.dumps(_attached_pickle_tester()))
+        alias(PROP_NAME, "name3").attach(restored)
+        assert restored.name3 == restored.prop
+        assert not hasattr(other, "name3")
+
+        again = pickle.loads(pickle.dumps(restored))
+        assert again.name3 == again.name1 == again.prop
+
+    def test_deepcopy(self):
+        instance = _attached_pickle_tester()
+        instance.prop = ["mutable"]
+        copied = copy.deepcopy(instance)
+        assert copied.name2 == ["mutable"]
+        assert copied.name2 is not instance.name2
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle_protocols(self, protocol):
+        instance = _attached_pickle_tester("pickled")
+        restored = pickle.loads(pickle.dumps(instance, protocol))
+        assert _read_aliases(restored) == ("pickled",) * 3
+
+    def test_builtin_subclasses_keep_their_reduction(self):
+        pair = PickleTuple((1, 2))
+        alias("count", "how_many").attach(pair)
+        day = PickleDate(2020, 1, 2)
+        alias("year", "yr").attach(day)
+        for instance in (pair, day):
+            for restored in (
+                pickle.loads(pickle.dumps(instance)),
+                copy.deepcopy(instance),
+                copy.copy(instance),
+            ):
+                assert restored == instance
+                assert type(restored).__base__ is type(instance).__base__
+        assert pickle.loads(pickle.dumps(pair)).how_many(1) == 1
+        assert copy.deepcopy(day).yr == 2020
+
+    def test_unhashable_signature(self):
+        pair = PickleTuple((1, 1))
+        # slices aren't hashable before python 3.12
+        alias("head", index=slice(0, 1)).attach(pair)
+        restored = pickle.loads(pickle.dumps(pair))
+        assert restored.head == (1,)
+        assert type(restored) is not type(pickle.loads(pickle.dumps(pair)))
+
+    def test_process_pool(self):
+        instances = [_attached_pickle_tester(str(i)) for i in range(3)]
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(_read_aliases, instances))
+        assert results == [(str(i),) * 3 for i in range(3)]
+
+
+class TestConcurrentAttach:
+    THREADS = 8
+    PER_THREAD = 25
+
+    def _run(self, owner):
+        barrier = threading.Barrier(self.THREADS)
+
+        def attach_all(thread: int):
+            barrier.wait()
+            for i in range(self.PER_THREAD):
+                alias(PROP_NAME, f"name_{thread}_{i}").attach(owner)
+
+        threads = [
+            threading.Thread(target=attach_all, args=(t,))
+            for t in range(self.THREADS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return [
+            f"name_{t}_{i}"
+            for t in range(self.THREADS)
+            for i in range(self.PER_THREAD)
+        ]
+
+    def test_concurrent_attach_to_instance(self):
+        instance = PickleTest("shared")
+        names = self._run(instance)
+        assert all(getattr(instance, name) == "shared" for name in names)
+        assert not hasattr(PickleTest, names[0])
+
+    def test_concurrent_attach_to_class(self):
+        class AliasAttachTest:
+            def __init__(self):
+                self.prop = "shared"
+
+        names = self._run(AliasAttachTest)
+        instance = AliasAttachTest()
+        assert all(getattr(instance, name) == "shared" for name in names)
+
+    def test_concurrent_attach_same_name(self):
+        class AliasAttachTest:
+            pass
+
+        barrier = threading.Barrier(self.THREADS)
+        errors = []
+
+        def attach():
+            barrier.wait()
+            try:
+                alias(PROP_NAME, "contested").attach(AliasAttachTest)
+            except TrampleAliasError as e:
+                errors.append(e)
+
+        threads = [
+            threading.Thread(target=attach) for _ in range(self.THREADS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(errors) == self.THREADS - 1
+
+
+def test_shared_alias_error_names_each_owner():
+    class First:
+        prop = "anything"
+
+    class Second:
+        prop = "anything"
+
+    shared = alias(PROP_NAME)
+    shared.attach(First, "first_name")
+    shared.attach(Second, "second_name")
+    with pytest.raises(NotImplementedError) as exc_info:
+        First().first_name = ""
+
+    assert exc_info.value.args[0] == (
+        "cannot set the value of read-only alias first_name"
+    )
+
+
+class TestCachedAlias:
+    @staticmethod
+    def _cached_tester():
+        class CachedAliasTester:
+            my_alias = alias(PROP_NAME, cache=True)
+
+            def __init__(self):
+                self.reads = 0
+
+            @property
+            def prop(self):
+                self.reads += 1
+                return "anything"
+
+        return CachedAliasTester
+
+    def test_cached_alias_type(self):
+        assert isinstance(alias(PROP_NAME, cache=True), cached_alias)
+        assert not isinstance(alias(PROP_NAME), cached_alias)
+
+    def test_variants_are_aliases(self):
+        for variant in (
+            alias(PROP_NAME, cache=True),
+            alias(index=0),
+        ):
+            assert isinstance(variant, alias)
+            assert issubclass(type(variant), alias)
+
+    def test_cached_alias_snapshots_value(self):
+        tester = self._cached_tester()()
+        assert tester.my_alias == "anything"
+        assert tester.my_alias == "anything"
+        assert vars(tester)["my_alias"] == "anything"
+        assert tester.reads == 1
+
+    def test_cached_alias_refresh(self):
+        tester = self._cached_tester()()
+        assert tester.my_alias == "anything"
+        del tester.my_alias
+        assert tester.my_alias == "anything"
+        assert tester.reads == 2
+
+    def test_cached_alias_class_level(self):
+        tester_cls = self._cached_tester()
+        assert tester_cls.my_alias is vars(tester_cls)[PROP_NAME]
+        assert isinstance(vars(tester_cls)["my_alias"], cached_alias)
+
+    def test_cached_alias_attach(self):
+        class AliasAttachTest:
+            def __init__(self):
+                self.prop = "anything"
+
+        instance = AliasAttachTest()
+        alias(PROP_NAME, "attached", cache=True).attach(AliasAttachTest)
+        assert instance.attached == "anything"
+        assert vars(instance)["attached"] == "anything"
+
+    def test_cached_alias_pickle(self):
+        instance = PickleTest("pickled")
+        alias(PROP_NAME, "cached", cache=True).attach(instance)
+        restored = pickle.loads(pickle.dumps(instance))
+        assert isinstance(vars(type(restored))["cached"], cached_alias)
+        assert restored.cached == "pickled"
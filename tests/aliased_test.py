@@ -1,8 +1,12 @@
+import copy
+import pickle
+from functools import cached_property
 from typing import List, Any
 
 import pytest
 
-from aliasing import alias, aliased
+from aliasing import alias, aliased, override_aliases, valiases
+from aliasing.example import Example
 
 PROP_NAME = "prop"
 
@@ -373,6 +377,16 @@ def test_aliased_aliased():
     assert AliasTest().method() == AliasTest().method2()
 
 
+def test_aliased_alias_keeps_its_name():
+    example = Example()
+    assert vars(Example)["my_alias"]._name == "my_alias"
+    with pytest.raises(NotImplementedError, match="alias my_alias$"):
+        example.my_alias = 1
+    with override_aliases(my_alias="method"):
+        assert example.my_alias() == "my method call"
+    assert example.my_aliased == 123
+
+
 def test_aliased_aliased_nontrivial():
     class AliasTest:
         @aliased
@@ -395,3 +409,151 @@ def test_returning_aliased_descriptor_object_from_cls():
     AliasTest.method = aliased(AliasTest.method)
 
     assert isinstance(AliasTest.method, aliased)
+
+
+class TestAliasedCachedProperty:
+    @staticmethod
+    def _cached_tester():
+        class CachedTester:
+            def __init__(self):
+                self.calls = 0
+
+            @aliased
+            @cached_property
+            def expensive(self):
+                self.calls += 1
+                return f"computed {self.calls}"
+
+            cheap = expensive.alias("cheap")
+
+            @valiases("first", "second")
+            @cached_property
+            def virtual(self):
+                self.calls += 1
+                return "virtual"
+
+        return CachedTester
+
+    def test_cached_property_named(self):
+        tester_cls = self._cached_tester()
+        tester = tester_cls()
+        assert tester.expensive == "computed 1"
+        assert tester.expensive == "computed 1"
+        assert tester.calls == 1
+
+    def test_cached_property_shared_by_aliases(self):
+        tester_cls = self._cached_tester()
+        tester = tester_cls()
+        assert tester.cheap == "computed 1"
+        assert tester.expensive == "computed 1"
+        assert tester.calls == 1
+
+    def test_cached_property_shared_by_virtual_aliases(self):
+        tester_cls = self._cached_tester()
+        tester = tester_cls()
+        assert tester.first == tester.second == tester.virtual == "virtual"
+        assert tester.calls == 1
+
+    def test_cached_property_per_instance(self):
+        tester_cls = self._cached_tester()
+        first, second = tester_cls(), tester_cls()
+        assert first.cheap == second.cheap == "computed 1"
+
+
+class MemoPickleTester:
+    def __init__(self):
+        self.calls = 0
+
+    @aliased(cache=True)
+    def square(self, x):
+        self.calls += 1
+        return x * x
+
+    sq = square.alias("sq")
+
+
+class TestAliasedMemoized:
+    @staticmethod
+    def _memo_tester():
+        class MemoTester:
+            def __init__(self):
+                self.calls = 0
+
+            @aliased(cache=2)
+            def square(self, x):
+                """squares x"""
+                self.calls += 1
+                return x * x
+
+            sq = square.alias("sq")
+
+            @valiases("first", "second", cache=True)
+            def virtual(self, x):
+                self.calls += 1
+                return x
+
+        return MemoTester
+
+    def test_memoized_shared_by_aliases(self):
+        tester = self._memo_tester()()
+        assert tester.square(3) == tester.sq(3) == 9
+        assert tester.calls == 1
+        info = tester.sq.cache_info()
+        assert (info.hits, info.misses, info.maxsize) == (1, 1, 2)
+        assert tester.sq is tester.square
+
+    def test_memoized_shared_by_virtual_aliases(self):
+        tester = self._memo_tester()()
+        assert tester.first(1) == tester.second(1) == tester.virtual(1) == 1
+        assert tester.calls == 1
+        assert tester.virtual.cache_info().maxsize == 128
+
+    def test_memoized_per_instance(self):
+        tester_cls = self._memo_tester()
+        first, second = tester_cls(), tester_cls()
+        first.square(2)
+        second.square(2)
+        assert first.calls == second.calls == 1
+        assert first.square.cache_info().currsize == 1
+
+    def test_memoized_lru_bound(self):
+        tester = self._memo_tester()()
+        for x in (1, 2, 3, 1):
+            tester.sq(x)
+        assert tester.calls == 4
+        assert tester.sq.cache_info().currsize == 2
+
+    def test_memoized_doc(self):
+        tester = self._memo_tester()()
+        assert tester.square.__doc__ == "(aliases sq)\nsquares x"
+        assert tester.square.__name__ == "square"
+
+    def test_memoized_does_not_keep_instance_alive(self):
+        import gc
+        import weakref
+
+        tester = self._memo_tester()()
+        tester.sq(1)
+        tester_ref = weakref.ref(tester)
+        del tester
+        gc.collect()
+        assert tester_ref() is None
+
+    def test_memoized_copies_get_their_own_cache(self):
+        tester = MemoPickleTester()
+        tester.square(3)
+        for copied in (
+            copy.copy(tester),
+            copy.deepcopy(tester),
+            pickle.loads(pickle.dumps(tester)),
+        ):
+            copied.calls = 10
+            assert copied.sq(3) == 9
+            assert copied.calls == 11
+            assert copied.square.cache_info().currsize == 1
+        assert tester.calls == 1
+        assert tester.square.cache_info().hits == 0
+
+    def test_memoized_negative_size(self):
+        with pytest.raises(ValueError):
+            aliased(lambda: None, cache=-1)
@@ -0,0 +1,120 @@
+import pytest
+
+from aliasing import alias, conventions, valiases, TrampleAliasError
+from aliasing.conventions import split_words
+
+
+def _conventions_tester():
+    @conventions("camel", "pascal", "screaming_snake", "kebab")
+    class ConventionsTester:
+        def __init__(self):
+            self.my_prop = "value"
+
+        def my_func(self):
+            return "foo"
+
+        def run(self):
+            return "bar"
+
+    return ConventionsTester
+
+
+def test_split_words():
+    assert split_words("my_func") == ["my", "func"]
+    assert split_words("myFunc") == ["my", "Func"]
+    assert split_words("HTTPServer2") == ["HTTP", "Server2"]
+    assert split_words("MY-FUNC") == ["MY", "FUNC"]
+
+
+def test_conventions_methods():
+    tester = _conventions_tester()()
+    assert tester.myFunc() == tester.my_func()
+    assert tester.MyFunc() == tester.my_func()
+    assert tester.MY_FUNC() == tester.my_func()
+    assert getattr(tester, "my-func")() == tester.my_func()
+    assert tester.Run() == tester.RUN() == tester.run()
+
+
+def test_conventions_index():
+    tester_cls = _conventions_tester()
+    assert vars(tester_cls)["_aliasing_lazy_table"] == {
+        "myFunc": "my_func",
+        "MyFunc": "my_func",
+        "MY_FUNC": "my_func",
+        "my-func": "my_func",
+        "Run": "run",
+        "RUN": "run",
+    }
+
+
+def test_conventions_no_descriptors():
+    tester_cls = _conventions_tester()
+    assert "myFunc" not in vars(tester_cls)
+    tester_cls().myFunc()
+    assert isinstance(vars(tester_cls)["myFunc"], alias)
+    assert "MyFunc" not in vars(tester_cls)
+
+
+def test_conventions_single_hook():
+    tester_cls = _conventions_tester()
+    names = {"myFunc", "MyFunc", "MY_FUNC", "my-func", "Run", "RUN"}
+    assert not names & set(vars(tester_cls))
+    plain = type("Plain", (), {})
+    assert set(vars(tester_cls)) - set(vars(plain)) - {
+        "__init__",
+        "my_func",
+        "run",
+    } == {"_aliasing_lazy_table", "__getattr__", "__dir__", "__init_subclass__"}
+    assert names <= set(dir(tester_cls()))
+
+
+def test_conventions_missing_attribute():
+    tester = _conventions_tester()()
+    with pytest.raises(AttributeError):
+        tester.myProp
+
+
+def test_conventions_with_valiases():
+    @conventions("camel", "pascal")
+    class ConventionsTester:
+        @valiases("MyFunc")
+        def my_func(self):
+            return "foo"
+
+    tester = ConventionsTester()
+    assert tester.MyFunc() == tester.myFunc() == "foo"
+
+
+def test_conventions_unknown():
+    with pytest.raises(ValueError):
+        conventions("hungarian")
+
+
+def test_conventions_conflicting_members():
+    with pytest.raises(TrampleAliasError) as exc_info:
+
+        @conventions("camel")
+        class ConventionsTester:
+            def my_func(self): ...
+
+            def myFunc(self): ...
+
+    assert exc_info.value.args[0] == (
+        "Owner class ConventionsTester already has member with name myFunc."
+        " Cannot use it as the conventional name for my_func."
+    )
+
+
+def test_conventions_conflicting_names():
+    with pytest.raises(TrampleAliasError) as exc_info:
+
+        @conventions("pascal")
+        class ConventionsTester:
+            def my_func(self): ...
+
+            def MY_FUNC(self): ...
+
+    assert exc_info.value.args[0] == (
+        "Owner class ConventionsTester members my_func and MY_FUNC"
+        " both have the conventional name MyFunc."
+    )
@@ -0,0 +1,480 @@
+"""
+Randomized differential tests of the optimized alias paths against the
+reference implementation.
+
+Each seed generates a class hierarchy with plain, cached, `aliased` and
+`valiases` aliases, an alias graph over its members with chains, cycles and
+missing targets, aliases attached to several classes and instances, and a
+sequence of reads, writes and further attaches. The scenario runs once
+through the reference implementation and once per mode, and every read
+must return the same value or raise the same exception. The modes are
+trusted mode, frozen classes, `gather`, aliases declared lazily, `aliased`
+and `valiases` methods memoized with `cache=True`, reads inside
+`override_aliases` blocks that override none of them, and serialization
+plans.
+
+    python -m tests.differential_test --seeds 10000
+"""
+
+import argparse
+import random
+import sys
+import warnings
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+from aliasing import (
+    alias,
+    aliased,
+    cached_alias,
+    freeze,
+    gather,
+    override_aliases,
+    serialization_plan,
+    set_trusted,
+    valiases,
+)
+from aliasing.core import _alias_base, _static_member
+from aliasing.lazy_alias import add_lazy
+
+METHODS = ["m0", "m1", "m2"]
+ATTRIBUTES = ["a0", "a1", "a2"]
+VALUES = ["v0"]
+ALIASES = ["x0", "x1", "x2", "x3", "x4", "x5"]
+MISSING = ["nope"]
+NAMES = METHODS + ATTRIBUTES + VALUES + ALIASES + MISSING
+
+Outcome = Tuple[Any, ...]
+
+
+def _scenario(seed: int) -> Dict[str, Any]:
+    # plain data, so every mode builds its own classes from it
+    rng = random.Random(seed)
+    classes = []
+    for index in range(rng.randint(1, 3)):
+        base = rng.choice([None] + list(range(index)))
+        members: Dict[str, Tuple[Any, ...]] = {}
+        free = list(ALIASES)
+        rng.shuffle(free)
+        for name in rng.sample(METHODS, rng.randint(0, 2)):
+            kind = rng.choice(["method", "aliased", "valiased"])
+            names = [free.pop() for _ in range(rng.randint(0, 2))]
+            # valiases keep the members these trample
+            trample_ok = [n for n in names if rng.random() < 0.3]
+            members[name] = (kind, f"{name}@{index}", names, trample_ok)
+        for name in rng.sample(VALUES, rng.randint(0, 1)):
+            members[name] = ("value", f"{name}@{index}")
+        for _ in range(min(rng.randint(0, 4), len(free))):
+            members[free.pop()] = (
+                "alias",
+                rng.choice(NAMES),
+                rng.random() < 0.2,
+            )
+        classes.append({"base": base, "members": members})
+
+    objects = [rng.randrange(len(classes)) for _ in range(rng.randint(1, 3))]
+    ops: List[Tuple[Any, ...]] = []
+    for _ in range(rng.randint(5, 30)):
+        roll = rng.random()
+        if roll < 0.55:
+            ops.append(("get", rng.randrange(len(objects)), rng.choice(NAMES)))
+        elif roll < 0.7:
+            ops.append(
+                ("class_get", rng.randrange(len(classes)), rng.choice(NAMES))
+            )
+        elif roll < 0.85:
+            ops.append(
+                (
+                    "set",
+                    rng.randrange(len(objects)),
+                    rng.choice(ATTRIBUTES + ALIASES[:2]),
+                    rng.randrange(100),
+                )
+            )
+        else:
+            # one alias object attached to several owners
+            owners = [
+                (
+                    rng.choice(["class", "instance"]),
+                    rng.randrange(len(classes)),
+                    rng.randrange(len(objects)),
+                    rng.choice(ALIASES),
+                    rng.random() < 0.3,
+                )
+                for _ in range(rng.randint(1, 3))
+            ]
+            ops.append(("attach", rng.choice(NAMES), owners))
+    return {"classes": classes, "objects": objects, "ops": ops}
+
+
+def _method(tag: str) -> Any:
+    def method(self: Any) -> str:
+        return tag
+
+    method.__name__ = tag.partition("@")[0]
+    return method
+
+
+def _build(
+    scenario: Dict[str, Any], lazy: bool = False, cache: bool = False
+) -> Tuple[List[type], List[Any]]:
+    classes: List[type] = []
+    for index, spec in enumerate(scenario["classes"]):
+        namespace: Dict[str, Any] = {}
+        # plain aliases added to the finished class when `lazy`
+        table: Dict[str, str] = {}
+        for name, member in spec["members"].items():
+            kind = member[0]
+            if kind == "alias":
+                _, target, cache = member
+                if lazy and not cache:
+                    table[name] = target
+                else:
+                    namespace[name] = alias(target, cache=cache)
+            elif kind == "value":
+                namespace[name] = member[1]
+            elif kind == "method":
+                namespace[name] = _method(member[1])
+            elif kind == "aliased":
+                method = aliased(_method(member[1]), cache=cache)
+                namespace[name] = method
+                for alias_name in member[2]:
+                    namespace[alias_name] = method.alias(alias_name)
+            else:
+                namespace[name] = valiases(
+                    *member[2], trample_ok=member[3], lazy=lazy, cache=cache
+                )(_method(member[1]))
+
+        def __init__(self: Any) -> None:
+            for attribute in ATTRIBUTES:
+                setattr(self, attribute, attribute)
+
+        namespace["__init__"] = __init__
+        base = spec["base"]
+        bases = (object,) if base is None else (classes[base],)
+        classes.append(type(f"C{index}", bases, namespace))
+        if table:
+            add_lazy(classes[-1], table)
+    objects = [classes[index]() for index in scenario["objects"]]
+    return classes, objects
+
+
+def _value(value: Any) -> Outcome:
+    if isinstance(value, _alias_base):
+        # class level reads of aliases without a class level target
+        return ("alias", value._for)
+    if callable(value) and not isinstance(value, type):
+        try:
+            return ("call", value())
+        except TypeError:
+            # functions read at class level
+            return ("function", getattr(value, "__name__", None))
+    return ("value", value)
+
+
+def _error(error: BaseException) -> Outcome:
+    if isinstance(error, RuntimeError) and error.__cause__ is not None:
+        # errors in __set_name__ before python 3.12
+        error = error.__cause__
+    # the reference only finds cycles within a single class dict and
+    # recurses for cycles across classes, so both count as circular
+    if isinstance(error, RecursionError):
+        return ("error", "circular", None)
+    name = type(error).__name__
+    if name == "CircularAliasError":
+        return ("error", "circular", str(error))
+    return ("error", name, str(error))
+
+
+class Mode:
+    """the reference implementation, and the base of the optimized modes"""
+
+    name = "reference"
+    # whether trample warnings are part of the outcome
+    warns = True
+    # whether a CircularAliasError must name the same alias
+    exact_cycles = True
+    # whether plain aliases and `valiases` are declared lazily
+    lazy = False
+    # whether `aliased` and `valiases` methods are memoized
+    cache = False
+
+    def accepts(self, op: Tuple[Any, ...]) -> bool:
+        return True
+
+    @contextmanager
+    def active(self) -> Iterator[None]:
+        yield
+
+    def prepare(self, classes: List[type], objects: List[Any]) -> None:
+        pass
+
+    def read(self, obj: Any, name: str) -> Any:
+        return getattr(obj, name)
+
+
+class Trusted(Mode):
+    name = "trusted"
+    # trusted mode only runs code that validated, and skips the warnings
+    warns = False
+
+    @contextmanager
+    def active(self) -> Iterator[None]:
+        set_trusted(True)
+        try:
+            yield
+        finally:
+            set_trusted(None)
+
+
+class Frozen(Mode):
+    name = "frozen"
+    # aliases only look for cycles among the aliases in the class dict of
+    # the instance, which freezing changes
+    exact_cycles = False
+
+    def accepts(self, op: Tuple[Any, ...]) -> bool:
+        # frozen aliases of methods are plain functions, which can be
+        # assigned over and read at class level, unlike aliases
+        return op[0] == "get" or (op[0] == "set" and op[2] in ATTRIBUTES)
+
+    def prepare(self, classes: List[type], objects: List[Any]) -> None:
+        for cls in classes:
+            freeze(cls)
+
+
+class Gathered(Mode):
+    name = "gather"
+    # gather resolves the whole chain up front, and names the alias that
+    # closes the cycle rather than the one that noticed it
+    exact_cycles = False
+
+    def read(self, obj: Any, name: str) -> Any:
+        return gather([obj], name)[0]
+
+
+class Lazy(Mode):
+    name = "lazy"
+    lazy = True
+    # a lazy alias only checks for cycles once it is materialized, so the
+    # first alias in the cycle still pending names it
+    exact_cycles = False
+
+    def accepts(self, op: Tuple[Any, ...]) -> bool:
+        # only instances reach lazy aliases that weren't read yet, and
+        # writes don't materialize them
+        return op[0] not in ("class_get", "set") or (
+            op[0] == "set" and op[2] in ATTRIBUTES
+        )
+
+
+class Memoized(Mode):
+    name = "memoized"
+    cache = True
+
+
+class Overridden(Mode):
+    # overrides active that name none of the aliases
+    def __init__(self, name: str, targets: Dict[str, str]):
+        self.name = name
+        self._targets = targets
+
+    @contextmanager
+    def active(self) -> Iterator[None]:
+        with override_aliases(self._targets):
+            yield
+
+
+class Serialized(Gathered):
+    name = "serialize"
+
+    def read(self, obj: Any, name: str) -> Any:
+        # plans are cached per class, across the writes and attaches
+        return serialization_plan(type(obj), fields=[name]).to_dict(obj)[name]
+
+
+MODES = [
+    Trusted(),
+    Frozen(),
+    Gathered(),
+    Lazy(),
+    Memoized(),
+    Overridden("no override", {}),
+    Overridden("other override", {"unrelated": METHODS[0]}),
+    Serialized(),
+]
+
+
+def _attach(
+    op: Tuple[Any, ...], classes: List[type], objects: List[Any]
+) -> None:
+    _, target, owners = op
+    shared = alias(target)
+    for kind, cls_index, obj_index, name, trample_ok in owners:
+        owner = classes[cls_index] if kind == "class" else objects[obj_index]
+        shared.attach(owner, name, trample_ok=trample_ok)
+
+
+def _step(
+    mode: Mode, op: Tuple[Any, ...], classes: List[type], objects: List[Any]
+) -> Outcome:
+    kind = op[0]
+    if kind == "get":
+        return _value(mode.read(objects[op[1]], op[2]))
+    if kind == "class_get":
+        return _value(getattr(classes[op[1]], op[2]))
+    if kind == "set":
+        setattr(objects[op[1]], op[2], op[3])
+        return ("set",)
+    _attach(op, classes, objects)
+    return ("attached",)
+
+
+def run(scenario: Dict[str, Any], mode: Mode) -> List[Outcome]:
+    """
+    the outcome of every operation of `scenario` that `mode` accepts, or
+    only the error building its classes raised
+    """
+    outcomes: List[Outcome] = []
+    with mode.active(), warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            classes, objects = _build(scenario, mode.lazy, mode.cache)
+            mode.prepare(classes, objects)
+        except Exception as error:
+            return [("build",) + _error(error)]
+        for op in scenario["ops"]:
+            if not mode.accepts(op):
+                continue
+            del caught[:]
+            try:
+                outcome = _step(mode, op, classes, objects)
+            except Exception as error:
+                outcome = _error(error)
+                if outcome[1] == "circular" and op[0] == "get":
+                    outcome += _shadowed(objects[op[1]])
+            if mode.warns:
+                outcome += tuple(
+                    (w.category.__name__, str(w.message)) for w in caught
+                )
+            outcomes.append(outcome)
+    return outcomes
+
+
+def _shadowed(obj: Any) -> Outcome:
+    # the reference looks for cycles in the classes only, so it also
+    # raises for the cycles that a value of a cached alias in the instance
+    # dict ends, which reading the attributes one by one never runs into
+    cls = type(obj)
+    for name in vars(obj):
+        if isinstance(_static_member(cls, name), cached_alias):
+            return ("shadowed",)
+    return ()
+
+
+class _Reference(Mode):
+    # the reference, run on the operations `mode` accepts and compared the
+    # way `mode` is
+    def __init__(self, mode: Mode):
+        self._mode = mode
+        self.warns = mode.warns
+        self.exact_cycles = mode.exact_cycles
+        self.lazy = False
+        self.cache = False
+
+    def accepts(self, op: Tuple[Any, ...]) -> bool:
+        return self._mode.accepts(op)
+
+
+def _matches(mode: Mode, expected: Outcome, actual: Outcome) -> bool:
+    if expected[3:4] == ("shadowed",):
+        return True
+    start = 1 if expected[:1] == ("build",) else 0
+    circular = ("error", "circular")
+    if expected[start : start + 2] == actual[start : start + 2] == circular:
+        # a RecursionError has no message to compare
+        messages = (expected[start + 2], actual[start + 2])
+        return not mode.exact_cycles or None in messages or (
+            expected == actual
+        )
+    return expected == actual
+
+
+def _validated(ops: List[Any], outcomes: List[Outcome]) -> bool:
+    # what `python -m aliasing.validate` lets through: building and
+    # attaching raised nothing, which also covers the trample checks
+    # reading an alias they'd trample that is circular
+    if outcomes and outcomes[0][0] == "build":
+        return False
+    return not any(
+        op[0] == "attach" and outcome[0] == "error"
+        for op, outcome in zip(ops, outcomes)
+    )
+
+
+def check(seed: int, mode: Mode) -> Optional[str]:
+    """
+    how `mode` diverges from the reference for the scenario of `seed`, or
+    None when it doesn't
+    """
+    scenario = _scenario(seed)
+    reference = run(scenario, _Reference(mode))
+    ops = [op for op in scenario["ops"] if mode.accepts(op)]
+    if reference and reference[0][0] == "build":
+        ops = [("build",)]
+    if isinstance(mode, Trusted) and not _validated(ops, reference):
+        # trampling members is what trusted mode doesn't check for
+        return None
+    actual = run(scenario, mode)
+    if isinstance(mode, Frozen) and actual and actual[0][:3] == (
+        "build",
+        "error",
+        "circular",
+    ):
+        # freezing finds the cycles that reading would find
+        return None
+    for op, expected, got in zip(ops, reference, actual):
+        if not _matches(mode, expected, got):
+            return (
+                f"seed {seed}, mode {mode.name}, {op}: expected {expected},"
+                f" got {got}"
+            )
+    if len(reference) != len(actual):
+        return (
+            f"seed {seed}, mode {mode.name}: expected {reference}, got"
+            f" {actual}"
+        )
+    return None
+
+
+@pytest.mark.parametrize("mode", MODES, ids=lambda mode: mode.name)
+@pytest.mark.parametrize("seed", range(500))
+def test_matches_reference(seed: int, mode: Mode) -> None:
+    divergence = check(seed, mode)
+    assert divergence is None, divergence
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.differential_test",
+        description="compare the optimized alias paths to the reference",
+    )
+    parser.add_argument("--seeds", type=int, default=1000)
+    parser.add_argument("--start", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for seed in range(args.start, args.start + args.seeds):
+        for mode in MODES:
+            divergence = check(seed, mode)
+            if divergence:
+                failures += 1
+                print(divergence)
+    print(f"{args.seeds} seeds, {len(MODES)} modes, {failures} divergences")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+import pytest
+
+from aliasing import (
+    CircularAliasError,
+    alias,
+    alias_index,
+    aliased,
+    conventions,
+    freeze,
+    resolve_prefix,
+    valiases,
+)
+
+
+def _make_class():
+    class Frozen:
+        attr = alias("prop")
+        attr_of_attr = alias("attr")
+        class_value = 1
+        value_alias = alias("class_value")
+
+        def __init__(self):
+            self.prop = "prop"
+
+        @aliased
+        def method(self):
+            """does things"""
+            return "method"
+
+        other = method.alias("other")
+        other_of_other = alias("other")
+
+        @valiases("first", "second")
+        def virtual(self):
+            return "virtual"
+
+        @valiases("lazy_one", lazy=True)
+        def lazy_target(self):
+            return "lazy"
+
+        @property
+        def computed(self):
+            return "computed"
+
+        computed_alias = alias("computed")
+
+        @staticmethod
+        @aliased
+        def static():
+            return "static"
+
+        @aliased(cache=True)
+        def memoized(self, x):
+            return x
+
+        memo_alias = memoized.alias("memo_alias")
+
+    return Frozen
+
+
+def test_freeze_binds_methods_directly():
+    cls = freeze(_make_class())
+    namespace = vars(cls)
+    assert namespace["other"] is namespace["method"]
+    assert namespace["other_of_other"] is namespace["method"]
+    assert namespace["first"] is namespace["second"] is namespace["virtual"]
+    assert namespace["value_alias"] == 1
+    assert namespace["lazy_one"] is namespace["lazy_target"]
+    instance = cls()
+    assert instance.other() == instance.method() == "method"
+    assert instance.first() == "virtual"
+    assert instance.lazy_one() == "lazy"
+
+
+def test_freeze_instance_attributes():
+    instance = freeze(_make_class())()
+    assert instance.attr == instance.attr_of_attr == "prop"
+    assert instance.computed_alias == "computed"
+    instance.prop = "changed"
+    assert instance.attr_of_attr == "changed"
+    with pytest.raises(NotImplementedError):
+        instance.attr = "value"
+
+
+def test_freeze_keeps_memoized():
+    instance = freeze(_make_class())()
+    assert instance.memo_alias(1) == instance.memoized(1) == 1
+    assert instance.memoized.cache_info().hits == 1
+
+
+def test_freeze_alias_index():
+    cls = _make_class()
+    before = alias_index(cls)
+    assert before["other_of_other"] == "other"
+    assert before["lazy_one"] == "lazy_target"
+    assert alias_index(freeze(cls)) == before
+
+
+def test_freeze_idempotent():
+    cls = freeze(freeze(_make_class()))
+    assert cls().other_of_other() == "method"
+    assert alias_index(cls)["other_of_other"] == "other"
+
+
+def test_freeze_decorator():
+    @freeze
+    class Decorated:
+        @aliased
+        def method(self):
+            return "method"
+
+        other = method.alias("other")
+
+    assert vars(Decorated)["other"] is vars(Decorated)["method"]
+
+
+def test_freeze_subclass():
+    base = freeze(_make_class())
+
+    class Sub(base):
+        def method(self):
+            return "sub"
+
+    # frozen in the base, so the base's method
+    assert Sub().other() == "method"
+    freeze(Sub)
+    assert Sub().other() == Sub().other_of_other() == "sub"
+    assert alias_index(Sub)["other"] == "method"
+
+
+def test_freeze_subclass_relinks_through_cached_alias():
+    class Base:
+        first = alias("second")
+        second = alias("value")
+
+        def __init__(self):
+            self.value = "value"
+            self.other = "other"
+
+    freeze(Base)
+
+    class Sub(Base):
+        second = alias("other", cache=True)
+
+    freeze(Sub)
+    # the base bound first to value, but Sub's second leads elsewhere
+    assert Sub().first == "other"
+    assert Base().first == "value"
+
+
+def test_freeze_circular():
+    class Circular:
+        first = alias("second")
+        second = alias("first")
+
+    with pytest.raises(CircularAliasError):
+        freeze(Circular)
+
+
+def test_freeze_prefix_and_conventions():
+    @conventions("camel")
+    class Named:
+        @valiases("cfg")
+        def my_config(self):
+            return "config"
+
+    freeze(Named)
+    assert Named().myConfig() == "config"
+    assert resolve_prefix(Named, "cf") == "my_config"
+    assert resolve_prefix(Named, "myC") == "my_config"
@@ -0,0 +1,140 @@
+from array import array
+
+import pytest
+
+from aliasing import alias, gather, import_alias, CircularAliasError
+
+
+class Row:
+    my_alias = alias("value")
+    chained = alias("my_alias")
+    other = alias("label")
+
+    def __init__(self, value, label=""):
+        self.value = value
+        self.label = label
+
+
+class SlotRow:
+    __slots__ = ("value", "label")
+    my_alias = alias("value")
+
+    def __init__(self, value):
+        self.value = value
+        self.label = "slot"
+
+
+def _rows(count=5):
+    return [Row(i, f"row {i}") for i in range(count)]
+
+
+def test_alias_gather():
+    rows = _rows()
+    assert vars(Row)["my_alias"].gather(rows) == [r.my_alias for r in rows]
+
+
+def test_alias_gather_iterator():
+    assert vars(Row)["my_alias"].gather(iter(_rows(3))) == [0, 1, 2]
+
+
+def test_alias_gather_chain():
+    rows = _rows()
+    assert vars(Row)["chained"].gather(rows) == [0, 1, 2, 3, 4]
+
+
+def test_alias_gather_out_list():
+    out = [None] * 5
+    result = vars(Row)["my_alias"].gather(_rows(), out=out)
+    assert result is out and out == [0, 1, 2, 3, 4]
+
+
+def test_alias_gather_out_array():
+    out = array("q", [0] * 5)
+    vars(Row)["my_alias"].gather(_rows(), out=out)
+    assert out.tolist() == [0, 1, 2, 3, 4]
+
+
+def test_alias_gather_out_in_place():
+    # resizing would raise while a buffer is exported
+    out = array("q", [0] * 3000)
+    view = memoryview(out)
+    vars(Row)["my_alias"].gather(_rows(3000), out=out)
+    assert view.tolist() == list(range(3000))
+
+
+@pytest.mark.parametrize("size", [0, 3, 5, 2000])
+def test_alias_gather_out_resized(size):
+    for out in ([None] * size, array("q", [7] * size)):
+        vars(Row)["my_alias"].gather(_rows(), out=out)
+        assert list(out) == [0, 1, 2, 3, 4]
+
+
+def test_alias_gather_mixed_types():
+    rows = [Row(1), SlotRow(2), Row(3)]
+    shared = alias("value", "shared")
+    shared.attach(Row)
+    shared.attach(SlotRow)
+    assert shared.gather(rows) == [1, 2, 3]
+    del Row.shared, SlotRow.shared
+
+
+def test_alias_gather_circular():
+    class CircularRow:
+        first = alias("second")
+        second = alias("first")
+
+    with pytest.raises(CircularAliasError):
+        vars(CircularRow)["first"].gather([CircularRow()])
+
+
+def test_gather_import_alias():
+    class ImportRow:
+        join = import_alias("os.path:join")
+
+    joins = gather([ImportRow(), ImportRow()], "join")
+    assert joins == [__import__("os").path.join] * 2
+
+
+def test_gather_cached_snapshots():
+    class Cached:
+        snapshot = alias("value", cache=True)
+        chained = alias("snapshot")
+
+        def __init__(self, value):
+            self.value = value
+
+    rows = [Cached(i) for i in range(3)]
+    assert gather(rows, "snapshot") == [0, 1, 2]
+    for row in rows:
+        row.value += 10
+    # the snapshot is read, like reading the alias would
+    assert gather(rows, "snapshot", "chained") == [(0, 0), (1, 1), (2, 2)]
+
+
+def test_gather_names():
+    rows = _rows(3)
+    assert gather(rows, "chained") == [0, 1, 2]
+    assert gather(rows, "value") == [0, 1, 2]
+
+
+def test_gather_rows():
+    rows = _rows(2)
+    assert gather(rows, "my_alias", "other") == [(0, "row 0"), (1, "row 1")]
+
+
+def test_gather_columns():
+    rows = _rows(2)
+    assert gather(rows, "my_alias", "other", columns=True) == [
+        [0, 1],
+        ["row 0", "row 1"],
+    ]
+
+
+def test_gather_rows_mixed():
+    rows = [Row(1, "a"), SlotRow(2)]
+    assert gather(rows, "my_alias", "label") == [(1, "a"), (2, "slot")]
+
+
+def test_gather_no_names():
+    with pytest.raises(ValueError):
+        gather(_rows())
@@ -0,0 +1,118 @@
+import sys
+import textwrap
+
+import pytest
+
+from aliasing import alias, import_alias, import_aliases, TrampleAliasError
+from aliasing.import_alias import resolve_import
+
+PACKAGE = "aliasing_lazy_pkg"
+
+
+@pytest.fixture
+def lazy_package(tmp_path, monkeypatch):
+    package = tmp_path / PACKAGE
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        textwrap.dedent(
+            f"""
+            from aliasing import import_alias, import_aliases
+
+            import_aliases(
+                __name__,
+                old_func="{PACKAGE}.heavy:new_func",
+                heavy_module="{PACKAGE}.heavy",
+            )
+
+
+            class Api:
+                old_func = import_alias("{PACKAGE}.heavy:new_func")
+                other = import_alias("{PACKAGE}.other:Thing.value")
+            """
+        )
+    )
+    (package / "heavy.py").write_text(
+        "def new_func():\n    return 'heavy'\n"
+    )
+    (package / "other.py").write_text(
+        "class Thing:\n    value = 'other'\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    for name in list(sys.modules):
+        if name.startswith(PACKAGE):
+            del sys.modules[name]
+
+
+def _loaded(module: str) -> bool:
+    return f"{PACKAGE}.{module}" in sys.modules
+
+
+def test_resolve_import():
+    assert resolve_import("os.path:join") is __import__("os").path.join
+    assert resolve_import("os.path") is sys.modules["os.path"]
+
+
+def test_import_does_not_load_targets(lazy_package):
+    __import__(PACKAGE)
+    assert not _loaded("heavy")
+    assert not _loaded("other")
+
+
+def test_class_alias_loads_on_access(lazy_package):
+    package = __import__(PACKAGE)
+    api = package.Api()
+    assert not _loaded("heavy")
+    assert api.old_func() == "heavy"
+    assert _loaded("heavy")
+    assert not _loaded("other")
+    assert package.Api.other == "other"
+
+
+def test_class_alias_caches(lazy_package):
+    package = __import__(PACKAGE)
+    alias_obj = vars(package.Api)["old_func"]
+    first = package.Api.old_func
+    assert alias_obj._value is first
+    assert package.Api().old_func is first
+
+
+def test_class_alias_read_only(lazy_package):
+    package = __import__(PACKAGE)
+    with pytest.raises(NotImplementedError):
+        package.Api().old_func = None
+
+
+def test_module_alias_loads_on_access(lazy_package):
+    package = __import__(PACKAGE)
+    assert "old_func" in dir(package)
+    assert not _loaded("heavy")
+    assert package.old_func() == "heavy"
+    assert _loaded("heavy")
+    # replaced by the object itself after the first access
+    assert vars(package)["old_func"] is sys.modules[f"{PACKAGE}.heavy"].new_func
+    assert package.heavy_module is sys.modules[f"{PACKAGE}.heavy"]
+
+
+def test_module_alias_missing(lazy_package):
+    package = __import__(PACKAGE)
+    with pytest.raises(AttributeError):
+        package.not_an_alias
+
+
+def test_module_alias_trample(lazy_package):
+    __import__(PACKAGE)
+    with pytest.raises(TrampleAliasError):
+        import_aliases(PACKAGE, Api="os:path")
+
+
+def test_import_alias_attach():
+    class AttachTest:
+        pass
+
+    import_alias("os.path:join", "join").attach(AttachTest)
+    assert AttachTest().join is sys.modules["os.path"].join
+
+
+def test_import_alias_is_alias():
+    assert isinstance(import_alias("os.path:join"), alias)
@@ -0,0 +1,114 @@
+import pickle
+from typing import NamedTuple
+
+import pytest
+
+from aliasing import alias, alias_index, freeze, gather, item_alias
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+    horizontal = alias(index=0)
+    last = alias(index=-1)
+    first = alias("horizontal")
+
+
+class Pair(tuple):
+    left = alias(index=0)
+    right = alias(index=1)
+
+
+class Record(dict):
+    ident = alias(key="id")
+
+
+def test_item_alias_type():
+    assert isinstance(vars(Pair)["left"], item_alias)
+    with pytest.raises(TypeError):
+        alias(index=0, key="id")
+
+
+def test_index_alias():
+    point = Point(1, 2)
+    assert point.horizontal == point.x == 1
+    assert point.last == 2
+    assert point.first == 1
+    assert Pair((3, 4)).right == 4
+
+
+def test_key_alias():
+    assert Record(id=5).ident == 5
+    with pytest.raises(AttributeError) as exc_info:
+        Record().ident
+    assert isinstance(exc_info.value.__cause__, KeyError)
+
+
+def test_missing_item_is_missing_attribute():
+    assert not hasattr(Record(), "ident")
+    assert getattr(Record(), "ident", None) is None
+    assert getattr(Pair(()), "right", "default") == "default"
+
+
+def test_item_alias_read_only():
+    point = Point(1, 2)
+    with pytest.raises(NotImplementedError):
+        point.horizontal = 3
+
+
+def test_item_alias_attach():
+    class Triple(tuple):
+        pass
+
+    alias(index=2).attach(Triple, "third")
+    assert Triple((1, 2, 3)).third == 3
+    assert alias_index(Triple) == {"third": "[2]"}
+
+
+def test_item_alias_gather():
+    pairs = [Pair((i, -i)) for i in range(3)]
+    assert gather(pairs, "right") == [0, -1, -2]
+    assert gather(pairs, "left", "right") == [(0, 0), (1, -1), (2, -2)]
+    assert gather(pairs, "left", "right", columns=True) == [
+        [0, 1, 2],
+        [0, -1, -2],
+    ]
+    assert vars(Pair)["left"].gather(pairs) == [0, 1, 2]
+    records = [Record(id=i) for i in range(3)]
+    assert gather(records, "ident") == [0, 1, 2]
+
+
+def test_item_alias_signature():
+    signature = vars(Record)["ident"]._signature()
+    rebuilt = item_alias._from_signature(pickle.loads(pickle.dumps(signature)))
+    assert isinstance(rebuilt, item_alias)
+    assert rebuilt._for == "['id']"
+
+
+def test_item_alias_freeze():
+    class Frozen(tuple):
+        first = alias(index=0)
+        last = alias(index=-1)
+        renamed = alias("first")
+
+    freeze(Frozen)
+    frozen = Frozen((1, 2))
+    assert frozen.first == frozen.renamed == 1
+    assert frozen.last == 2
+    assert not isinstance(vars(Frozen)["first"], item_alias)
+    assert alias_index(Frozen) == {
+        "first": "[0]",
+        "last": "[-1]",
+        "renamed": "first",
+    }
+
+
+def test_field_alias_freeze():
+    class Frozen(NamedTuple):
+        x: int
+        renamed = alias("x")
+
+    freeze(Frozen)
+    assert vars(Frozen)["renamed"] is vars(Frozen)["x"]
+    assert Frozen(1).renamed == 1
@@ -0,0 +1,222 @@
+import warnings
+
+import pytest
+
+from aliasing import alias, valiases, TrampleAliasError, TrampleAliasWarning
+from aliasing.lazy_alias import add_lazy
+
+TABLE_KEY = "_aliasing_lazy_table"
+
+
+def _lazy_tester():
+    class LazyAliasTester:
+        @valiases("MyFunc", "myFunc", "MY_FUNC", lazy=True)
+        def my_func(self):
+            return "foo"
+
+    return LazyAliasTester
+
+
+def _plain_tester():
+    class LazyAliasTester:
+        @valiases()
+        def my_func(self):
+            return "foo"
+
+    return LazyAliasTester
+
+
+def test_lazy_aliases_resolve():
+    tester = _lazy_tester()()
+    assert tester.MyFunc() == tester.my_func()
+    assert tester.myFunc() == tester.my_func()
+    assert tester.MY_FUNC() == tester.my_func()
+
+
+def test_lazy_aliases_not_in_class_dict():
+    tester_cls = _lazy_tester()
+    assert "MyFunc" not in vars(tester_cls)
+    assert vars(tester_cls)[TABLE_KEY] == {
+        "MyFunc": "my_func",
+        "myFunc": "my_func",
+        "MY_FUNC": "my_func",
+    }
+
+
+def test_lazy_alias_materialized_on_first_hit():
+    tester_cls = _lazy_tester()
+    tester = tester_cls()
+    tester.myFunc()
+    assert isinstance(vars(tester_cls)["myFunc"], alias)
+    assert "myFunc" not in vars(tester_cls)[TABLE_KEY]
+    assert "MyFunc" not in vars(tester_cls)
+
+
+def test_lazy_aliases_dir():
+    tester = _lazy_tester()()
+    filtered_dir = set(filter(lambda x: x.lower() == "myfunc", dir(tester)))
+    assert filtered_dir == {"MyFunc", "myFunc"}
+    tester.myFunc()
+    assert "myFunc" in dir(tester) and "MyFunc" in dir(tester)
+
+
+def test_lazy_aliases_class_level():
+    tester_cls = _lazy_tester()
+    # the class has no hook of its own, only instances reach the table
+    with pytest.raises(AttributeError):
+        tester_cls.MyFunc
+    tester_cls().MyFunc()
+    assert tester_cls.MyFunc is tester_cls.my_func
+
+
+def test_lazy_aliases_single_hook():
+    tester_cls = _lazy_tester()
+    added = set(vars(tester_cls)) - set(vars(_plain_tester()))
+    assert added == {TABLE_KEY, "__getattr__", "__dir__", "__init_subclass__"}
+
+
+def test_lazy_aliases_subclass_getattr():
+    class Child(_lazy_tester()):
+        def __getattr__(self, name):
+            return "fallback"
+
+    child = Child()
+    assert child.MyFunc() == "foo"
+    assert child.anything == "fallback"
+
+
+def test_lazy_alias_trample_on_attach():
+    tester_cls = _lazy_tester()
+    with pytest.raises(TrampleAliasError):
+        alias("my_func").attach(tester_cls, "MyFunc")
+    assert "MyFunc" not in vars(tester_cls)
+
+
+def test_lazy_aliases_doc():
+    tester = _lazy_tester()()
+    assert tester.my_func.__doc__ == "(aliases MyFunc,myFunc,MY_FUNC)"
+
+
+def test_lazy_aliases_inherited():
+    class Child(_lazy_tester()):
+        @valiases("other_name", lazy=True)
+        def other(self):
+            return "bar"
+
+    child = Child()
+    assert child.MY_FUNC() == "foo"
+    assert child.other_name() == "bar"
+
+
+def test_lazy_aliases_missing_attribute():
+    tester = _lazy_tester()()
+    with pytest.raises(AttributeError):
+        tester.not_an_alias
+
+
+def test_lazy_aliases_existing_getattr():
+    class LazyAliasTester:
+        def __getattr__(self, name):
+            return f"dynamic {name}"
+
+        @valiases("MyFunc", lazy=True)
+        def my_func(self):
+            return "foo"
+
+    tester = LazyAliasTester()
+    assert tester.MyFunc() == "foo"
+    assert tester.anything == "dynamic anything"
+
+
+def test_lazy_alias_trample_err():
+    with pytest.raises((RuntimeError, TrampleAliasError)) as exc_info:
+
+        class ErrorTest:
+            @valiases("method2", lazy=True)
+            def method1(self): ...
+
+            def method2(self): ...
+
+    trample_error = exc_info.value
+    if isinstance(trample_error, RuntimeError):
+        trample_error = exc_info.value.__cause__
+
+    assert isinstance(trample_error, TrampleAliasError)
+    assert "trample_ok=['method2']" in trample_error.args[0]
+
+
+def test_lazy_alias_trample_warning():
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+
+        class WarningTest:
+            @valiases("method2", trample_ok=["method2"], lazy=True)
+            def method1(self): ...
+
+            def method2(self): ...
+
+        assert len(w) == 1
+        assert issubclass(w[-1].category, TrampleAliasWarning)
+
+
+def test_lazy_alias_over_inherited_member_bound_now():
+    class Base:
+        def MyFunc(self):
+            return "base"
+
+    class Child(Base):
+        def my_func(self):
+            return "foo"
+
+    add_lazy(Child, {"MyFunc": "my_func"})
+    assert isinstance(vars(Child)["MyFunc"], alias)
+    assert Child().MyFunc() == "foo"
+
+
+def test_attach_to_base_binds_lazy_alias_of_subclass():
+    class Base:
+        def base_func(self):
+            return "base"
+
+    class Child(Base):
+        @valiases("MyFunc", lazy=True)
+        def my_func(self):
+            return "foo"
+
+    # the base's alias would hide the subclass's lazy one from the hook
+    alias("base_func").attach(Base, "MyFunc")
+    assert isinstance(vars(Child)["MyFunc"], alias)
+    assert Child().MyFunc() == "foo"
+    assert Base().MyFunc() == "base"
+
+
+def test_lazy_alias_keeps_errors_of_members():
+    class Tester:
+        @valiases("MyFunc", lazy=True)
+        def my_func(self):
+            return "foo"
+
+        @property
+        def broken(self):
+            raise AttributeError("broken inside")
+
+    with pytest.raises(AttributeError, match="broken inside"):
+        Tester().broken
+
+
+def test_lazy_aliases_keep_init_subclass():
+    class Tester:
+        def __init_subclass__(cls, tag="", **kwargs):
+            super().__init_subclass__(**kwargs)
+            cls.tag = tag
+
+        @valiases("MyFunc", lazy=True)
+        def my_func(self):
+            return "foo"
+
+    class Child(Tester, tag="child"):
+        def __getattr__(self, name):
+            return "fallback"
+
+    assert Child.tag == "child"
+    assert Child().MyFunc() == "foo"
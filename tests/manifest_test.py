@@ -0,0 +1,182 @@
+import json
+import sys
+import textwrap
+
+import pytest
+
+from aliasing import (
+    CircularAliasError,
+    TrampleAliasError,
+    alias_index,
+    apply_manifest,
+    resolve_prefix,
+    set_api_version,
+)
+from aliasing.manifest import compile_manifest, default_cache_path
+
+MODULE = """
+class Client:
+    def __init__(self):
+        self.prop = "prop"
+
+    def fetch(self):
+        return "fetch"
+
+    def existing(self):
+        return "existing"
+
+
+def helper():
+    return "helper"
+"""
+
+
+@pytest.fixture
+def module(tmp_path, monkeypatch):
+    # a fresh module per test, so aliases applied by one don't leak
+    name = f"manifest_module_{len(sys.modules)}"
+    (tmp_path / f"{name}.py").write_text(MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    sys.modules.pop(name, None)
+    set_api_version(None)
+
+
+def _manifest(module):
+    return {
+        "classes": {
+            f"{module}:Client": {
+                "get": "fetch",
+                "get_again": "get",
+                "old_get": {"for": "fetch", "until": "2"},
+                "value": "prop",
+            }
+        },
+        "modules": {module: {"old_helper": "helper"}},
+    }
+
+
+def _write(tmp_path, module, name="aliases.json", manifest=None):
+    path = tmp_path / name
+    path.write_text(json.dumps(manifest or _manifest(module)))
+    return str(path)
+
+
+def test_apply_json(tmp_path, module):
+    assert apply_manifest(_write(tmp_path, module)) == 5
+    imported = __import__(module)
+    client = imported.Client()
+    assert client.get() == client.get_again() == client.old_get() == "fetch"
+    assert client.value == "prop"
+    assert imported.old_helper() == "helper"
+    assert alias_index(imported.Client)["get_again"] == "get"
+
+
+def test_apply_after_prefix_trie(tmp_path, module):
+    imported = __import__(module)
+    with pytest.raises(AttributeError):
+        resolve_prefix(imported.Client, "get")
+    apply_manifest(_write(tmp_path, module), cache_path=None)
+    assert resolve_prefix(imported.Client, "get_") == "fetch"
+
+
+def test_apply_toml(tmp_path, module):
+    pytest.importorskip("tomllib")
+    path = tmp_path / "aliases.toml"
+    path.write_text(
+        textwrap.dedent(
+            f"""
+            [classes."{module}:Client"]
+            get = "fetch"
+            old_get = {{ for = "fetch", until = "2" }}
+            """
+        )
+    )
+    assert apply_manifest(str(path), cache_path=None) == 2
+    assert __import__(module).Client().old_get() == "fetch"
+
+
+def test_apply_twice(tmp_path, module):
+    path = _write(tmp_path, module)
+    apply_manifest(path)
+    assert apply_manifest(path) == 0
+
+
+def test_versions(tmp_path, module):
+    set_api_version("2")
+    apply_manifest(_write(tmp_path, module), cache_path=None)
+    assert "old_get" not in alias_index(__import__(module).Client)
+
+
+def test_cache_written_and_used(tmp_path, module, monkeypatch):
+    path = _write(tmp_path, module)
+    apply_manifest(path)
+    cache_path = default_cache_path(path)
+    with open(cache_path, "rb") as file:
+        assert file.read()
+
+    sys.modules.pop(module)
+
+    def fail(manifest):
+        raise AssertionError("validated again")
+
+    monkeypatch.setattr("aliasing.manifest.compile_manifest", fail)
+    assert apply_manifest(path) == 5
+    assert __import__(module).Client().get() == "fetch"
+
+
+def test_cache_invalidated(tmp_path, module):
+    path = _write(tmp_path, module)
+    apply_manifest(path)
+    sys.modules.pop(module)
+    # a changed manifest has another hash
+    manifest = _manifest(module)
+    manifest["classes"][f"{module}:Client"]["existing"] = "fetch"
+    _write(tmp_path, module, manifest=manifest)
+    with pytest.raises(TrampleAliasError):
+        apply_manifest(path)
+
+
+def test_cache_invalidated_by_source(tmp_path, module):
+    path = _write(tmp_path, module)
+    apply_manifest(path)
+    sys.modules.pop(module)
+    # a changed module must be validated again
+    source = tmp_path / f"{module}.py"
+    source.write_text(
+        MODULE.replace("    def existing", "    def get(self): ...\n\n    def existing")
+    )
+    with pytest.raises(TrampleAliasError):
+        apply_manifest(path)
+
+
+def test_trample(module):
+    manifest = {"classes": {f"{module}:Client": {"existing": "fetch"}}}
+    with pytest.raises(TrampleAliasError):
+        compile_manifest(manifest)
+    manifest = {
+        "classes": {
+            f"{module}:Client": {
+                "existing": {"for": "fetch", "trample_ok": True}
+            }
+        }
+    }
+    with pytest.warns(UserWarning):
+        compile_manifest(manifest)
+
+
+def test_cycles(module):
+    manifest = {"classes": {f"{module}:Client": {"a": "b", "b": "a"}}}
+    with pytest.raises(CircularAliasError):
+        compile_manifest(manifest)
+    manifest = {"modules": {module: {"a": "b", "b": "a"}}}
+    with pytest.raises(CircularAliasError):
+        compile_manifest(manifest)
+
+
+def test_invalid(tmp_path, module):
+    with pytest.raises(ValueError):
+        compile_manifest({"classes": {f"{module}:Client": {"a": {}}}})
+    path = _write(tmp_path, module, manifest={"other": {}})
+    with pytest.raises(ValueError):
+        apply_manifest(path)
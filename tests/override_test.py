@@ -0,0 +1,146 @@
+import asyncio
+import threading
+
+import pytest
+
+from aliasing import (
+    alias,
+    aliased,
+    override_aliases,
+    valiases,
+    CircularAliasError,
+)
+
+
+class Versioned:
+    name = alias("v1_name")
+    cached = alias("v1_name", cache=True)
+
+    def __init__(self):
+        self.v1_name = "v1"
+        self.v2_name = "v2"
+
+    @aliased
+    def method(self):
+        return "v1 method"
+
+    method_alias = method.alias()
+
+    def v2_method(self):
+        return "v2 method"
+
+    @valiases("virtual")
+    def v1_virtual(self):
+        return "v1 virtual"
+
+    def v2_virtual(self):
+        return "v2 virtual"
+
+
+def test_override():
+    versioned = Versioned()
+    assert versioned.name == "v1"
+    with override_aliases(name="v2_name"):
+        assert versioned.name == "v2"
+    assert versioned.name == "v1"
+
+
+def test_override_mapping():
+    versioned = Versioned()
+    with override_aliases({"method_alias": "v2_method", "virtual": "v2_virtual"}):
+        assert versioned.method_alias() == "v2 method"
+        assert versioned.virtual() == "v2 virtual"
+        assert versioned.method() == "v1 method"
+
+
+def test_override_nested():
+    versioned = Versioned()
+    with override_aliases(name="v2_name"):
+        with override_aliases(method_alias="v2_method"):
+            assert versioned.name == "v2"
+            assert versioned.method_alias() == "v2 method"
+        assert versioned.method_alias() == "v1 method"
+
+
+def test_override_cached_alias_not_snapshotted():
+    versioned = Versioned()
+    with override_aliases(cached="v2_name"):
+        assert versioned.cached == "v2"
+    assert "cached" not in vars(versioned)
+    assert versioned.cached == "v1"
+
+
+def test_override_shared_alias_by_owner_name():
+    shared = alias("v1_name", cache=True)
+    first = type("First", (Versioned,), {})
+    second = type("Second", (Versioned,), {})
+    shared.attach(first, "a")
+    shared.attach(second, "b")
+    with override_aliases(b="v2_name"):
+        assert first().a == "v1"
+        assert second().b == "v2"
+    with override_aliases(a="v2_name"):
+        assert first().a == "v2"
+        assert second().b == "v1"
+
+
+def test_override_circular():
+    class CircularTester:
+        first = alias("value")
+        second = alias("first")
+        value = "value"
+
+    tester = CircularTester()
+    with override_aliases(first="second"):
+        with pytest.raises(CircularAliasError):
+            tester.second
+
+
+def test_override_threads():
+    versioned = Versioned()
+    seen = {}
+    barrier = threading.Barrier(2)
+
+    def read(version):
+        with override_aliases(name=f"{version}_name"):
+            barrier.wait()
+            seen[version] = versioned.name
+
+    threads = [
+        threading.Thread(target=read, args=(version,))
+        for version in ("v1", "v2")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert seen == {"v1": "v1", "v2": "v2"}
+
+
+def test_override_asyncio_tasks():
+    versioned = Versioned()
+
+    async def read(version):
+        with override_aliases(name=f"{version}_name"):
+            await asyncio.sleep(0)
+            first = versioned.name
+            await asyncio.sleep(0)
+            return first, versioned.name
+
+    async def main():
+        return await asyncio.gather(read("v1"), read("v2"))
+
+    assert asyncio.run(main()) == [("v1", "v1"), ("v2", "v2")]
+
+
+def test_override_inherited_by_tasks():
+    versioned = Versioned()
+
+    async def read():
+        return versioned.name
+
+    async def main():
+        with override_aliases(name="v2_name"):
+            return await asyncio.create_task(read())
+
+    assert asyncio.run(main()) == "v2"
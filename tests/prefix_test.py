@@ -0,0 +1,136 @@
+import pytest
+
+from aliasing import (
+    abbreviations,
+    alias,
+    conventions,
+    resolve_prefix,
+    valiases,
+    AmbiguousAliasError,
+    CircularAliasError,
+)
+from aliasing.prefix import PrefixTrie, prefix_trie
+
+
+def _commands_tester():
+    @abbreviations
+    class CommandsTester:
+        @valiases("cfg", "conf")
+        def config(self): ...
+
+        def clean(self): ...
+
+        def status(self): ...
+
+        stat = alias("status")
+
+        def stash(self): ...
+
+    return CommandsTester
+
+
+def test_prefix_trie():
+    trie = PrefixTrie()
+    trie.add("config", "config")
+    trie.add("cfg", "config")
+    trie.add("clean", "clean")
+    assert len(trie) == 3
+    assert trie.resolve("co") == "config"
+    assert trie.resolve("cf") == "config"
+    assert trie.resolve("cl") == "clean"
+    assert trie.candidates("c") == ["clean", "config"]
+    with pytest.raises(KeyError):
+        trie.resolve("x")
+
+
+def test_resolve_unique_prefix():
+    commands = _commands_tester()
+    assert resolve_prefix(commands, "conf") == "config"
+    assert resolve_prefix(commands, "confi") == "config"
+    assert resolve_prefix(commands, "cf") == "config"
+    assert resolve_prefix(commands, "cle") == "clean"
+    assert resolve_prefix(commands(), "stas") == "stash"
+
+
+def test_resolve_exact_name_wins():
+    commands = _commands_tester()
+    assert resolve_prefix(commands, "stat") == "status"
+
+
+def test_resolve_aliases_of_one_member_not_ambiguous():
+    commands = _commands_tester()
+    # config, conf and cfg all lead to config
+    assert resolve_prefix(commands, "co") == "config"
+
+
+def test_resolve_ambiguous():
+    commands = _commands_tester()
+    with pytest.raises(AmbiguousAliasError) as exc_info:
+        resolve_prefix(commands, "sta")
+
+    assert exc_info.value.candidates == ["stash", "status"]
+    assert exc_info.value.args[0] == (
+        "Abbreviation sta is ambiguous, it could refer to any of stash, status"
+    )
+
+
+def test_resolve_missing():
+    commands = _commands_tester()
+    with pytest.raises(AttributeError):
+        resolve_prefix(commands, "deploy")
+
+
+def test_resolve_inherited_and_lazy():
+    class Child(_commands_tester()):
+        @valiases("Deploy", lazy=True)
+        def deploy(self): ...
+
+    assert resolve_prefix(Child, "De") == "deploy"
+    assert resolve_prefix(Child, "cf") == "config"
+
+
+def test_resolve_aliases_added_later():
+    commands = _commands_tester()
+    with pytest.raises(AttributeError):
+        resolve_prefix(commands, "pu")
+    alias("clean").attach(commands, "purge")
+    assert resolve_prefix(commands, "pu") == "clean"
+    conventions("pascal")(commands)
+    assert resolve_prefix(commands, "Cl") == "clean"
+
+
+def test_trie_kept_when_other_classes_change():
+    commands = _commands_tester()
+    trie = prefix_trie(commands)
+    alias("clean").attach(_commands_tester(), "purge")
+    assert prefix_trie(commands) is trie
+
+    class Child(commands):
+        pass
+
+    alias("clean").attach(Child, "purge")
+    assert prefix_trie(commands) is trie
+    child_trie = prefix_trie(Child)
+    alias("status").attach(commands, "st")
+    assert prefix_trie(commands) is not trie
+    assert prefix_trie(Child) is not child_trie
+    assert resolve_prefix(Child, "st") == "status"
+
+
+def test_resolve_chain():
+    class ChainTester:
+        def config(self): ...
+
+        cfg = alias("config")
+        c_f_g = alias("cfg")
+
+    assert resolve_prefix(ChainTester, "c_") == "config"
+
+
+def test_abbreviations_circular():
+    with pytest.raises(CircularAliasError):
+
+        @abbreviations
+        class CircularTester:
+            first = alias("second")
+            second = alias("first")
@@ -0,0 +1,161 @@
+import json
+import sys
+from typing import NamedTuple
+
+import pytest
+
+from aliasing import alias, aliased, format_profile, freeze, profile
+from aliasing.lazy_alias import add_lazy, lazy_table
+
+
+def _make_class():
+    class Profiled:
+        name_alias = alias("name")
+        name_of_alias = alias("name_alias")
+        missing = alias("nowhere")
+        cached = alias("name", cache=True)
+
+        def __init__(self):
+            self.name = "name"
+
+        @aliased
+        def method(self):
+            return "method"
+
+        other = method.alias("other")
+
+        @aliased(cache=True)
+        def memo(self):
+            return "memo"
+
+        @property
+        def prop(self):
+            raise AssertionError("profile must not run properties")
+
+        prop_alias = alias("prop")
+
+    add_lazy(Profiled, {"lazy": "name"})
+    return Profiled
+
+
+def _rows(report):
+    return {row["alias"]: row for row in report["aliases"]}
+
+
+def test_times_aliases_against_their_target():
+    cls = _make_class()
+    # enough reads that noise can't hide the descriptor's cost
+    rows = _rows(profile(cls, cls(), number=2000, repeat=3))
+    row = rows["name_alias"]
+    assert row["target"] == "name"
+    assert row["kind"] == "alias"
+    assert row["alias_ns"] > row["direct_ns"]
+    # each of the three is rounded on its own
+    assert row["overhead_ns"] == pytest.approx(
+        row["alias_ns"] - row["direct_ns"], abs=0.2
+    )
+    assert row["action"] == "freeze"
+
+
+def test_sorted_by_overhead():
+    cls = _make_class()
+    rows = profile(cls, cls(), number=20, repeat=1)["aliases"]
+    timed = [row["overhead_ns"] for row in rows if row["overhead_ns"]]
+    assert timed == sorted(timed, reverse=True)
+    assert all(row["overhead_ns"] is None for row in rows[len(timed) :])
+
+
+def test_flags():
+    cls = _make_class()
+    obj = cls()
+    alias("name", "attached").attach(obj)
+    rows = _rows(profile(cls, obj, number=20, repeat=1))
+    assert rows["name_of_alias"]["flags"] == ["chain"]
+    assert rows["name_of_alias"]["chain"] == 2
+    assert rows["other"]["flags"] == ["aliased wrapper"]
+    assert rows["method"]["kind"] == "aliased"
+    assert rows["attached"]["flags"] == ["attached per instance"]
+
+
+def test_recommendations():
+    cls = _make_class()
+    rows = _rows(profile(cls, cls(), number=20, repeat=1))
+    assert rows["missing"]["action"] == "remove"
+    assert rows["missing"]["kind"] == "missing"
+    assert rows["prop_alias"]["action"] == "cache"
+    assert rows["prop_alias"]["alias_ns"] is None
+    for name in ("cached", "memo", "lazy"):
+        assert rows[name]["action"] == "keep", name
+
+
+def test_has_no_side_effects():
+    class Through(_make_class()):
+        # reads through members that store something on the instance
+        memo_alias = alias("memo")
+        memo_chain = alias("memo_alias")
+        cached_chain = alias("cached")
+
+    obj = Through()
+    before = dict(vars(obj))
+    profile(Through, obj, number=20, repeat=1)
+    assert vars(obj) == before == {"name": "name"}
+    assert "lazy" not in vars(Through)
+    assert "lazy" in lazy_table(Through.__base__)
+
+
+def test_class_level_without_instance():
+    cls = _make_class()
+    rows = _rows(profile(cls, number=20, repeat=1))
+    assert rows["name_alias"]["overhead_ns"] is None
+    assert "instance" in rows["name_alias"]["reason"]
+    assert rows["missing"]["action"] == "keep"
+    assert rows["other"]["overhead_ns"] is not None
+
+
+def test_frozen_aliases_are_kept():
+    cls = freeze(_make_class())
+    rows = _rows(profile(cls, cls(), number=20, repeat=1))
+    assert rows["name_alias"]["kind"] == "frozen"
+    assert rows["name_alias"]["action"] == "keep"
+    assert rows["name_of_alias"]["flags"] == []
+
+
+def test_item_aliases():
+    class Point(NamedTuple):
+        x: int
+        horizontal = alias(index=0)
+
+    row = _rows(profile(Point, Point(1), number=20, repeat=1))["horizontal"]
+    assert row["target"] == "[0]"
+    assert row["kind"] == "item"
+    assert row["direct_ns"] is not None
+
+
+def test_module():
+    module = sys.modules[__name__]
+    _Module.cls = _make_class()
+    report = profile(module, number=20, repeat=1)
+    owners = {row["owner"] for row in report["aliases"]}
+    assert owners == {f"{__name__}._Module"}
+
+
+class _Module:
+    renamed = alias("cls")
+
+
+def test_report_formats():
+    cls = _make_class()
+    report = profile(cls, cls(), number=20, repeat=1)
+    assert json.loads(json.dumps(report)) == report
+    table = format_profile(report)
+    assert table.splitlines()[0].split() == [
+        "alias",
+        "target",
+        "kind",
+        "alias",
+        "direct",
+        "over",
+        "action",
+    ]
+    assert "Profiled.missing" in table
+    assert table.endswith("best of 1 x 20")
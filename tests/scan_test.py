@@ -0,0 +1,146 @@
+import json
+
+from aliasing.scan import Declaration, main, scan, scan_source
+
+DECLARATIONS = '''
+from aliasing import alias, aliased, valiases
+
+
+class Example:
+    my_alias = alias("prop")
+    named = alias("prop", alias_name="other_name")
+
+    @aliased
+    def method(self): ...
+
+    method_alias1 = method.alias()
+
+    @method.alias
+    def method_alias2(self): ...
+
+    @valiases("method3", "method4")
+    def method_v(self): ...
+
+
+prop_alias = alias(alias_for="prop", alias_name="attached_alias")
+prop_alias.attach(Example)
+'''
+
+USAGES = '''
+from example import Example
+
+example = Example()
+example.my_alias
+example.method_alias2()
+getattr(example, "method3")()
+'''
+
+
+def _write_tree(tmp_path):
+    (tmp_path / "example.py").write_text(DECLARATIONS)
+    (tmp_path / "usage.py").write_text(USAGES)
+    (tmp_path / "broken.py").write_text("def broken(:\n")
+
+
+def test_scan_source_declarations():
+    declarations, accesses = scan_source(DECLARATIONS)
+    names = {(d.owner, d.name, d.target) for d in declarations}
+    assert names == {
+        ("Example", "my_alias", "prop"),
+        ("Example", "other_name", "prop"),
+        ("Example", "method_alias1", "method"),
+        ("Example", "method_alias2", "method"),
+        ("Example", "method3", "method_v"),
+        ("Example", "method4", "method_v"),
+        ("Example", "attached_alias", "prop"),
+    }
+    assert all(isinstance(d, Declaration) for d in declarations)
+    assert accesses["attach"] == 1
+
+
+def test_scan_used_and_unused(tmp_path):
+    _write_tree(tmp_path)
+    report = scan([str(tmp_path)], jobs=1, cache_path=None)
+    aliases = report["classes"][f"{tmp_path / 'example.py'}:Example"]
+    assert aliases["used"] == {
+        "my_alias": 1,
+        "method_alias2": 1,
+        "method3": 1,
+    }
+    assert sorted(aliases["unused"]) == [
+        "attached_alias",
+        "method4",
+        "method_alias1",
+        "other_name",
+    ]
+    assert report["errors"] == [str(tmp_path / "broken.py")]
+
+
+def test_scan_process_pool(tmp_path):
+    _write_tree(tmp_path)
+    pooled = scan([str(tmp_path)], jobs=2, cache_path=None)
+    inline = scan([str(tmp_path)], jobs=1, cache_path=None)
+    assert pooled == inline
+
+
+def test_scan_cache(tmp_path):
+    _write_tree(tmp_path)
+    cache_path = str(tmp_path / "cache.json")
+    cold = scan([str(tmp_path)], jobs=1, cache_path=cache_path)
+    warm = scan([str(tmp_path)], jobs=1, cache_path=cache_path)
+    assert cold["parsed"] == 3
+    # the broken file isn't cached, so it is parsed every time
+    assert warm["parsed"] == 1
+    assert warm["classes"] == cold["classes"]
+
+    (tmp_path / "usage.py").write_text(USAGES + "example.method4()\n")
+    changed = scan([str(tmp_path)], jobs=1, cache_path=cache_path)
+    assert changed["parsed"] == 2
+    aliases = changed["classes"][f"{tmp_path / 'example.py'}:Example"]
+    assert "method4" in aliases["used"]
+
+
+def test_scan_cache_shared(tmp_path):
+    _write_tree(tmp_path)
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "more.py").write_text("class More:\n    m = alias('n')\n")
+    cache_path = str(tmp_path / "cache.json")
+    scan([str(tmp_path / "example.py")], jobs=1, cache_path=cache_path)
+    scan([str(other)], jobs=1, cache_path=cache_path)
+    # the first run's results survive the second
+    warm = scan([str(tmp_path / "example.py")], jobs=1, cache_path=cache_path)
+    assert warm["parsed"] == 0
+
+    (other / "more.py").unlink()
+    (tmp_path / "example.py").write_text(DECLARATIONS + "\n")
+    scan([str(tmp_path / "example.py")], jobs=1, cache_path=cache_path)
+    with open(cache_path) as file:
+        cache = json.load(file)
+    # only the current example.py is left
+    assert len(cache["files"]) == 1
+    assert list(cache["paths"]) == [str(tmp_path / "example.py")]
+
+
+def test_scan_main(tmp_path, capsys):
+    _write_tree(tmp_path)
+    assert main([str(tmp_path), "--no-cache", "--jobs", "1", "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["files"] == 3
+
+    main([str(tmp_path), "--no-cache", "--jobs", "1", "--unused-only"])
+    out = capsys.readouterr().out
+    assert "unused  method4" in out
+    assert "my_alias" not in out
+
+
+def test_scan_source_item_aliases():
+    declarations, _ = scan_source(
+        "class Point(tuple):\n"
+        "    x = alias(index=0)\n"
+        "    ident = alias(key='id')\n"
+    )
+    assert [(d.name, d.target) for d in declarations] == [
+        ("x", "[0]"),
+        ("ident", "['id']"),
+    ]
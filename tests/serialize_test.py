@@ -0,0 +1,146 @@
+from typing import NamedTuple
+
+import pytest
+
+from aliasing import (
+    alias,
+    aliased,
+    override_aliases,
+    serialization_plan,
+    serialize,
+    serialize_many,
+    valiases,
+)
+
+
+class User:
+    name: str
+    _private: int = 0
+
+    user_id = alias("id")
+    display_name = alias("name")
+    shown = alias("display_name")
+
+    def __init__(self, user_id, name):
+        self.id = user_id
+        self.name = name
+
+    @aliased
+    @property
+    def upper(self):
+        return self.name.upper()
+
+    shout = upper.alias("shout")
+
+    @valiases("greet")
+    def hello(self):
+        return "hello"
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+    horizontal = alias(index=0)
+
+
+def test_canonical_view():
+    assert serialize(User(1, "bob")) == {"name": "bob", "upper": "BOB", "id": 1}
+
+
+def test_alias_view():
+    assert serialize(User(1, "bob"), "alias") == {
+        "display_name": "bob",
+        "shout": "BOB",
+        "user_id": 1,
+    }
+
+
+def test_all_view():
+    assert serialize(User(1, "bob"), "all") == {
+        "name": "bob",
+        "display_name": "bob",
+        "shown": "bob",
+        "upper": "BOB",
+        "shout": "BOB",
+        "id": 1,
+        "user_id": 1,
+    }
+
+
+def test_fields():
+    assert serialize(User(1, "bob"), "alias", fields=["id"]) == {"user_id": 1}
+    assert serialize(User(1, "bob"), fields=["name"]) == {"name": "bob"}
+
+
+def test_items():
+    assert serialize(Point(1, 2), "all") == {"x": 1, "y": 2, "horizontal": 1}
+
+
+def test_plan_cached():
+    plan = serialization_plan(User, "alias")
+    assert serialization_plan(User, "alias") is plan
+    assert serialization_plan(User) is not plan
+    assert plan.keys == ("display_name", "shout", "user_id")
+
+
+def test_plan_built_inside_override():
+    class Renamed:
+        def __init__(self):
+            self.name, self.nickname = "robert", "bob"
+
+        shown = alias("name")
+
+    with override_aliases(shown="nickname"):
+        assert serialize(Renamed(), "alias", fields=["name"]) == {
+            "shown": "bob"
+        }
+    assert serialize(Renamed(), "alias", fields=["name"]) == {
+        "shown": "robert"
+    }
+    with override_aliases(shown="nickname"):
+        assert serialize(Renamed(), "alias", fields=["name"]) == {
+            "shown": "bob"
+        }
+
+
+def test_plan_rebuilt_after_attach():
+    class Late:
+        def __init__(self):
+            self.name = "bob"
+
+    plan = serialization_plan(Late, "alias", fields=["name"])
+    assert plan.keys == ("name",)
+    alias("name", "shown").attach(Late)
+    assert serialize(Late(), "alias", fields=["name"]) == {"shown": "bob"}
+
+
+def test_plan_kept_when_other_classes_change():
+    class Kept:
+        def __init__(self):
+            self.name = "bob"
+
+    class Other:
+        name = "alice"
+
+    plan = serialization_plan(Kept, "alias", fields=["name"])
+    alias("name", "shown").attach(Other)
+    assert serialization_plan(Kept, "alias", fields=["name"]) is plan
+
+
+def test_serialize_many():
+    users = [User(i, str(i)) for i in range(3)]
+    assert serialize_many(users, "alias") == [
+        {"display_name": str(i), "shout": str(i), "user_id": i}
+        for i in range(3)
+    ]
+    mixed = serialize_many(iter([User(1, "a"), Point(1, 2)]))
+    assert mixed == [
+        {"name": "a", "upper": "A", "id": 1},
+        {"x": 1, "y": 2, "horizontal": 1},
+    ]
+
+
+def test_unknown_view():
+    with pytest.raises(ValueError):
+        serialization_plan(User, "other")
@@ -0,0 +1,146 @@
+import warnings
+
+import pytest
+
+from aliasing import (
+    CircularAliasError,
+    TrampleAliasError,
+    alias,
+    aliased,
+    is_trusted,
+    set_trusted,
+    valiases,
+)
+from aliasing.trust import ENV_VAR
+
+
+@pytest.fixture(autouse=True)
+def trusted(monkeypatch):
+    monkeypatch.delenv(ENV_VAR, raising=False)
+    set_trusted(True)
+    yield
+    set_trusted(None)
+
+
+class Owner:
+    def __init__(self):
+        self.prop = "prop"
+
+    def existing(self):
+        return "existing"
+
+
+def test_environment_variable(monkeypatch):
+    monkeypatch.setenv(ENV_VAR, "1")
+    set_trusted(None)
+    assert is_trusted()
+    monkeypatch.setenv(ENV_VAR, "0")
+    set_trusted(None)
+    assert not is_trusted()
+    set_trusted(True)
+    assert is_trusted()
+
+
+def test_attach_skips_trample_check():
+    class Trampled(Owner):
+        pass
+
+    alias("prop", "existing").attach(Trampled)
+    assert Trampled().existing == "prop"
+
+    set_trusted(False)
+    with pytest.raises(TrampleAliasError):
+        alias("prop", "existing").attach(Owner)
+
+
+def test_attach_to_instance():
+    obj = Owner()
+    alias("prop", "other").attach(obj)
+    assert obj.other == "prop"
+    assert isinstance(obj, Owner)
+
+
+def test_valiases_keep_members_trampled_on_purpose():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+
+        class Kept(Owner):
+            @valiases("existing", "fresh", trample_ok=["existing"])
+            def method(self):
+                return "method"
+
+    obj = Kept()
+    assert obj.existing() == "existing"
+    assert obj.fresh() == "method"
+
+
+def test_valiases_keep_circular_aliases_unread():
+    class Circular(Owner):
+        first = alias("second")
+        second = alias("first")
+
+        @valiases("first", trample_ok=["first"])
+        def method(self):
+            return "method"
+
+    assert isinstance(vars(Circular)["first"], alias)
+
+
+def test_lazy_valiases():
+    class Lazy(Owner):
+        @valiases("later", lazy=True)
+        def method(self):
+            return "method"
+
+    assert Lazy().later() == "method"
+
+
+def test_docstrings_skipped():
+    class Documented:
+        @aliased
+        def method(self):
+            """does things"""
+
+        other = method.alias("other")
+
+    assert Documented.__dict__["method"].__doc__ == "does things"
+    assert Documented().other.__doc__ == "does things"
+
+
+def test_reads():
+    class Chained(Owner):
+        first = alias("prop")
+        second = alias("first")
+        missing = alias("nowhere")
+
+    obj = Chained()
+    assert obj.second == "prop"
+    assert Chained.missing is Chained.__dict__["missing"]
+    with pytest.raises(AttributeError):
+        obj.missing
+
+
+def test_cycles_raise_for_the_alias_read():
+    class Circular:
+        first = alias("second")
+        second = alias("third")
+        third = alias("first")
+
+    for name in ("first", "second", "third"):
+        with pytest.raises(CircularAliasError) as exc_info:
+            getattr(Circular(), name)
+        assert exc_info.value.args[0] == (
+            f"Nested alias {name} references a circular alias"
+        )
+
+
+def test_errors_of_targets_pass_through():
+    class Failing:
+        @property
+        def broken(self):
+            raise CircularAliasError("from the property")
+
+        broken_alias = alias("broken")
+
+    with pytest.raises(CircularAliasError, match="from the property"):
+        Failing().broken_alias
@@ -0,0 +1,82 @@
+import sys
+
+import pytest
+
+from aliasing import is_trusted, set_trusted
+from aliasing.validate import main, validate
+
+GOOD = """
+from aliasing import alias
+
+
+class Good:
+    other = alias("prop")
+"""
+
+CIRCULAR = """
+from aliasing import alias
+
+
+class Circular:
+    first = alias("second")
+    second = alias("first")
+"""
+
+TRAMPLED = """
+from aliasing import alias
+
+
+class Trampled:
+    def method(self):
+        pass
+
+
+alias("prop", "method").attach(Trampled)
+"""
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    name = f"validate_package_{len(sys.modules)}"
+    root = tmp_path / name
+    root.mkdir()
+    (root / "__init__.py").write_text("")
+    (root / "good.py").write_text(GOOD)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name, root
+    for module in list(sys.modules):
+        if module.startswith(name):
+            del sys.modules[module]
+    set_trusted(None)
+
+
+def test_valid(package):
+    name, _ = package
+    assert validate(name) == []
+    assert main([name]) == 0
+
+
+def test_circular(package):
+    name, root = package
+    (root / "circular.py").write_text(CIRCULAR)
+    assert validate(name) == [
+        f"{name}.circular.Circular: nested alias first references a"
+        " circular alias",
+        f"{name}.circular.Circular: nested alias second references a"
+        " circular alias",
+    ]
+    assert main([f"{name}.circular"]) == 1
+
+
+def test_trampled_even_when_trusted(package):
+    name, root = package
+    (root / "trampled.py").write_text(TRAMPLED)
+    set_trusted(True)
+    (problem,) = validate(name)
+    assert problem.startswith(f"{name}.trampled: TrampleAliasError:")
+    assert is_trusted()
+
+
+def test_missing_module():
+    (problem,) = validate("no_such_module_here")
+    assert problem.startswith("no_such_module_here: ModuleNotFoundError")
@@ -0,0 +1,124 @@
+import pytest
+
+from aliasing import (
+    alias,
+    alias_index,
+    aliased,
+    api_version,
+    set_api_version,
+    valiases,
+)
+from aliasing.versions import ENV_VAR, parse_version
+
+
+@pytest.fixture(autouse=True)
+def reset_version(monkeypatch):
+    monkeypatch.delenv(ENV_VAR, raising=False)
+    yield
+    set_api_version(None)
+
+
+def _make_class():
+    class Versioned:
+        def __init__(self):
+            self.prop = "prop"
+
+        old_prop = alias("prop", until="2.0")
+        new_prop = alias("prop", since="2.0")
+
+        @aliased
+        def method(self):
+            """does things"""
+            return "method"
+
+        legacy = method.alias("legacy", until=2)
+
+        @valiases("oldMethod", "OldMethod", until="2")
+        def virtual(self):
+            return "virtual"
+
+        @valiases("lazy_new", since="2.1", lazy=True)
+        def lazy_target(self):
+            return "lazy"
+
+    return Versioned
+
+
+def test_parse_version():
+    assert parse_version("1.2.0") == parse_version((1, 2)) == (1, 2)
+    assert parse_version(2) == (2,)
+    with pytest.raises(ValueError):
+        parse_version("v1")
+
+
+def test_no_version_installs_everything():
+    cls = _make_class()
+    assert api_version(cls) is None
+    assert set(alias_index(cls)) == {
+        "old_prop",
+        "new_prop",
+        "legacy",
+        "oldMethod",
+        "OldMethod",
+        "lazy_new",
+    }
+
+
+def test_old_version():
+    set_api_version("1.5")
+    cls = _make_class()
+    assert set(alias_index(cls)) == {
+        "old_prop",
+        "legacy",
+        "oldMethod",
+        "OldMethod",
+    }
+    instance = cls()
+    assert instance.old_prop == "prop"
+    assert instance.legacy() == "method"
+    assert instance.oldMethod() == "virtual"
+    assert not hasattr(instance, "new_prop")
+    assert cls().method.__doc__ == "(aliases legacy)\ndoes things"
+
+
+def test_new_version():
+    set_api_version("2.1")
+    cls = _make_class()
+    assert set(alias_index(cls)) == {"new_prop", "lazy_new"}
+    assert "oldMethod" not in vars(cls)
+    assert "oldMethod" not in dir(cls())
+    assert cls().lazy_new() == "lazy"
+    assert cls().method.__doc__ == "does things"
+
+
+def test_environment_variable(monkeypatch):
+    monkeypatch.setenv(ENV_VAR, "2.0")
+    assert api_version() == (2,)
+    assert set(alias_index(_make_class())) == {"new_prop"}
+    # the api wins over the environment
+    set_api_version("1")
+    assert "old_prop" in alias_index(_make_class())
+
+
+def test_class_version():
+    set_api_version("1")
+
+    class Pinned:
+        __alias_api_version__ = "3"
+        new_prop = alias("prop", since="2")
+
+    class Child(Pinned):
+        old_prop = alias("prop", until="2")
+
+    assert "new_prop" in vars(Pinned)
+    assert "old_prop" not in vars(Child)
+
+
+def test_attach():
+    class Attached:
+        pass
+
+    set_api_version("2")
+    alias("prop", until="2").attach(Attached, "old")
+    alias("prop", since="2").attach(Attached, "new")
+    assert alias_index(Attached) == {"new": "prop"}